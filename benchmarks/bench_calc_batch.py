@@ -0,0 +1,80 @@
+"""계산기 일괄 계산(calculator.py --batch)의 처리량을 초당 수식 수로 잽니다.
+
+시드를 고정한 무작위 수식 코퍼스(기본 100만 줄, 일부는 일부러 "오류"가 나는 수식)를 임시 파일로 만든 뒤,
+워커 수를 바꿔 가며 calculator.run_batch 로 스트리밍 계산합니다. 결과는 해시로만 모으므로 출력 크기와
+관계없이 메모리를 쓰지 않으며, 워커 수가 달라도 결과(순서 포함)가 같은지 확인합니다.
+"""
+import argparse
+import hashlib
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator import run_batch
+
+NUMBERS = ["0", "1", "2", "3", "7", "12", "42", "99", "365", "1024", "0.5", ".25", "3.14", "1e3", "2.5e-3"]
+OPERATORS = ["+", "-", "*", "/", "^", "//", "%"]
+
+
+def random_expression(rng, depth=0):
+    if depth > 2 or rng.random() < 0.35:
+        number = rng.choice(NUMBERS)
+        return "-" + number if rng.random() < 0.1 else number
+    if rng.random() < 0.15:
+        return "(" + random_expression(rng, depth + 1) + ")"
+    return random_expression(rng, depth + 1) + rng.choice(OPERATORS) + random_expression(rng, depth + 1)
+
+
+def write_corpus(path, lines, seed):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            if i % 500 == 0:
+                f.write(rng.choice(["9^9^9", "1/0", "2^", "((3)", "10^5000"]) + "\n")
+            else:
+                f.write(random_expression(rng) + "\n")
+
+
+class HashSink:
+    """파일처럼 write 만 받아 내용을 해시로 누적합니다."""
+
+    def __init__(self):
+        self.digest = hashlib.sha256()
+
+    def write(self, text):
+        self.digest.update(text.encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000, help="코퍼스 줄 수 (기본값: 1000000)")
+    parser.add_argument("--seed", type=int, default=0, help="코퍼스 생성 시드")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, os.cpu_count()}), help="비교할 워커 수들")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        start = time.perf_counter()
+        write_corpus(path, args.lines, args.seed)
+        print(f"코퍼스 {args.lines:,}줄 ({os.path.getsize(path) / 1e6:.1f} MB) 생성: {time.perf_counter() - start:.1f}초")
+
+        digests = set()
+        for workers in args.workers:
+            sink = HashSink()
+            start = time.perf_counter()
+            with open(path, encoding="utf-8") as source:
+                count = run_batch(source, sink, workers)
+            elapsed = time.perf_counter() - start
+            digests.add(sink.digest.hexdigest())
+            peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"워커 {workers:2d}: {count:,}줄 / {elapsed:.2f}초 = {count / elapsed:,.0f} 수식/초 (최대 RSS {peak_mb:.0f} MB)")
+        print("워커 수별 결과 일치" if len(digests) == 1 else "경고: 워커 수에 따라 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
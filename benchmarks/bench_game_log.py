@@ -0,0 +1,155 @@
+"""게임 기록(game_log.py)의 쓰기 비용과 재생 속도를 잽니다.
+
+GUI 없이 세 게임을 GUI 와 같은 순서로 진행하며 기록합니다.
+- 쓰기: 같은 게임들을 기록 없이 / EventLog 로 기록하며 돌려 이벤트당 추가 시간을 비교
+- 재생: 기록 파일을 읽어 replay() 로 모든 게임을 다시 계산하는 속도 (events/s)
+- 검증: 주사위, 행맨의 맞힘 여부, 업다운 판정을 하나씩 바꾼 사본에서 불일치를 찾아내는지
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_log import (END, HANGMAN, HEADER, JUMP, RECORD, SNAKE, START, TURN, UPDOWN, UPDOWN_CODES, EventLog,
+                      letter_mask, read_log, replay)
+from hangman_solver import GEN1_NAMES, LIVES, normalize
+from snake_ladder_logic import SnakeLadderGameLogic, advance
+from up_down_engine import CORRECT, HIGH, LOW, human_strategy, judge
+
+
+class NullLog:
+    """기록하지 않을 때의 기준선: record() 호출 비용만 남깁니다."""
+
+    def record(self, kind, game, a=0, b=0, c=0, d=0):
+        pass
+
+
+def play_snake(log, seed, players=2):
+    game_logic = SnakeLadderGameLogic(players, 8, 8, seed=seed)
+    log.record(START, SNAKE, players, game_logic.seed, game_logic.rows, game_logic.cols)
+    for source, target in {**game_logic.snakes, **game_logic.ladders}.items():
+        log.record(JUMP, SNAKE, 0, source, target)
+    table, positions = game_logic.jump_table(), game_logic.player_positions
+    player, turns = 1, 0
+    while True:
+        roll = game_logic.roll_die()
+        start = positions[player]
+        positions[player] = advance(table, start, roll)
+        turns += 1
+        log.record(TURN, SNAKE, player, roll, start, positions[player])
+        if positions[player] == game_logic.board_size:
+            log.record(END, SNAKE, player, turns)
+            return
+        player = player % players + 1
+
+
+def play_hangman(log, rng, words):
+    pokemon_id = rng.randrange(len(words))
+    word = words[pokemon_id]
+    log.record(START, HANGMAN, 0, pokemon_id + 1, LIVES, letter_mask(word))
+    missing, left, guessed = set(word), LIVES, 0
+    for letter in rng.sample("ABCDEFGHIJKLMNOPQRSTUVWXYZ", 26):
+        hit = letter in missing
+        missing.discard(letter)
+        left -= not hit
+        guessed += 1
+        log.record(TURN, HANGMAN, ord(letter), hit, left)
+        if not missing or left == 0:
+            log.record(END, HANGMAN, int(not missing), guessed)
+            return
+
+
+def play_updown(log, rng):
+    secret = rng.randint(LOW, HIGH)
+    log.record(START, UPDOWN, 0, secret, LOW, HIGH)
+    low, high, count = LOW, HIGH, 0
+    while True:
+        guess = human_strategy(low, high, rng)
+        count += 1
+        result = judge(secret, guess)
+        log.record(TURN, UPDOWN, 0, guess, UPDOWN_CODES[result], count)
+        if result is CORRECT:
+            log.record(END, UPDOWN, 0, count)
+            return
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def play_all(log, games):
+    words = [normalize(name) for name in GEN1_NAMES]
+    rng = random.Random(0)
+    for i in range(games):
+        play_snake(log, i)
+        play_hangman(log, rng, words)
+        play_updown(log, rng)
+
+
+def corrupt(path, copy, records):
+    """게임마다 TURN 하나씩(주사위, 맞힘 여부, 판정)을 하나씩 바꾼 사본을 만들고 바꾼 위치를 반환합니다."""
+    shutil.copyfile(path, copy)
+    targets = []
+    for game, field, change in ((SNAKE, 'b', lambda v: v % 6 + 1), (HANGMAN, 'b', lambda v: 1 - v),
+                                (UPDOWN, 'c', lambda v: 3 - v % 3)):
+        candidates = ((records['kind'] == TURN) & (records['game'] == game)).nonzero()[0]
+        index = int(candidates[len(candidates) // 2])
+        record = list(RECORD.unpack_from(records.tobytes(), index * RECORD.size))
+        slot = {'a': 2, 'b': 3, 'c': 4}[field]
+        record[slot] = change(record[slot])
+        with open(copy, "r+b") as f:
+            f.seek(HEADER.size + index * RECORD.size)
+            f.write(RECORD.pack(*record))
+        targets.append(index)
+    return targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=20_000, help="게임 종류마다 진행할 판 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="game_log_")
+    try:
+        path = os.path.join(workdir, "games.glog")
+        start = time.perf_counter()
+        play_all(NullLog(), args.games)
+        baseline = time.perf_counter() - start
+        with EventLog(path) as log:
+            start = time.perf_counter()
+            play_all(log, args.games)
+            logged = time.perf_counter() - start
+            events = log.count
+        size = os.path.getsize(path)
+        print(f"게임 {3 * args.games:,}판, 이벤트 {events:,}개, 파일 {size / 1024 / 1024:.1f} MB "
+              f"({RECORD.size}바이트/이벤트)")
+        print(f"쓰기: 기록 없이 {baseline:.2f}초, 기록하며 {logged:.2f}초 "
+              f"(이벤트당 +{(logged - baseline) / events * 1e6:.2f} us)")
+
+        import numpy  # 읽기 시간에 NumPy 를 처음 가져오는 시간은 넣지 않습니다.
+        start = time.perf_counter()
+        records, _ = read_log(path)
+        read_ms = (time.perf_counter() - start) * 1000
+        result = replay(records)
+        print(f"재생: 읽기 {read_ms:.1f} ms, 검증 {result['seconds'] * 1000:.0f} ms "
+              f"({result['events_per_second'] / 1e6:.2f}M events/s), 불일치 {result['mismatches']}개")
+        for name, s in result['by_game'].items():
+            print(f"  {name:7s} 게임 {s['games']:,}판, 기록 {s['events']:,}개")
+
+        copy = os.path.join(workdir, "corrupt.glog")
+        targets = corrupt(path, copy, records)
+        found = replay(read_log(copy)[0])
+        print(f"검증: 바꾼 기록 {targets} -> 불일치 {found['mismatches']}개, 첫 위치 {found['first_mismatch']}")
+        if result['mismatches'] or not found['mismatches']:
+            sys.exit(1)
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
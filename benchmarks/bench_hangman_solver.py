@@ -0,0 +1,53 @@
+"""엔트로피 최대화 행맨 봇으로 1세대 포켓몬 151마리를 모두 풀어 게임의 난이도를 잽니다.
+
+HangmanGame 과 같이 목숨 8개 규칙으로, 승률, 평균 틀린 횟수, 글자 하나를 고르는 데 걸린 시간(µs)을 보고합니다.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangman_solver import LIVES, HangmanSolver, gen1_index, play
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lives", type=int, default=LIVES, help=f"목숨 수 (기본값: {LIVES})")
+    parser.add_argument("--verbose", action="store_true", help="이름별 결과 출력")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = gen1_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    solver = HangmanSolver(index)
+
+    wins = wrong_total = decisions_total = 0
+    wrong_counts = Counter()
+    losses = []
+    start = time.perf_counter()
+    for word in index.names:
+        won, wrong, decisions = play(solver, word, args.lives)
+        wins += won
+        wrong_total += wrong
+        decisions_total += decisions
+        wrong_counts[wrong] += 1
+        if not won:
+            losses.append(word)
+        if args.verbose:
+            print(f"{word:12s} {'승' if won else '패'} 틀림 {wrong} 선택 {decisions}")
+    elapsed = time.perf_counter() - start
+
+    games = len(index.names)
+    print(f"색인 생성 {build_ms:.2f} ms, 이름 {games}개, 목숨 {args.lives}")
+    print(f"승률 {wins / games:.1%} ({wins}/{games}), 평균 틀린 횟수 {wrong_total / games:.2f}")
+    print("틀린 횟수 분포 " + " ".join(f"{k}:{wrong_counts[k]}" for k in sorted(wrong_counts)))
+    print(f"선택 {decisions_total}번, {elapsed / decisions_total * 1e6:.1f} µs/선택")
+    if losses:
+        print("진 이름: " + ", ".join(losses))
+
+
+if __name__ == "__main__":
+    main()
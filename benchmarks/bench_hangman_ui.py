@@ -0,0 +1,123 @@
+"""HangmanGame 의 글자 추측 지연과 재시작 지연을 이전 방식과 비교하는 타이밍 하네스입니다.
+
+네트워크 대신 고정된 포켓몬 목록을 쓰고 창은 숨긴 채(withdraw) 실행하지만, Tk 자체는 필요하므로
+화면(DISPLAY, 또는 Xvfb)이 있어야 합니다.
+
+before: winfo_children() 를 모두 돌며 button["text"] 를 비교해 버튼을 끄고, 재시작 때 위젯을 모두 부수고 다시 만듦
+after : 글자 -> 버튼 맵으로 바로 끄고, 재시작 때 기존 위젯을 제자리에서 초기화
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+
+from PIL import Image
+
+import hangman_game
+
+NAMES = ["pikachu", "bulbasaur", "charmander", "squirtle", "mr-mime", "farfetchd", "nidoran-f", "jigglypuff"]
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class OfflineHangman(hangman_game.HangmanGame):
+    """네트워크 없이 고정된 포켓몬을 쓰고, 게임이 끝나도 대화상자를 띄우지 않는 HangmanGame."""
+
+    def fetch_random_pokemon(self):
+        index = random.randrange(len(NAMES))
+        return {'id': index + 1, 'name': NAMES[index], 'sprites': {'front_default': None}}
+
+    def load_sprite(self, pokemon_data):
+        return Image.new("RGBA", (96, 96), (250, 210, 60, 255))
+
+    def ask_play_again(self):
+        pass
+
+
+def legacy_disable(game, letter):
+    for child in game.root.winfo_children():
+        if isinstance(child, tk.Frame):
+            for button in child.winfo_children():
+                if button["text"] == letter:
+                    button.config(state=tk.DISABLED)
+
+
+def legacy_restart(game):
+    if game.image_scaler:
+        game.image_scaler.close()
+        game.image_scaler = None
+    for widget in game.root.winfo_children():
+        widget.destroy()
+    game.guesses_left = 8
+    game.wrong_guesses = 0
+    game.guessed_letters = set()
+    game.original_pokemon_image = None
+    game.pokemon_image_on_canvas = None
+    game.setup_game()
+
+
+def wait_for_round(game):
+    # 다음 라운드 준비는 작업 스레드에서 끝나므로 라운드가 시작될 때까지 이벤트를 돌립니다.
+    while game.next_round is None:
+        game.root.update()
+        time.sleep(0.001)
+    game.root.update()
+
+
+def run(game, rounds, legacy):
+    guess_times, restart_times = [], []
+    if legacy:
+        game.disable_letter = lambda letter: legacy_disable(game, letter)
+    for _ in range(rounds):
+        wait_for_round(game)
+        for letter in random.sample(ALPHABET, len(ALPHABET)):
+            start = time.perf_counter()
+            game.guess_letter(letter)
+            game.root.update_idletasks()
+            guess_times.append(time.perf_counter() - start)
+        wait_for_round(game)
+        start = time.perf_counter()
+        if legacy:
+            legacy_restart(game)
+        else:
+            game.restart_game()
+        game.root.update_idletasks()
+        restart_times.append(time.perf_counter() - start)
+    return guess_times, restart_times
+
+
+def describe(times):
+    us = sorted(t * 1e6 for t in times)
+    return f"평균 {statistics.mean(us):8.1f} µs, p95 {us[int(len(us) * 0.95)]:8.1f} µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HangmanGame 추측/재시작 지연 측정")
+    parser.add_argument("--rounds", type=int, default=50, help="모드별 라운드 수 (기본값: 50)")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"Tk 를 열 수 없습니다 (DISPLAY 필요, 예: xvfb-run): {e}")
+    root.withdraw()
+
+    for label, legacy in (("before", True), ("after", False)):
+        random.seed(0)
+        game = OfflineHangman(root)
+        guess_times, restart_times = run(game, args.rounds, legacy)
+        print(f"{label:6s} 추측 {len(guess_times):5d}회: {describe(guess_times)} | "
+              f"재시작 {len(restart_times):3d}회: {describe(restart_times)}")
+        game.executor.shutdown(wait=True)
+        for widget in root.winfo_children():
+            widget.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
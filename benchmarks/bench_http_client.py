@@ -0,0 +1,73 @@
+"""공용 HttpClient 를 지연과 오류를 섞는 로컬 대역 서버에 대고, 요청마다 새로 연결하던 이전 방식과 비교합니다.
+
+before: urllib.request.urlopen 을 요청마다 새로 열고, 실패하면 그대로 실패
+after : http_client.HttpClient (연결 재사용, 호스트별 동시 요청 제한, 재시도/백오프, ETag 재검증)
+같은 URL 들을 두 번 받아, 두 번째에는 조건부 요청(304)이 얼마나 쓰이는지도 봅니다.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_client import PER_HOST, HttpClient
+from stand_in_server import stand_in_server
+
+
+def fetch_all(fetch, urls, threads):
+    """(성공 수, 요청별 ms 목록, 걸린 시간 s) 를 반환합니다."""
+    def one(url):
+        start = time.perf_counter()
+        try:
+            fetch(url)
+            ok = True
+        except OSError:
+            ok = False
+        return ok, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(one, urls))
+    return sum(ok for ok, _ in results), [ms for _, ms in results], time.perf_counter() - start
+
+
+def urllib_fetch(url):
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="요청 수 (기본값: 200)")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02, help="대역 서버 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.1, help="대역 서버가 503 을 돌려줄 확률")
+    parser.add_argument("--per-host", type=int, default=PER_HOST, help=f"HttpClient 의 호스트별 동시 요청 상한 (기본값: {PER_HOST})")
+    args = parser.parse_args()
+
+    server = stand_in_server(0, args.latency, args.error_rate)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/pokemon/{i}" if i % 2 else f"{base}/sprite/{i}.png" for i in range(1, args.requests + 1)]
+    print(f"대역 서버 {base}: 지연 {args.latency * 1000:.0f} ms, 오류율 {args.error_rate:.0%}, 요청 {len(urls)}개 x 2회")
+
+    client = HttpClient(backoff=0.02, per_host=args.per_host)
+    for label, fetch in (("before", urllib_fetch), ("after", client.get)):
+        for round_name in ("1회차", "2회차"):
+            server.connections = 0
+            ok, times, elapsed = fetch_all(fetch, urls, args.threads)
+            print(f"{label:6s} {round_name}: 성공 {ok}/{len(urls)}, 중앙값 {statistics.median(times):6.1f} ms, "
+                  f"전체 {elapsed:5.2f} s, 새 연결 {server.connections}개")
+    host = client.stats()[base.split("//")[1]]
+    print(f"HttpClient 통계: 요청 {host['requests']}, 재시도 {host['retries']}, 304 {host['not_modified']}, "
+          f"오류 {host['errors']}, 중앙값 {host['median_ms']:.1f} ms, p95 {host['p95_ms']:.1f} ms")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
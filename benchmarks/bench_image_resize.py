@@ -0,0 +1,160 @@
+"""행맨 포켓몬 이미지의 크기 조절을 <Configure> 이벤트 스트림으로 재생해 프레임 시간을 비교합니다.
+
+before: 이벤트마다 LANCZOS 로 다시 만들고 변환 (이전 redraw_pokemon_image 방식)
+after : image_scaler.DebouncedScaler (미리보기 묶기 + 멈춘 뒤 한 번만 LANCZOS + 크기별 캐시)
+
+이벤트 파일은 "t_ms,width,height" 형식의 CSV 입니다. 지정하지 않으면 60Hz 로 창 모서리를
+끌었다 놓는 것을 흉내 낸 합성 스트림을 씁니다. 화면(DISPLAY)이 있으면 ImageTk.PhotoImage 변환
+비용까지 포함하고, 없으면 PIL 리사이즈 비용만 잽니다.
+"""
+import argparse
+import csv
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from image_scaler import FINAL_FILTER, DebouncedScaler, fit_size
+
+
+def synthetic_events():
+    """창을 400x300 -> 1200x900 으로 2초간 늘리고, 0.5초 쉬고, 600x500 으로 1초간 줄였다가 다시 1200x900 으로 돌아갑니다."""
+    events = []
+    t = 0.0
+
+    def drag(start, end, seconds):
+        nonlocal t
+        steps = int(seconds * 60)
+        for i in range(1, steps + 1):
+            t += 1000 / 60
+            w = round(start[0] + (end[0] - start[0]) * i / steps)
+            h = round(start[1] + (end[1] - start[1]) * i / steps)
+            events.append((t, w, h))
+
+    drag((400, 300), (1200, 900), 2.0)
+    t += 500
+    drag((1200, 900), (600, 500), 1.0)
+    t += 500
+    drag((600, 500), (1200, 900), 1.0)
+    return events
+
+
+def load_events(path):
+    with open(path, newline="") as f:
+        return [(float(t), int(w), int(h)) for t, w, h in csv.reader(f)]
+
+
+def sample_sprite():
+    """PokéAPI front_default 스프라이트와 같은 96x96 RGBA 이미지."""
+    image = Image.new("RGBA", (96, 96), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((16, 20, 80, 84), fill=(250, 210, 60, 255), outline=(40, 40, 40, 255), width=3)
+    draw.polygon([(20, 30), (30, 4), (40, 28)], fill=(250, 210, 60, 255))
+    draw.polygon([(56, 28), (66, 4), (76, 30)], fill=(250, 210, 60, 255))
+    return image
+
+
+class VirtualTimers:
+    """root.after 를 흉내 내는 가상 시계. 이벤트 시각 사이에 만료된 타이머를 순서대로 실행합니다."""
+
+    def __init__(self, on_fire):
+        self.now = 0.0
+        self.timers = {}
+        self.next_id = 0
+        self.on_fire = on_fire
+
+    def clock(self):
+        return self.now
+
+    def schedule(self, ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = (self.now + ms / 1000, callback)
+        return self.next_id
+
+    def cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def advance(self, until):
+        while True:
+            due = [(when, timer_id) for timer_id, (when, _) in self.timers.items() if when <= until]
+            if not due:
+                break
+            when, timer_id = min(due)
+            _, callback = self.timers.pop(timer_id)
+            self.now = when
+            self.on_fire(callback)
+        self.now = until
+
+
+def replay_before(image, events, convert):
+    frame_times = []
+    for _, w, h in events:
+        start = time.perf_counter()
+        size = fit_size(image.size, (w, h))
+        if size is not None:
+            convert(image.resize(size, FINAL_FILTER))
+        frame_times.append(time.perf_counter() - start)
+    return frame_times, len(events)
+
+
+def replay_after(image, events, convert):
+    frame_times = []
+    drawn = [0]
+
+    def timed(callback):
+        start = time.perf_counter()
+        callback()
+        frame_times.append(time.perf_counter() - start)
+
+    def draw(frame):
+        drawn[0] += 1
+
+    timers = VirtualTimers(timed)
+    scaler = DebouncedScaler(image, draw, timers.schedule, timers.cancel, convert=convert, clock=timers.clock)
+    for t_ms, w, h in events:
+        timers.advance(t_ms / 1000)
+        timed(lambda: scaler.resize((w, h)))
+    timers.advance(float("inf"))
+    return frame_times, drawn[0]
+
+
+def report(label, frame_times, drawn):
+    ms = sorted(t * 1000 for t in frame_times)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(f"{label:7s} 핸들러 {len(ms):4d}회, 그린 프레임 {drawn:4d}개 | "
+          f"평균 {statistics.mean(ms):6.2f} ms, p95 {p95:6.2f} ms, 최대 {ms[-1]:6.2f} ms, 합계 {sum(ms):8.1f} ms")
+
+
+def make_converter():
+    try:
+        import tkinter as tk
+        from PIL import ImageTk
+        root = tk.Tk()
+        root.withdraw()
+        return ImageTk.PhotoImage, "ImageTk.PhotoImage 포함"
+    except Exception:
+        return (lambda frame: frame), "PIL 리사이즈만 (화면 없음)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", help="t_ms,width,height CSV 파일 (기본: 합성 드래그 스트림)")
+    parser.add_argument("--image", help="원본 이미지 (기본: 96x96 합성 스프라이트)")
+    args = parser.parse_args()
+
+    events = load_events(args.events) if args.events else synthetic_events()
+    image = Image.open(args.image) if args.image else sample_sprite()
+    image.load()
+    convert, mode = make_converter()
+
+    print(f"이벤트 {len(events)}개, 원본 {image.size[0]}x{image.size[1]}, {mode}")
+    report("before", *replay_before(image, events, convert))
+    report("after", *replay_after(image, events, convert))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""보드 크기를 키워 가며 SnakeLadderGUI 의 보드 메모리와 다시 그리는 시간을 이전 방식과 비교합니다.
+
+before: 보드 전체를 PIL 이미지 한 장에 그림 (칸 수에 비례하는 시간과 메모리, 큰 보드는 만들 수조차 없음)
+after : 보이는 영역(600x600)만 그림 (render_viewport), 스크롤 위치를 무작위로 바꿔 가며 측정
+뱀과 사다리는 100칸당 8개씩 둡니다. Tk 없이 그리기만 재므로 화면이 필요 없습니다.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageFont
+
+from snake_ladder_gui import CELL_SIZE, VIEWPORT, _draw_arrowhead, _draw_dashed_line, index_jumps, render_viewport
+from snake_ladder_logic import SnakeLadderGameLogic
+
+LEGACY_MAX_PIXELS = 3000 * 3000  # 이전 방식은 이보다 큰 이미지는 만들지 않고 건너뜁니다.
+
+
+def render_full_board(game_logic, font):
+    """이전 방식: 격자, 칸 번호, 뱀, 사다리를 보드 전체 크기의 이미지 한 장에 그립니다."""
+    image = Image.new("RGB", (game_logic.cols * CELL_SIZE, game_logic.rows * CELL_SIZE), "white")
+    draw = ImageDraw.Draw(image)
+
+    def center(cell):
+        return (game_logic.cell_cols[cell] + 0.5) * CELL_SIZE, (game_logic.cell_rows[cell] + 0.5) * CELL_SIZE
+
+    for cell in range(1, game_logic.board_size + 1):
+        cx, cy = center(cell)
+        x1, y1 = cx - CELL_SIZE / 2, cy - CELL_SIZE / 2
+        draw.rectangle((x1, y1, x1 + CELL_SIZE, y1 + CELL_SIZE), outline="black")
+        draw.text((x1 + 15, y1 + 15), str(cell), fill="black", font=font, anchor="mm")
+    for head, tail in game_logic.snakes.items():
+        draw.line((center(head), center(tail)), fill="red", width=4)
+        _draw_arrowhead(draw, center(head), center(tail), "red")
+    for start, end in game_logic.ladders.items():
+        _draw_dashed_line(draw, center(start), center(end), "green", width=4, dash=4)
+    return image
+
+
+def measure(rows, cols, frames, font, rng):
+    jumps = rows * cols * 8 // 100
+    start = time.perf_counter()
+    game_logic = SnakeLadderGameLogic(2, jumps, jumps, seed=0, rows=rows, cols=cols)
+    jump_rows, jump_span = index_jumps(game_logic)
+    build_ms = (time.perf_counter() - start) * 1000
+    # 메모리는 tracemalloc 을 켠 채 한 번 더 만들어 잽니다. (켜 두면 시간이 몇 배로 늘어남)
+    tracemalloc.start()
+    traced = SnakeLadderGameLogic(2, jumps, jumps, seed=0, rows=rows, cols=cols)
+    traced_index = index_jumps(traced)
+    board_bytes = tracemalloc.get_traced_memory()[0]
+    del traced, traced_index
+    tracemalloc.stop()
+
+    result = {'cells': rows * cols, 'build_ms': build_ms, 'board_kb': board_bytes / 1024}
+    for zoom in (1.0, 0.25):
+        cell_px = int(CELL_SIZE * zoom)
+        width, height = min(VIEWPORT, cols * cell_px), min(VIEWPORT, rows * cell_px)
+        times = []
+        for _ in range(frames):
+            x0 = rng.randint(0, cols * cell_px - width)
+            y0 = rng.randint(0, rows * cell_px - height)
+            start = time.perf_counter()
+            render_viewport(game_logic, jump_rows, jump_span, x0, y0, width, height, cell_px, font)
+            times.append((time.perf_counter() - start) * 1000)
+        result[f'redraw_ms_{zoom}'] = statistics.median(times)
+
+    pixels = rows * cols * CELL_SIZE * CELL_SIZE
+    if pixels <= LEGACY_MAX_PIXELS:
+        tracemalloc.start()
+        start = time.perf_counter()
+        image = render_full_board(game_logic, font)
+        result['legacy_ms'] = (time.perf_counter() - start) * 1000
+        result['legacy_mb'] = len(image.tobytes()) / 1024 / 1024
+        tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=["10x10", "30x30", "50x50", "100x100", "250x250"],
+                        help="보드 크기 목록 (행x열)")
+    parser.add_argument("--frames", type=int, default=20, help="크기마다 다시 그리는 횟수")
+    args = parser.parse_args()
+
+    font = ImageFont.load_default()
+    rng = random.Random(0)
+    print(f"{'보드':>9s} {'칸 수':>7s} {'생성':>8s} {'보드 메모리':>10s} {'다시 그리기 1x':>13s} {'0.25x':>8s} | {'before':>9s} {'이미지':>8s}")
+    for size in args.sizes:
+        rows, cols = map(int, size.split("x"))
+        r = measure(rows, cols, args.frames, font, rng)
+        legacy = (f"{r['legacy_ms']:7.1f}ms {r['legacy_mb']:6.1f}MB" if 'legacy_ms' in r else "   (너무 커서 건너뜀)")
+        print(f"{size:>9s} {r['cells']:7,d} {r['build_ms']:6.1f}ms {r['board_kb']:8.0f}KB "
+              f"{r['redraw_ms_1.0']:11.1f}ms {r['redraw_ms_0.25']:6.1f}ms | {legacy}")
+
+
+if __name__ == "__main__":
+    main()
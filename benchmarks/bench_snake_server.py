@@ -0,0 +1,152 @@
+"""snake_ladder_server 에 많은 연결과 게임을 동시에 붙여 초당 턴 수와 턴 지연(p50/p99)을 잽니다.
+
+연결마다 --games 개의 게임을 만든 뒤, 응답을 받을 때마다 다음 게임의 ROLL 을 보내는 닫힌 루프로 돌립니다.
+이긴 게임은 그 자리에서 새 게임(NEW)으로 바꾸고, --analyze-every N 을 주면 연결마다 N 턴에 한 번 ANALYZE 를 섞어
+보드 분석이 executor 에서 도는 동안에도 턴 지연이 유지되는지 봅니다.
+--connect 를 주지 않으면 서버를 하위 프로세스로 띄웁니다. 클라이언트도 파이썬이므로 --processes 로 나눠 돌릴 수 있습니다.
+"""
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def request(reader, writer, line):
+    writer.write(line.encode() + b"\n")
+    response = (await reader.readline()).decode().strip()
+    if not response or response.startswith("ERR"):
+        raise RuntimeError(f"{line!r} -> {response!r}")
+    return response
+
+
+def new_game_line(index, boards):
+    # boards 개의 시드를 돌려 쓰면 서버가 같은 점프 테이블을 함께 씁니다. 0 이면 매번 새 보드.
+    return f"NEW 2 8 8 {index % boards}" if boards else "NEW 2 8 8"
+
+
+async def connection(host, port, games, boards, deadline, analyze_every, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    game_ids = []
+    for i in range(games):
+        game_ids.append(int((await request(reader, writer, new_game_line(i, boards))).split()[1]))
+    turn_ms, new_ms, analyze_ms = results
+    turns = 0
+    i = 0
+    while time.monotonic() < deadline:
+        game_id = game_ids[i]
+        start = time.perf_counter()
+        moved = await request(reader, writer, f"ROLL {game_id}")
+        turn_ms.append((time.perf_counter() - start) * 1000)
+        turns += 1
+        if moved.endswith("WIN"):
+            start = time.perf_counter()
+            game_ids[i] = int((await request(reader, writer, new_game_line(turns, boards))).split()[1])
+            new_ms.append((time.perf_counter() - start) * 1000)
+        if analyze_every and turns % analyze_every == 0:
+            start = time.perf_counter()
+            await request(reader, writer, f"ANALYZE {game_ids[i]}")
+            analyze_ms.append((time.perf_counter() - start) * 1000)
+        i = (i + 1) % games
+    writer.write(b"QUIT\n")
+    await writer.drain()
+    writer.close()
+
+
+async def run_clients(host, port, connections, games, boards, duration, analyze_every):
+    results = (array('f'), array('f'), array('f'))
+    # 게임을 다 만든 뒤부터 재도록, 마감 시각은 연결을 모두 연 다음 정합니다.
+    deadline = [None]
+
+    async def one(delay_start):
+        await delay_start.wait()
+        await connection(host, port, games, boards, deadline[0], analyze_every, results)
+
+    started = asyncio.Event()
+    tasks = [asyncio.create_task(one(started)) for _ in range(connections)]
+    deadline[0] = time.monotonic() + duration
+    start = time.perf_counter()
+    started.set()
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start
+
+
+def client_process(host, port, connections, games, boards, duration, analyze_every):
+    results, elapsed = asyncio.run(run_clients(host, port, connections, games, boards, duration, analyze_every))
+    return [a.tobytes() for a in results], elapsed
+
+
+def percentile(values, fraction):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def server_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    stats = await request(reader, writer, "STATS")
+    writer.close()
+    return dict(item.split("=") for item in stats.split()[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connect", metavar="HOST:PORT", help="이미 떠 있는 서버 주소 (생략하면 하위 프로세스로 실행)")
+    parser.add_argument("--connections", type=int, default=200, help="동시 연결 수 (기본값: 200)")
+    parser.add_argument("--games", type=int, default=25, help="연결당 동시 게임 수 (기본값: 25)")
+    parser.add_argument("--boards", type=int, default=0, help="돌려 쓸 보드 시드 수 (0 이면 게임마다 새 보드)")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--analyze-every", type=int, default=0, metavar="N", help="연결마다 N 턴에 한 번 ANALYZE")
+    parser.add_argument("--processes", type=int, default=1, help="클라이언트 프로세스 수")
+    parser.add_argument("--workers", type=int, default=1, help="하위 프로세스로 띄운 서버의 워커 수")
+    args = parser.parse_args()
+
+    server = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+    else:
+        server = subprocess.Popen([sys.executable, "snake_ladder_server.py", "--port", "0", "--workers", str(args.workers)],
+                                  cwd=ROOT, stdout=subprocess.PIPE, text=True)
+        host, port = re.search(r"(\S+):(\d+)$", server.stdout.readline().strip()).groups()
+    port = int(port)
+
+    try:
+        per_process = [args.connections // args.processes + (i < args.connections % args.processes)
+                       for i in range(args.processes)]
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            futures = [executor.submit(client_process, host, port, n, args.games, args.boards, args.duration,
+                                       args.analyze_every) for n in per_process if n]
+            outcomes = [f.result() for f in futures]
+        merged = [array('f'), array('f'), array('f')]
+        for chunks, _ in outcomes:
+            for target, chunk in zip(merged, chunks):
+                target.frombytes(chunk)
+        elapsed = max(e for _, e in outcomes)
+        turn_ms, new_ms, analyze_ms = merged
+        stats = asyncio.run(server_stats(host, port))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"연결 {args.connections}개 x 게임 {args.games}개 = 동시 게임 {args.connections * args.games:,}개, "
+          f"{elapsed:.1f}초")
+    print(f"턴: {len(turn_ms) / elapsed:,.0f} turns/s, 중앙값 {statistics.median(turn_ms):.2f} ms, "
+          f"p99 {percentile(turn_ms, 0.99):.2f} ms")
+    print(f"새 게임: {len(new_ms):,}개, p99 {percentile(new_ms, 0.99):.2f} ms")
+    if analyze_ms:
+        print(f"분석: {len(analyze_ms):,}개, p99 {percentile(analyze_ms, 0.99):.2f} ms")
+    print(f"서버: 게임 {int(stats['games']):,}개 생성, 턴 {int(stats['turns']):,}개, "
+          f"상태 메모리 {int(stats['memory']):,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""SnakeLadderGUI 가 주사위 버튼을 누를 수 있게 되기까지의 시간(첫 입력까지)을 이전 방식과 비교합니다.
+
+포켓몬 요청마다 --latency 초(플레이어마다 조금씩 다르게)의 지연을 흉내 내고, --stall 을 주면 한 요청은
+끝나지 않는 것처럼 멈춥니다. 창은 숨긴 채 실행하지만 Tk 는 필요하므로 화면(DISPLAY, 또는 Xvfb)이 있어야 합니다.
+
+before: _fetch_player_pokemon 이 모든 요청을 기다린 뒤에야 보드를 그리고 버튼을 켬 (멈춘 요청이 있으면 끝나지 않음)
+after : 보드와 임시 말을 바로 그리고 버튼을 켠 뒤, 포켓몬은 도착하는 대로 바꿔 끼움 (요청마다 기한 있음)
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+
+from PIL import Image
+
+import snake_ladder_gui
+
+
+class SlowSnakeLadder(snake_ladder_gui.SnakeLadderGUI):
+    """포켓몬 요청을 지연만 있는 가짜로 바꾼 SnakeLadderGUI."""
+
+    latency = 0.3
+    stall = None        # threading.Event: 설정되기 전까지 가장 먼저 시작한 요청 하나가 끝나지 않음
+    stall_claim = None  # 멈출 요청을 하나만 고르기 위한 Lock
+
+    def _fetch_pokemon_data(self, pokemon_id, deadline=None):
+        if self.stall is not None and self.stall_claim.acquire(blocking=False):
+            self.stall.wait()
+        time.sleep(self.latency * (1 + pokemon_id % 3 / 3))
+        return {'id': pokemon_id, 'name': f'Poke{pokemon_id}', 'image_obj': Image.new("RGBA", (40, 40), (250, 210, 60, 255))}
+
+
+class LegacySnakeLadder(SlowSnakeLadder):
+    """이전 방식: 모든 포켓몬을 다 받은 뒤에 돌아옵니다."""
+
+    def _fetch_player_pokemon(self):
+        ids = range(1, self.game_logic.num_players + 1)
+        with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+            results = list(executor.map(self._fetch_pokemon_data, ids))  # 이전 방식에는 기한이 없었습니다.
+        for player_num, data in enumerate(results, start=1):
+            self._set_player_pokemon(player_num, data)
+
+
+def measure(cls, players, runs):
+    """(첫 입력까지 ms 목록, 모든 포켓몬이 보일 때까지 ms 목록) 을 반환합니다."""
+    first, complete = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        app = cls(num_players=players, num_snakes=8, num_ladders=8, seed=0)
+        app.withdraw()
+        first.append((time.perf_counter() - start) * 1000)
+        limit = time.monotonic() + snake_ladder_gui.POKEMON_DEADLINE + 1
+        while any(p['image'] is None for p in app.player_pokemon.values()) and time.monotonic() < limit:
+            app.update()
+            time.sleep(0.005)
+        if all(p['image'] is not None for p in app.player_pokemon.values()):
+            complete.append((time.perf_counter() - start) * 1000)
+        app.destroy()
+    return first, complete
+
+
+def describe(samples):
+    if not samples:
+        return "끝나지 않음"
+    return f"중앙값 {statistics.median(samples):7.1f} ms, 최대 {max(samples):7.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SnakeLadderGUI 첫 입력까지의 시간 측정")
+    parser.add_argument("--players", type=int, default=4, choices=range(2, 5))
+    parser.add_argument("--latency", type=float, default=0.3, help="포켓몬 요청 하나의 지연 (초, 기본값: 0.3)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--stall", action="store_true", help="한 요청이 끝나지 않는 경우도 측정 (after 만)")
+    args = parser.parse_args()
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as e:
+        sys.exit(f"Tk 를 열 수 없습니다 (DISPLAY 필요, 예: xvfb-run): {e}")
+
+    SlowSnakeLadder.latency = args.latency
+    for label, cls in (("before", LegacySnakeLadder), ("after", SlowSnakeLadder)):
+        first, complete = measure(cls, args.players, args.runs)
+        print(f"{label:6s} 첫 입력까지 {describe(first)} | 포켓몬 모두 표시 {describe(complete)}")
+    if args.stall:
+        # 요청 하나가 멈춘 상황: 그 말만 원형으로 남고 나머지는 그대로 진행됩니다.
+        SlowSnakeLadder.stall = threading.Event()
+        SlowSnakeLadder.stall_claim = threading.Lock()
+        first, complete = measure(SlowSnakeLadder, args.players, 1)
+        SlowSnakeLadder.stall.set()
+        print(f"stall  첫 입력까지 {describe(first)} | 포켓몬 모두 표시 {describe(complete)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""런처와 각 게임의 시작 시간을 -X importtime 과 창이 처음 그려질 때까지의 시간으로 재고, main.py 의 예산과 비교합니다.
+
+- 런처: `python -X importtime main.py --list` 에서 저장소 모듈과 그 의존성이 import 에 쓴 시간 합계
+- 게임: `python -X importtime -c "import <모듈>"` 의 누적 시간과 가장 느린 import 몇 개
+- 창: `python main.py <게임> --measure` 가 출력하는 time-to-window (화면 필요, 없으면 건너뜀)
+네트워크 상태에 흔들리지 않도록 API 주소는 닫힌 로컬 포트로, 캐시는 임시 폴더로 바꿔 실행합니다.
+예산을 넘은 항목이 있으면 종료 코드 1 로 끝납니다.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import GAMES, LAUNCHER_BUDGET_MS, TIME_TO_WINDOW_BUDGET_MS
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+# 인터프리터가 늘 가져오는 모듈은 빼고 셉니다.
+BASELINE = {"site", "encodings", "_frozen_importlib_external", "zipimport", "_io", "marshal", "posix", "winreg",
+            "time", "_codecs_kr", "encodings.euc_kr"}
+
+
+def run(args, env):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+
+
+def import_times(stderr):
+    """(최상위 import 누적 ms 합계, [(누적 ms, 모듈)] 느린 순) 을 반환합니다."""
+    total = 0.0
+    rows = []
+    for match in IMPORT_LINE.finditer(stderr):
+        _, cumulative, indent, module = match.groups()
+        if module in BASELINE:
+            continue
+        ms = int(cumulative) / 1000
+        if len(indent) <= 1:
+            total += ms
+        rows.append((ms, module))
+    return total, sorted(rows, reverse=True)
+
+
+def best_of(repeats, args, env):
+    results = [import_times(run(args, env).stderr) for _ in range(repeats)]
+    return min(results, key=lambda result: result[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3, help="측정 반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--top", type=int, default=5, help="게임마다 보여 줄 느린 import 수")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("POKEAPI_URL", "http://127.0.0.1:9")
+    env.setdefault("NUMBERS_API_URL", "http://127.0.0.1:9")
+    env.setdefault("POKEMON_CACHE_DIR", tempfile.mkdtemp(prefix="startup_cache_"))
+    over = []
+
+    total, _ = best_of(args.repeats, ["-X", "importtime", "main.py", "--list"], env)
+    status = "OK" if total <= LAUNCHER_BUDGET_MS else "초과"
+    print(f"런처 import {total:6.1f} ms (예산 {LAUNCHER_BUDGET_MS} ms) {status}")
+    if total > LAUNCHER_BUDGET_MS:
+        over.append("launcher")
+
+    for name, (module_name, _, _) in GAMES.items():
+        total, rows = best_of(args.repeats, ["-X", "importtime", "-c", f"import {module_name}"], env)
+        slowest = ", ".join(f"{module} {ms:.1f}" for ms, module in rows[1:args.top + 1])
+        print(f"{name:8s} import {total:6.1f} ms  느린 import: {slowest}")
+
+    for name in GAMES:
+        result = run(["main.py", name, "--measure"], env)
+        match = re.search(r"time-to-window \S+: ([\d.]+) ms", result.stdout)
+        if not match:
+            print(f"{name:8s} 창까지: 측정 못 함 (화면 필요) {result.stderr.strip().splitlines()[-1:]}")
+            continue
+        elapsed = float(match.group(1))
+        budget = TIME_TO_WINDOW_BUDGET_MS[name]
+        print(f"{name:8s} 창까지 {elapsed:6.1f} ms (예산 {budget} ms) {'OK' if elapsed <= budget else '초과'}")
+        if elapsed > budget:
+            over.append(name)
+
+    if over:
+        sys.exit(f"예산 초과: {', '.join(over)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""tracing.py 의 span 비용을 켜고 끈 상태로 잽니다.
+
+- span 한 번: 빈 루프 / 꺼진 span / 켜진 span 의 반복당 ns
+- 실제 경로: 행맨 스프라이트 크기 조절(DebouncedScaler, LANCZOS 렌더 + 변환)을 span 없이 / 꺼진 채로 / 켠 채로
+- 여러 스레드(ThreadPoolExecutor)에서 동시에 기록한 결과를 Chrome trace JSON 으로 내보내는 시간과 크기
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+import tracing
+from image_scaler import DebouncedScaler
+
+
+def per_call_ns(body, repeats):
+    """body(n) 를 여러 번 돌린 중앙값을 반복당 ns 로 반환합니다."""
+    times = []
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        body(repeats)
+        times.append((time.perf_counter_ns() - start) / repeats)
+    return statistics.median(times)
+
+
+def empty_loop(n):
+    for _ in range(n):
+        pass
+
+
+def span_loop(n):
+    span = tracing.span
+    for _ in range(n):
+        with span("bench.empty"):
+            pass
+
+
+def scaler_frames(image, sizes):
+    """캐시를 비워 가며 매번 LANCZOS 로 다시 렌더링합니다. (변환은 Tk 없이 copy 로 대신)"""
+    scaler = DebouncedScaler(image, draw=lambda frame: None, schedule=lambda ms, fn: None, cancel=lambda i: None,
+                             convert=lambda frame: frame.copy(), cache_size=0)
+    start = time.perf_counter()
+    for size in sizes:
+        scaler.render_now(size)
+    return (time.perf_counter() - start) / len(sizes) * 1e6
+
+
+def threaded_spans(workers, spans):
+    def work(i):
+        for _ in range(spans):
+            with tracing.span("bench.task", worker=i):
+                pass
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(work, range(workers)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=200_000, help="span 비용을 잴 반복 수")
+    parser.add_argument("--frames", type=int, default=300, help="스프라이트 크기 조절 횟수")
+    args = parser.parse_args()
+
+    tracing.disable()
+    baseline = per_call_ns(empty_loop, args.repeats)
+    off = per_call_ns(span_loop, args.repeats)
+    tracing.enable()
+    on = per_call_ns(span_loop, args.repeats // 10)
+    tracing.clear()
+    print(f"span 한 번: 빈 루프 {baseline:.0f} ns, 꺼짐 +{off - baseline:.0f} ns, 켜짐 +{on - baseline:.0f} ns")
+
+    image = Image.effect_noise((96, 96), 64).convert("RGBA")
+    sizes = [(100 + i % 200, 100 + i % 200) for i in range(args.frames)]
+    runs = {False: [], True: []}
+    for _ in range(3):  # 번갈아 돌려 가장 빠른 값을 비교합니다. (CPU 클럭 변화 등 잡음 줄이기)
+        for enabled in (False, True):
+            if enabled:
+                tracing.enable()
+            else:
+                tracing.disable()
+            runs[enabled].append(scaler_frames(image, sizes))
+    tracing.clear()
+    frame_off, frame_on = min(runs[False]), min(runs[True])
+    print(f"스프라이트 크기 조절: 꺼짐 {frame_off:.0f} us/프레임, 켜짐 {frame_on:.0f} us/프레임 "
+          f"({(frame_on - frame_off) / frame_off * 100:+.1f}%)")
+
+    threaded_spans(workers=4, spans=25_000)
+    path = os.path.join(tempfile.mkdtemp(prefix="trace_"), "trace.json")
+    start = time.perf_counter()
+    count = tracing.export(path)
+    elapsed = (time.perf_counter() - start) * 1000
+    with open(path, encoding="utf-8") as f:
+        threads = {event['tid'] for event in json.load(f)['traceEvents'] if event['ph'] == 'X'}
+    print(f"내보내기: span {count:,}개 (스레드 {len(threads)}개) {elapsed:.0f} ms, {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""업다운 게임의 추측 전략을 모든 정답(1~1000)에 대해 돌려 추측 횟수 분포와 초당 게임 수를 잽니다.
+
+무작위가 섞인 전략(random, human)은 정답마다 --repeats 번씩 돌립니다. 이어서 SessionManager 로
+--sessions 개의 세션을 동시에 열어 두고 이진 탐색 플레이어들이 번갈아 추측하게 해, 많은 사용자를
+받는 서버의 핵심으로 쓸 때의 초당 추측 처리량과 세션당 메모리를 보고합니다.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from up_down_engine import CORRECT, HIGH, LOW, STRATEGIES, UP, SessionManager, binary_strategy, play
+
+
+def run_strategy(name, repeats, seed):
+    strategy = STRATEGIES[name]
+    rng = random.Random(seed)
+    counts = Counter()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for secret in range(LOW, HIGH + 1):
+            counts[play(strategy, secret, rng)] += 1
+    elapsed = time.perf_counter() - start
+    return counts, elapsed
+
+
+def report(name, counts, elapsed):
+    games = sum(counts.values())
+    values = list(counts.elements())
+    histogram = " ".join(f"{k}:{counts[k]}" for k in sorted(counts))
+    print(f"{name:7s} {games:8,}판 평균 {statistics.fmean(values):5.2f} 중앙값 {statistics.median(values):4.1f} "
+          f"최대 {max(values):3d}  {games / elapsed:10,.0f} games/s")
+    print(f"        분포 {histogram}")
+
+
+def run_sessions(num_sessions, seed):
+    """세션 num_sessions 개를 열고, 모두 끝날 때까지 돌아가며 한 번씩 이진 탐색으로 추측합니다."""
+    manager = SessionManager(rng=random.Random(seed))
+    players = {manager.new_session(): [LOW, HIGH] for _ in range(num_sessions)}
+    guesses = 0
+    start = time.perf_counter()
+    while players:
+        for session_id, bounds in list(players.items()):
+            guess = binary_strategy(bounds[0], bounds[1], None)
+            result, _ = manager.guess(session_id, guess)
+            guesses += 1
+            if result is CORRECT:
+                del players[session_id]
+            elif result is UP:
+                bounds[0] = guess + 1
+            else:
+                bounds[1] = guess - 1
+    elapsed = time.perf_counter() - start
+    print(f"동시 세션 {num_sessions:,}개: 추측 {guesses:,}번 / {elapsed:.2f}초 = {guesses / elapsed:,.0f} guesses/s, "
+          f"세션 상태 {manager.memory_bytes() / num_sessions:.0f} B/세션")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20, help="무작위 전략의 정답별 반복 횟수 (기본값: 20)")
+    parser.add_argument("--sessions", type=int, default=100_000, help="동시 세션 수 (기본값: 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for name in STRATEGIES:
+        repeats = 1 if name == 'binary' else args.repeats
+        report(name, *run_strategy(name, repeats, args.seed))
+    run_sessions(args.sessions, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+import itertools
+import math
+import operator
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+
+# multiprocessing 과 concurrent.futures 는 가져오는 데 20ms 남짓 걸리므로, 무거운 수식이나 일괄 계산에서 처음 필요할 때 가져옵니다.
+
+# 파이썬은 4300자리가 넘는 정수를 문자열로 바꾸지 못하므로 (eval 결과도 "오류"),
+# 정수 크기를 그 자리수에 해당하는 비트 수로 제한합니다. 비트 수가 같은 경계에서는 DIGIT_LIMIT 와 직접 비교합니다.
+MAX_DIGITS = 4300
+MAX_BITS = math.ceil(MAX_DIGITS * math.log2(10))
+DIGIT_LIMIT = 10 ** MAX_DIGITS  # MAX_DIGITS + 1 자리의 가장 작은 수
+HEAVY_COST = 200_000   # 예상 비용이 이보다 크면 작업 프로세스에서 계산합니다.
+TIMEOUT = 2.0          # 작업 프로세스 제한 시간 (초)
+ERROR_TEXT = "오류"
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<op>\*\*|//|[-+*/%()])
+    )""", re.VERBOSE)
+
+BINARY_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': operator.floordiv,
+    '%': operator.mod,
+    '**': operator.pow,
+}
+
+
+class CalcError(ValueError):
+    """수식을 해석할 수 없거나 제한을 넘은 경우."""
+
+
+def tokenize(text):
+    """계산기 표시 문자열을 (종류, 값) 토큰 목록으로 바꿉니다. '^' 는 계산기와 같이 '**' 로 취급합니다."""
+    text = text.replace("^", "**")
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_RE.match(text, position)
+        if not match:
+            raise CalcError(f"알 수 없는 문자: {text[position:].strip()[:1]!r}")
+        position = match.end()
+        number = match.group('number')
+        if number is None:
+            tokens.append(('op', match.group('op')))
+        elif any(c in number for c in ".eE"):
+            tokens.append(('num', float(number)))
+        else:
+            # 파이썬처럼 0 으로 시작하는 정수(예: 012)는 허용하지 않습니다.
+            if len(number) > 1 and number[0] == '0' and number.strip('0'):
+                raise CalcError(f"0 으로 시작하는 정수: {number}")
+            tokens.append(('num', int(number)))
+    return tokens
+
+
+class _Parser:
+    """파이썬과 같은 우선순위의 재귀 하강 파서.
+
+    expr   := term (('+' | '-') term)*
+    term   := unary (('*' | '/' | '//' | '%') unary)*
+    unary  := ('+' | '-') unary | power
+    power  := atom ('**' unary)?        # 오른쪽 결합, -2**2 == -4, 2**-1 == 0.5
+    atom   := NUMBER | '(' expr ')'
+    노드는 ('num', 값), ('neg'|'pos', 노드), (연산자, 왼쪽, 오른쪽) 튜플입니다.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise CalcError("수식이 올바르지 않습니다.")
+        self.index += 1
+        return token
+
+    def parse(self):
+        node = self.expr()
+        if self.index != len(self.tokens):
+            raise CalcError("수식이 올바르지 않습니다.")
+        return node
+
+    def expr(self):
+        node = self.term()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            node = (self.take()[1], node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while self.peek() in (('op', '*'), ('op', '/'), ('op', '//'), ('op', '%')):
+            node = (self.take()[1], node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() in (('op', '+'), ('op', '-')):
+            sign = self.take()[1]
+            return ('neg' if sign == '-' else 'pos', self.unary())
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek() == ('op', '**'):
+            self.take()
+            node = ('**', node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'num':
+            return ('num', value)
+        if value == '(':
+            node = self.expr()
+            self.take(')')
+            return node
+        raise CalcError("수식이 올바르지 않습니다.")
+
+
+def _magnitude_bits(node):
+    """노드 값의 크기 log2|x| 의 상한과, 계산 비용(다뤄야 할 비트 수 합)의 추정치를 반환합니다."""
+    kind = node[0]
+    if kind == 'num':
+        value = node[1]
+        if isinstance(value, int):
+            return value.bit_length(), 0
+        if not math.isfinite(value):
+            return 1024, 0
+        return max(0.0, math.log2(abs(value) or 1)), 0
+    if kind in ('neg', 'pos'):
+        return _magnitude_bits(node[1])
+    left_bits, left_cost = _magnitude_bits(node[1])
+    right_bits, right_cost = _magnitude_bits(node[2])
+    cost = left_cost + right_cost
+    if kind in ('+', '-'):
+        bits = max(left_bits, right_bits) + 1
+    elif kind == '*':
+        bits = left_bits + right_bits
+    elif kind == '**':
+        # |a ** b| <= 2 ** (L(a) * 2 ** L(b)). 지수 상한이 너무 크면 무한대로 봅니다.
+        if left_bits == 0:
+            bits = 0
+        elif right_bits < 1024:
+            bits = left_bits * 2.0 ** right_bits
+        else:
+            bits = math.inf
+    else:
+        bits = left_bits
+    return bits, cost + bits
+
+
+class Program:
+    """컴파일된 수식: 후위 표기 명령 목록과 예상 비용."""
+
+    __slots__ = ('code', 'cost')
+
+    def __init__(self, code, cost):
+        self.code = code
+        self.cost = cost
+
+
+def _emit(node, code):
+    kind = node[0]
+    if kind == 'num':
+        code.append(('push', node[1]))
+    elif kind in ('neg', 'pos'):
+        _emit(node[1], code)
+        code.append((kind, None))
+    else:
+        _emit(node[1], code)
+        _emit(node[2], code)
+        code.append(('op', kind))
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(text):
+    """수식 문자열을 Program 으로 컴파일합니다. 같은 문자열은 캐시된 결과를 씁니다."""
+    tree = _Parser(tokenize(text)).parse()
+    code = []
+    _emit(tree, code)
+    _, cost = _magnitude_bits(tree)
+    return Program(tuple(code), cost)
+
+
+def _check_int(value, max_bits):
+    if isinstance(value, int):
+        bits = value.bit_length()
+        if bits > max_bits or (bits >= MAX_BITS and abs(value) >= DIGIT_LIMIT):
+            raise CalcError(f"결과가 너무 큽니다 ({MAX_DIGITS}자리 초과).")
+    return value
+
+
+def _guarded(op, left, right, max_bits):
+    """실제 값을 보고 계산 전에 결과 크기를 판단합니다. 큰 거듭제곱은 계산하지 않고 바로 실패합니다."""
+    if isinstance(left, int) and isinstance(right, int):
+        if op == '**' and right > 0 and abs(left) > 1:
+            # |a| ** b 의 비트 수 ≈ b * log2|a|
+            if right * math.log2(abs(left)) > max_bits + 1:
+                raise CalcError(f"결과가 너무 큽니다 ({MAX_DIGITS}자리 초과).")
+        elif op == '*' and left.bit_length() + right.bit_length() > max_bits + 1:
+            raise CalcError(f"결과가 너무 큽니다 ({MAX_DIGITS}자리 초과).")
+    return _check_int(BINARY_OPS[op](left, right), max_bits)
+
+
+def run_program(code, max_bits=MAX_BITS):
+    """후위 표기 명령을 스택으로 실행합니다. 산술 오류(ZeroDivisionError 등)는 파이썬과 같이 그대로 올라갑니다."""
+    stack = []
+    for instruction, argument in code:
+        if instruction == 'push':
+            stack.append(argument)
+        elif instruction == 'neg':
+            stack.append(-stack.pop())
+        elif instruction == 'pos':
+            stack.append(+stack.pop())
+        else:
+            right = stack.pop()
+            stack.append(_guarded(argument, stack.pop(), right, max_bits))
+    return stack[0]
+
+
+class CalcEngine:
+    """eval 대신 쓰는 안전한 계산 엔진.
+
+    수식은 컴파일 캐시를 거쳐 후위 표기 프로그램이 되고, 예상 비용이 작으면 바로 계산합니다.
+    비용이 큰 프로그램은 작업 프로세스에서 timeout 초 안에 계산하며, 시간을 넘기면 프로세스를 끝내고 CalcError 를 냅니다.
+    """
+
+    def __init__(self, max_bits=MAX_BITS, heavy_cost=HEAVY_COST, timeout=TIMEOUT):
+        self.max_bits = max_bits
+        self.heavy_cost = heavy_cost
+        self.timeout = timeout
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._waiter = None
+
+    def evaluate(self, text):
+        program = compile_expression(text)
+        if program.cost <= self.heavy_cost:
+            return run_program(program.code, self.max_bits)
+        return self._run_in_worker(program)
+
+    def _run_in_worker(self, program):
+        import multiprocessing
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(1)
+            pool = self._pool
+            pending = pool.apply_async(run_program, (program.code, self.max_bits))
+            try:
+                return pending.get(self.timeout)
+            except multiprocessing.TimeoutError:
+                # 멈추지 않는 계산은 프로세스째 끝냅니다.
+                pool.terminate()
+                self._pool = None
+                raise CalcError(f"계산 시간이 {self.timeout}초를 넘었습니다.") from None
+
+    def submit(self, text):
+        """evaluate 를 Future 로 감쌉니다. 가벼운 수식은 바로 끝난 Future 를, 무거운 수식은 별도 스레드에서 기다립니다."""
+        from concurrent.futures import Future, ThreadPoolExecutor
+        try:
+            program = compile_expression(text)
+            if program.cost > self.heavy_cost:
+                if self._waiter is None:
+                    self._waiter = ThreadPoolExecutor(max_workers=1)
+                return self._waiter.submit(self._run_in_worker, program)
+            future = Future()
+            future.set_result(run_program(program.code, self.max_bits))
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        return future
+
+    def close(self):
+        if self._waiter is not None:
+            self._waiter.shutdown(wait=False)
+            self._waiter = None
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+
+def format_result(value):
+    return str(value)
+
+
+def calculate(text, engine=None):
+    """계산기의 '=' 과 같은 규칙으로 결과 문자열을 반환합니다. 어떤 오류든 "오류" 입니다."""
+    try:
+        return format_result((engine or _default_engine()).evaluate(text))
+    except Exception:
+        return ERROR_TEXT
+
+
+_engine = None
+
+
+def _default_engine():
+    global _engine
+    if _engine is None:
+        _engine = CalcEngine()
+    return _engine
+
+
+def evaluate_lines(lines):
+    """여러 줄을 calculate 규칙으로 계산해 결과 문자열 목록을 반환합니다. (프로세스 풀 작업 단위)"""
+    engine = _default_engine()
+    return [calculate(line.rstrip("\r\n"), engine) for line in lines]
+
+
+def evaluate_stream(lines, workers=1, chunk_lines=2000, window=None):
+    """한 줄에 수식 하나씩인 반복자를 받아 결과 문자열을 입력 순서대로 하나씩 내보냅니다.
+
+    입력은 chunk_lines 줄씩 잘라 workers 개의 프로세스에 나눠 주고, 동시에 처리 중인 청크는
+    window 개(기본: workers * 4)를 넘지 않게 하므로 입력이 아무리 커도 메모리 사용량은 일정합니다.
+    """
+    chunks = iter(lambda: list(itertools.islice(lines, chunk_lines)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield from evaluate_lines(chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    window = window or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(evaluate_lines, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -1,9 +1,18 @@
+import argparse
+import os
+import sys
 import tkinter as tk
 
+from calc_engine import ERROR_TEXT, CalcEngine, evaluate_stream, format_result
+
+POLL_MS = 50
+
 class Calculator:
     def __init__(self, master):
         self.master = master
         master.title("계산기")
+        self.engine = CalcEngine()
+        self.pending = None
 
         self.display = tk.Entry(master, width=20, font=("Arial", 20), borderwidth=5, justify="right")
         self.display.grid(row=0, column=0, columnspan=4, padx=10, pady=10)
@@ -40,18 +49,52 @@ class Calculator:
         if char == "C":
             self.display.delete(0, tk.END)
         elif char == "=":
-            try:
-                expression = self.display.get().replace("^", "**")
-                result = eval(expression)
-                self.display.delete(0, tk.END)
-                self.display.insert(0, str(result))
-            except Exception:
-                self.display.delete(0, tk.END)
-                self.display.insert(0, "오류")
+            # 무거운 수식은 작업 프로세스에서 계산되므로 Future 를 after 로 확인합니다.
+            self.pending = self.engine.submit(self.display.get())
+            self.show_result(self.pending)
         else:
             self.display.insert(tk.END, char)
 
+    def show_result(self, future):
+        if future is not self.pending:
+            return  # 기다리는 동안 '=' 을 다시 눌렀습니다.
+        if not future.done():
+            self.master.after(POLL_MS, self.show_result, future)
+            return
+        self.pending = None
+        try:
+            text = format_result(future.result())
+        except Exception:
+            text = ERROR_TEXT
+        self.display.delete(0, tk.END)
+        self.display.insert(0, text)
+
+def run_batch(source, output, workers=1):
+    """source 의 각 줄을 계산기의 '=' 과 같은 규칙으로 계산해 한 줄씩 output 에 씁니다."""
+    count = 0
+    for result in evaluate_stream(source, workers=workers):
+        output.write(result)
+        output.write("\n")
+        count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="계산기 (GUI 또는 일괄 계산)")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="FILE(생략하거나 '-' 이면 표준 입력)의 한 줄 한 수식을 계산해 표준 출력에 씀")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="일괄 계산 프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    if args.batch is None:
+        root = tk.Tk()
+        app = Calculator(root)
+        root.mainloop()
+        app.engine.close()
+    elif args.batch == "-":
+        run_batch(sys.stdin, sys.stdout, args.workers)
+    else:
+        with open(args.batch, encoding="utf-8") as source:
+            run_batch(source, sys.stdout, args.workers)
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = Calculator(root)
-    root.mainloop()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,378 @@
+import argparse
+import os
+import struct
+import sys
+import time
+
+# 파일 구성: 헤더 | 고정 폭 기록들 (덧붙이기만 함)
+#   헤더 = 매직 4바이트, 버전, 기록 크기
+#   기록 = 종류, 게임, a, b, c, d (16바이트). 필드의 뜻은 종류와 게임에 따라 다릅니다.
+#
+#   게임      START (a, b, c, d)                  TURN (a, b, c, d)                        END (a, b)
+#   HANGMAN   -, 포켓몬 id, 목숨, 단어의 글자 마스크   글자, 맞힘(1/0), 남은 기회, -              승리(1/0), 턴 수
+#   SNAKE     플레이어 수, 시드, 행, 열              플레이어, 주사위, 출발 칸, 도착 칸            이긴 플레이어, 턴 수
+#   UPDOWN    -, 정답, LOW, HIGH                   -, 추측, 판정(1=UP 2=DOWN 3=CORRECT), 횟수   -, 턴 수
+#
+# SNAKE 의 START 바로 뒤에는 뱀/사다리마다 JUMP (-, 시작 칸, 도착 칸, -) 가 붙어 보드를 그대로 담습니다.
+# 글자 마스크는 단어에 쓰인 A..Z 를 0..25번 비트로 나타냅니다. (포켓몬을 못 받았을 때의 PYTHON 은 id 0)
+MAGIC = b"GLOG"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<BBHIII")
+BUFFER_RECORDS = 4096
+
+START, TURN, END, JUMP = 1, 2, 3, 4
+HANGMAN, SNAKE, UPDOWN = 1, 2, 3
+KIND_NAMES = {START: "START", TURN: "TURN", END: "END", JUMP: "JUMP"}
+GAME_NAMES = {HANGMAN: "hangman", SNAKE: "snake", UPDOWN: "updown"}
+UPDOWN_CODES = {"UP": 1, "DOWN": 2, "CORRECT": 3}
+MAX_FIELD = 2 ** 32 - 1
+
+
+def letter_mask(word):
+    """단어에 쓰인 A..Z 글자의 비트마스크."""
+    mask = 0
+    for ch in word:
+        if "A" <= ch <= "Z":
+            mask |= 1 << (ord(ch) - 65)
+    return mask
+
+
+class EventLog:
+    """게임 이벤트를 고정 폭 기록으로 파일 끝에 덧붙입니다.
+
+    record() 는 미리 잡아 둔 버퍼에 struct.pack_into 로 쓰기만 하고, 버퍼가 차거나 게임이 끝날 때(END)
+    한 번에 write 합니다. 한 파일에는 한 프로세스만 쓴다고 가정합니다.
+    """
+
+    def __init__(self, path, buffer_records=BUFFER_RECORDS):
+        self.path = path
+        self._file = open(path, "ab+")
+        self._file.seek(0)
+        header = self._file.read(HEADER.size)
+        if header:
+            _check_header(path, header)
+        else:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._buffer = bytearray(RECORD.size * buffer_records)
+        self._used = 0
+        self.count = 0
+
+    def record(self, kind, game, a=0, b=0, c=0, d=0):
+        RECORD.pack_into(self._buffer, self._used, kind, game, a, b, c, d)
+        self._used += RECORD.size
+        self.count += 1
+        if kind == END or self._used == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        if self._used:
+            self._file.write(memoryview(self._buffer)[:self._used])
+            self._file.flush()
+            self._used = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_log(path=None):
+    """path (없으면 GAME_LOG 환경 변수) 에 기록하는 EventLog. 둘 다 없으면 None 이고, 게임은 기록하지 않습니다."""
+    path = path or os.environ.get("GAME_LOG")
+    return EventLog(path) if path else None
+
+
+def _check_header(path, header):
+    if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION, RECORD.size):
+        raise ValueError(f"{path}: 게임 기록 파일이 아닙니다.")
+
+
+def record_dtype():
+    """RECORD 와 같은 배치의 NumPy 구조체 dtype."""
+    import numpy as np
+    return np.dtype([('kind', 'u1'), ('game', 'u1'), ('a', '<u2'), ('b', '<u4'), ('c', '<u4'), ('d', '<u4')])
+
+
+def read_log(path):
+    """(기록 배열, 잘린 바이트 수) 를 반환합니다.
+
+    파일을 복사 없이 NumPy 구조체 배열로 봅니다. 쓰다가 멈춰 마지막 기록이 덜 쓰였으면 그 부분은 버립니다.
+    """
+    import numpy as np
+    with open(path, "rb") as f:
+        data = f.read()
+    _check_header(path, data[:HEADER.size])
+    body = len(data) - HEADER.size
+    records = np.frombuffer(data, dtype=record_dtype(), count=body // RECORD.size, offset=HEADER.size)
+    return records, body % RECORD.size
+
+
+# --- 재생 -------------------------------------------------------------------
+# 게임 종류마다 기록을 골라 NumPy 배열 연산으로 한꺼번에 다시 계산하고, 기록된 결과와 다른 기록을 찾습니다.
+# 검사 함수는 한 게임 종류의 기록만 순서대로 받아 (기록마다 불일치 여부, 게임 수) 를 반환합니다.
+
+class _Turns:
+    """TURN 기록을 게임별로 묶어 보는 색인."""
+
+    def __init__(self, records):
+        import numpy as np
+        kind = records['kind']
+        self.game = np.cumsum(kind == START) - 1       # 기록마다 게임 번호
+        self.starts = np.flatnonzero(kind == START)
+        self.at = np.flatnonzero(kind == TURN)
+        self.of = self.game[self.at]                    # 턴마다 게임 번호
+        self.counts = np.bincount(self.of, minlength=len(self.starts))
+        self.begin = np.cumsum(self.counts) - self.counts
+        self.ordinal = np.arange(len(self.at)) - self.begin[self.of]
+        self.last = self.ordinal == self.counts[self.of] - 1
+
+    def running(self, flags):
+        """턴마다 그 게임 안에서 flags 가 참인 턴 수 (그 턴 포함)."""
+        import numpy as np
+        total = np.concatenate([[0], np.cumsum(flags)])
+        return total[1:] - total[self.begin[self.of]]
+
+
+def _previous_in_group(values, keys):
+    """keys 가 같은 것끼리 기록 순서대로 묶었을 때 (정렬 순서, 앞 원소가 같은 묶음인지, 앞 원소의 값)."""
+    import numpy as np
+    order = np.argsort(keys, kind="stable")
+    same = np.zeros(len(keys), dtype=bool)
+    same[1:] = keys[order][1:] == keys[order][:-1]
+    previous = np.zeros_like(values)
+    previous[1:] = values[order][:-1]
+    return order, same, previous
+
+
+def _check_ends(records, turns, finished, outcome):
+    """END 는 게임마다 하나이고, 턴 수(b)가 맞고, 마지막 턴이 게임을 끝냈고(finished), a 가 그 턴의 결과(outcome)와
+    같아야 합니다. 반환값은 (END 위치, 불일치 여부)."""
+    import numpy as np
+    ends = np.flatnonzero(records['kind'] == END)
+    end_game = turns.game[ends]
+    total = turns.counts[end_game]
+    bad = (total == 0) | (records['b'][ends] != total)
+    if len(turns.at):
+        last = np.maximum(turns.begin[end_game] + total - 1, 0)
+        bad |= ~finished[last] | (records['a'][ends] != outcome[last])
+    bad[1:] |= end_game[1:] == end_game[:-1]
+    return ends, bad
+
+
+def _dice_words(seed, count):
+    """random.Random(seed + 1) 의 32비트 출력 count 개를 바이트로 (생성 순서대로, 리틀 엔디언)."""
+    import random
+    return random.Random(seed + 1).getrandbits(32 * count).to_bytes(4 * count, "little")
+
+
+def dice_for_games(seeds, counts):
+    """SnakeLadderGameLogic(seed=seeds[g]).roll_die() 가 처음 counts[g] 번 낼 눈을 게임 순서대로 이어 붙여 반환합니다.
+
+    주사위는 random.Random(seed + 1).randint(1, 6) 이고, CPython 은 한 번에 32비트 출력 하나의 위 3비트를 뽑아
+    6 미만이 나올 때까지 되풀이합니다. getrandbits(32 * n) 은 같은 출력 n 개를 작은 자리부터 이어 붙이므로,
+    게임마다 넉넉히 뽑아 한꺼번에 걸러 내면 randint 를 턴 수만큼 부른 것과 같은 눈이 나옵니다.
+    """
+    import numpy as np
+    seeds, counts = np.asarray(seeds).tolist(), np.asarray(counts, dtype=np.int64)
+    words = counts * 4 // 3 + 16  # 평균 3/4 가 남으므로 모자라는 일은 드뭅니다. 모자란 게임은 두 배로 늘려 다시 뽑습니다.
+    chunks = list(map(_dice_words, seeds, words.tolist()))
+    while True:
+        bits = np.frombuffer(b"".join(chunks), dtype="<u4") >> 29
+        word_game = np.repeat(np.arange(len(counts)), words)
+        kept = np.concatenate([[0], np.cumsum(bits < 6)])
+        first = kept[np.cumsum(words) - words]
+        take = (bits < 6) & (kept[1:] - 1 - first[word_game] < counts[word_game])
+        short = np.bincount(word_game[take], minlength=len(counts)) < counts
+        if not short.any():
+            return (bits[take] + 1).astype(np.int64)
+        for g in np.flatnonzero(short):
+            words[g] *= 2
+            chunks[g] = _dice_words(seeds[g], int(words[g]))
+
+
+def _check_snake(records):
+    import numpy as np
+    kind = records['kind']
+    turns = _Turns(records)
+    bad = np.zeros(len(records), dtype=bool)
+    heads = records[turns.starts]
+    players = heads['a'].astype(np.int64)
+    sizes = heads['c'].astype(np.int64) * heads['d']
+    bad[turns.starts] = (players < 1) | (heads['c'] < 2) | (heads['d'] < 2)
+
+    # 게임마다 0..크기 의 점프 테이블을 하나로 이어 붙이고 JUMP 기록대로 고칩니다.
+    offsets = np.cumsum(sizes + 1) - (sizes + 1)
+    tables = np.arange(int((sizes + 1).sum())) - np.repeat(offsets, sizes + 1)
+    jumps = np.flatnonzero(kind == JUMP)
+    jump_game = turns.game[jumps]
+    source, target = records['b'][jumps].astype(np.int64), records['c'][jumps].astype(np.int64)
+    size = sizes[jump_game]
+    jump_bad = (source < 2) | (source >= size) | (target < 2) | (target >= size) | (source == target)
+    # JUMP 는 START 와 첫 TURN 사이에만 옵니다.
+    turns_so_far = np.cumsum(kind == TURN)
+    jump_bad |= turns_so_far[jumps] != turns_so_far[turns.starts][jump_game]
+    bad[jumps] = jump_bad
+    ok = ~jump_bad
+    tables[offsets[jump_game[ok]] + source[ok]] = target[ok]
+
+    t = records[turns.at]
+    player, roll = t['a'].astype(np.int64), t['b'].astype(np.int64)
+    origin, end = t['c'].astype(np.int64), t['d'].astype(np.int64)
+    size = sizes[turns.of]
+    landing = origin + roll
+    expected = np.where(landing <= size, tables[offsets[turns.of] + np.minimum(landing, size)], origin)
+    finished = end == size
+    turn_bad = (roll < 1) | (roll > 6) | (end != expected) | (finished & ~turns.last)
+    # 차례는 1, 2, ..., N 을 돕니다.
+    turn_bad |= player != turns.ordinal % players[turns.of] + 1
+    # 각 말은 자기 이전 도착 칸(처음에는 1번 칸)에서 출발합니다.
+    order, same, previous = _previous_in_group(end, turns.of * 256 + player)
+    turn_bad[order] |= origin[order] != np.where(same, previous, 1)
+    # 주사위는 시드로 다시 굴린 값과 같아야 합니다.
+    turn_bad |= roll != dice_for_games(heads['b'], turns.counts)
+    bad[turns.at] = turn_bad
+
+    ends, end_bad = _check_ends(records, turns, finished, player)
+    bad[ends] = end_bad
+    return bad, len(turns.starts)
+
+
+def _check_hangman(records):
+    import numpy as np
+    turns = _Turns(records)
+    bad = np.zeros(len(records), dtype=bool)
+    heads = records[turns.starts]
+    lives = heads['c'].astype(np.int64)
+    word = heads['d'].astype(np.int64)
+    bad[turns.starts] = (word == 0) | (word >= 1 << 26)
+
+    t = records[turns.at]
+    letter = t['a'].astype(np.int64) - 65
+    valid = (letter >= 0) & (letter < 26)
+    letter = np.clip(letter, 0, 25)
+    hit = valid & ((word[turns.of] >> letter) & 1 == 1)
+    left = lives[turns.of] - turns.running(~hit)
+    turn_bad = ~valid | (t['b'] != hit) | (t['c'] != left)
+    # 같은 글자는 한 게임에서 한 번만 고를 수 있습니다.
+    order, same, _ = _previous_in_group(letter, turns.of * 32 + letter)
+    turn_bad[order] |= same
+    # 지금까지 고른 글자로 단어가 완성되면 승리, 기회가 0 이 되면 패배이고 그 턴이 마지막이어야 합니다.
+    chosen = np.zeros(len(turns.at), dtype=np.int64)
+    for ch in range(26):
+        chosen |= (turns.running(valid & (letter == ch)) > 0).astype(np.int64) << ch
+    won = (chosen & word[turns.of]) == word[turns.of]
+    finished = won | (left <= 0)
+    turn_bad |= finished & ~turns.last
+    bad[turns.at] = turn_bad
+
+    ends, end_bad = _check_ends(records, turns, finished, won.astype(np.int64))
+    bad[ends] = end_bad
+    return bad, len(turns.starts)
+
+
+def _check_updown(records):
+    import numpy as np
+    turns = _Turns(records)
+    bad = np.zeros(len(records), dtype=bool)
+    heads = records[turns.starts]
+    secret = heads['b'].astype(np.int64)
+    bad[turns.starts] = (secret < heads['c']) | (secret > heads['d'])
+
+    t = records[turns.at]
+    guess = t['b'].astype(np.int64)
+    expected = np.where(guess < secret[turns.of], UPDOWN_CODES["UP"],
+                        np.where(guess > secret[turns.of], UPDOWN_CODES["DOWN"], UPDOWN_CODES["CORRECT"]))
+    finished = expected == UPDOWN_CODES["CORRECT"]
+    turn_bad = (t['c'] != expected) | (t['d'] != turns.ordinal + 1) | (finished & ~turns.last)
+    bad[turns.at] = turn_bad
+
+    ends, end_bad = _check_ends(records, turns, finished, np.zeros(len(turns.at), dtype=np.int64))
+    bad[ends] = end_bad
+    return bad, len(turns.starts)
+
+
+CHECKS = {HANGMAN: _check_hangman, SNAKE: _check_snake, UPDOWN: _check_updown}
+
+
+def replay(records):
+    """기록을 게임 규칙대로 다시 계산해 결과가 같은지 확인합니다.
+
+    반환값: events, games, mismatches (맞지 않는 기록 수), first_mismatch (첫 위치 또는 None),
+    by_game (게임 이름 -> games/events/mismatches), seconds, events_per_second
+    """
+    import numpy as np
+    started = time.perf_counter()
+    kind, game = records['kind'], records['game']
+    # 게임은 하나씩 차례로 기록되므로, 각 기록은 바로 앞 START 의 게임에 속해야 합니다.
+    starts = np.flatnonzero(kind == START)
+    owner = np.cumsum(kind == START) - 1
+    bad = (owner < 0) | (kind < START) | (kind > JUMP)
+    if len(starts):
+        bad |= game != game[starts][np.maximum(owner, 0)]
+    summary = {}
+    for game_type, check in CHECKS.items():
+        selected = np.flatnonzero((game == game_type) & ~bad)
+        if not len(selected):
+            continue
+        game_bad, games = check(records[selected])
+        bad[selected[game_bad]] = True
+        summary[GAME_NAMES[game_type]] = {'games': games, 'events': len(selected), 'mismatches': int(game_bad.sum())}
+    seconds = time.perf_counter() - started
+    mismatches = np.flatnonzero(bad)
+    return {
+        'events': len(records),
+        'games': sum(s['games'] for s in summary.values()),
+        'mismatches': len(mismatches),
+        'first_mismatch': int(mismatches[0]) if len(mismatches) else None,
+        'by_game': summary,
+        'seconds': seconds,
+        'events_per_second': len(records) / seconds if seconds else float("inf"),
+    }
+
+
+def describe(record):
+    kind = KIND_NAMES.get(int(record['kind']), "?")
+    game = GAME_NAMES.get(int(record['game']), "?")
+    return f"{game:7s} {kind:5s} a={record['a']} b={record['b']} c={record['c']} d={record['d']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 기록 파일을 다시 계산해 결과가 같은지 확인 (numpy 필요)")
+    parser.add_argument("paths", nargs="+", help="기록 파일 (게임의 --log 또는 GAME_LOG 로 만든 파일)")
+    parser.add_argument("--show", type=int, default=0, metavar="N", help="처음 N 개 기록을 출력")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.paths:
+        try:
+            records, truncated = read_log(path)
+        except (OSError, ValueError) as e:
+            print(e)
+            failed = True
+            continue
+        for index in range(min(args.show, len(records))):
+            print(f"{index:8d} {describe(records[index])}")
+        result = replay(records)
+        print(f"{path}: 기록 {result['events']:,}개, 게임 {result['games']:,}판, 불일치 {result['mismatches']:,}개 "
+              f"({result['seconds'] * 1000:.1f} ms, {result['events_per_second']:,.0f} events/s)")
+        for name, s in result['by_game'].items():
+            print(f"  {name:7s} 게임 {s['games']:,}판, 기록 {s['events']:,}개, 불일치 {s['mismatches']:,}개")
+        if truncated:
+            print(f"  끝의 덜 쓴 기록 {truncated}바이트는 건너뛰었습니다.")
+        if result['mismatches']:
+            index = result['first_mismatch']
+            print(f"  첫 불일치 #{index}: {describe(records[index])}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,119 @@
-
 import tkinter as tk
 from tkinter import messagebox
-import requests
+import argparse
+import os
 import random
-from PIL import Image, ImageTk
-from io import BytesIO
+
+# PIL 과 concurrent.futures 는 창을 띄운 뒤 처음 쓰일 때 가져옵니다. (main.py 의 시작 시간 예산 참고)
+import tracing
+from game_log import END, HANGMAN, START, TURN, letter_mask, open_log
+from hangman_solver import normalize
+from http_client import default_client
+from pokemon_cache import default_cache
+
+POLL_MS = 50  # 작업 스레드 결과를 확인하는 간격
 
 class HangmanGame:
-    def __init__(self, root):
+    def __init__(self, root, log=None):
         self.root = root
+        self.log = log  # game_log.EventLog: 라운드마다 단어와 고른 글자, 결과를 남깁니다.
         self.root.title("행맨 게임")
         self.pokemon_name = ""
+        self.pokemon_id = None
         self.guesses_left = 8
         self.wrong_guesses = 0
         self.guessed_letters = set()
         self.original_pokemon_image = None
         self.pokemon_image_on_canvas = None
+        self.image_scaler = None
+        # 네트워크 작업은 모두 작업 스레드에서 하고, 결과는 root.after 로 확인합니다.
+        from concurrent.futures import ThreadPoolExecutor
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.round_id = 0
+        self.sprite_future = None
+        self.next_round = self.executor.submit(self.fetch_random_pokemon)
         self.setup_game()
 
     def setup_game(self):
-        self.fetch_random_pokemon()
         self.create_widgets()
+        self.start_round()
+
+    def enable_letters(self):
+        for letter in self.disabled_letters:
+            self.letter_buttons[letter].config(state=tk.NORMAL)
+        self.disabled_letters.clear()
+
+    def disable_letter(self, letter):
+        if letter not in self.disabled_letters:
+            self.letter_buttons[letter].config(state=tk.DISABLED)
+            self.disabled_letters.add(letter)
+
+    def disable_all_letters(self):
+        for letter in self.letter_buttons:
+            self.disable_letter(letter)
 
     def fetch_random_pokemon(self):
+        """(작업 스레드) 무작위 1세대 포켓몬의 데이터를 가져오고, 스프라이트도 캐시에 미리 받아 둡니다."""
+        cache = default_cache()
+        pokemon_data = cache.fetch_pokemon(random.randint(1, 151))
+        try:
+            cache.fetch_sprite(pokemon_data)
+        except (OSError, ValueError) as e:
+            print(f"이미지 미리 받기 실패: {e}")
+        return pokemon_data
+
+    def load_sprite(self, pokemon_data):
+        """(작업 스레드) 스프라이트를 받아 PIL Image 로 디코딩합니다."""
+        image_data = default_cache().fetch_sprite(pokemon_data)
+        if image_data is None:
+            return None
+        from io import BytesIO
+        from PIL import Image
+        with tracing.span("sprite.decode", bytes=len(image_data)):
+            image = Image.open(BytesIO(image_data))
+            image.load()
+        return image
+
+    def when_done(self, future, callback, round_id=None):
+        """future 가 끝나면 메인 스레드에서 callback(future) 를 부릅니다. 그 사이 라운드가 바뀌면 버립니다."""
+        if round_id is None:
+            round_id = self.round_id
+        if round_id != self.round_id:
+            return
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(POLL_MS, self.when_done, future, callback, round_id)
+
+    def start_round(self):
+        self.round_id += 1
+        round_future, self.next_round = self.next_round, None
+        if not round_future.done():
+            # 미리 받아 둔 포켓몬이 없을 때만 버튼을 잠그고 기다립니다.
+            self.disable_all_letters()
+            self.word_label.config(text="포켓몬을 불러오는 중...")
+        self.when_done(round_future, self.begin_round)
+
+    def begin_round(self, future):
         try:
-            random_id = random.randint(1, 151)
-            response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{random_id}")
-            response.raise_for_status()
-            pokemon_data = response.json()
-            self.pokemon_name = pokemon_data["name"].replace("-", "").upper()
-        except requests.exceptions.RequestException as e:
+            pokemon_data = future.result()
+            self.pokemon_id = pokemon_data["id"]
+            self.pokemon_name = normalize(pokemon_data["name"])
+            # 이번 라운드 스프라이트는 지금부터 받아 두고, 5번째 오답 때 바로 씁니다.
+            self.sprite_future = self.executor.submit(self.load_sprite, pokemon_data)
+        except (OSError, ValueError) as e:
+            self.pokemon_id = None
             self.pokemon_name = "PYTHON" # Fallback
+            self.sprite_future = None
             print(f"API 요청 실패: {e}")
 
+        # 이번 라운드를 하는 동안 다음 라운드 포켓몬을 미리 가져옵니다.
+        self.next_round = self.executor.submit(self.fetch_random_pokemon)
+        if self.log:
+            self.log.record(START, HANGMAN, 0, self.pokemon_id or 0, self.guesses_left, letter_mask(self.pokemon_name))
+        self.enable_letters()
+        self.update_word_display()
+
     def create_widgets(self):
         # Configure grid layout
         self.root.grid_rowconfigure(0, weight=1)
@@ -58,13 +139,16 @@ class HangmanGame:
         for i in range(4):
             button_frame.grid_rowconfigure(i, weight=1)
 
+        # 글자 -> 버튼. 버튼 상태는 이 맵으로만 바꾸고, 비활성화된 글자는 disabled_letters 에 기록합니다.
+        self.letter_buttons = {}
+        self.disabled_letters = set()
         for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            button = tk.Button(button_frame, text=letter, command=lambda l=letter: self.guess_letter(l))
+            button = tk.Button(button_frame, text=letter, command=lambda l=letter: self.guess_letter(l), state=tk.DISABLED)
             row = (ord(letter) - ord('A')) // 7
             col = (ord(letter) - ord('A')) % 7
             button.grid(row=row, column=col, sticky="nsew", padx=2, pady=2)
-        
-        self.update_word_display()
+            self.letter_buttons[letter] = button
+            self.disabled_letters.add(letter)
 
     def guess_letter(self, letter):
         if letter in self.guessed_letters:
@@ -72,7 +156,8 @@ class HangmanGame:
 
         self.guessed_letters.add(letter)
 
-        if letter in self.pokemon_name:
+        hit = letter in self.pokemon_name
+        if hit:
             self.update_word_display()
         else:
             self.guesses_left -= 1
@@ -80,14 +165,10 @@ class HangmanGame:
             self.guesses_label.config(text=f"남은 기회: {self.guesses_left}")
             if self.wrong_guesses == 5:
                 self.show_pokemon_image()
+        if self.log:
+            self.log.record(TURN, HANGMAN, ord(letter), hit, self.guesses_left)
 
-        # Disable the button
-        for child in self.root.winfo_children():
-            if isinstance(child, tk.Frame):
-                for button in child.winfo_children():
-                    if button["text"] == letter:
-                        button.config(state=tk.DISABLED)
-        
+        self.disable_letter(letter)
         self.check_game_over()
 
     def update_word_display(self):
@@ -95,57 +176,63 @@ class HangmanGame:
         self.word_label.config(text=display_word)
 
     def show_pokemon_image(self):
-        try:
-            response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{self.pokemon_name.lower()}")
-            response.raise_for_status()
-            pokemon_data = response.json()
-            image_url = pokemon_data["sprites"]["front_default"]
-
-            image_response = requests.get(image_url)
-            self.original_pokemon_image = Image.open(BytesIO(image_response.content))
-            self.redraw_pokemon_image()
-        except requests.exceptions.RequestException as e:
-            print(f"이미지 로드 실패: {e}")
-
-    def redraw_pokemon_image(self, event=None):
-        if not self.original_pokemon_image:
+        if self.sprite_future is None:
             return
+        self.when_done(self.sprite_future, self.on_sprite_ready)
 
-        canvas_width = self.image_canvas.winfo_width()
-        canvas_height = self.image_canvas.winfo_height()
-
-        if canvas_width < 2 or canvas_height < 2:
+    def on_sprite_ready(self, future):
+        try:
+            self.original_pokemon_image = future.result()
+        except (OSError, ValueError) as e:
+            print(f"이미지 로드 실패: {e}")
             return
-
-        img_width, img_height = self.original_pokemon_image.size
-        if img_width == 0 or img_height == 0:
+        if self.original_pokemon_image is None:
             return
-            
-        ratio = min(canvas_width / img_width, canvas_height / img_height)
-        new_width = int(img_width * ratio)
-        new_height = int(img_height * ratio)
+        from PIL import ImageTk
+        from image_scaler import DebouncedScaler
+        self.image_scaler = DebouncedScaler(
+            self.original_pokemon_image,
+            draw=self.draw_pokemon_frame,
+            schedule=self.root.after,
+            cancel=self.root.after_cancel,
+            convert=ImageTk.PhotoImage,
+        )
+        self.image_scaler.render_now((self.image_canvas.winfo_width(), self.image_canvas.winfo_height()))
 
-        if new_width < 1 or new_height < 1:
+    def redraw_pokemon_image(self, event=None):
+        # <Configure> 가 연달아 와도 미리보기는 가끔, 고품질 렌더링은 크기 조절이 멈춘 뒤 한 번만 합니다.
+        if not self.image_scaler:
             return
-
-        resized_image = self.original_pokemon_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.pokemon_image = ImageTk.PhotoImage(resized_image)
-
-        if self.pokemon_image_on_canvas:
-            self.image_canvas.delete(self.pokemon_image_on_canvas)
-        
-        self.pokemon_image_on_canvas = self.image_canvas.create_image(
-            canvas_width / 2,
-            canvas_height / 2,
-            image=self.pokemon_image
-        )
+        if event is not None:
+            box = (event.width, event.height)
+        else:
+            box = (self.image_canvas.winfo_width(), self.image_canvas.winfo_height())
+        self.image_scaler.resize(box)
+
+    def draw_pokemon_frame(self, frame):
+        self.pokemon_image = frame  # PhotoImage 참조 유지
+        x = self.image_canvas.winfo_width() / 2
+        y = self.image_canvas.winfo_height() / 2
+        with tracing.span("canvas.draw"):
+            if self.pokemon_image_on_canvas:
+                # 캔버스 아이템은 새로 만들지 않고 이미지와 위치만 바꿉니다.
+                self.image_canvas.itemconfig(self.pokemon_image_on_canvas, image=frame)
+                self.image_canvas.coords(self.pokemon_image_on_canvas, x, y)
+            else:
+                self.pokemon_image_on_canvas = self.image_canvas.create_image(x, y, image=frame)
 
     def check_game_over(self):
         if "_" not in self.word_label.cget("text"):
+            self.log_end(won=True)
             self.show_win_message()
         elif self.guesses_left == 0:
+            self.log_end(won=False)
             self.show_loss_message()
 
+    def log_end(self, won):
+        if self.log:
+            self.log.record(END, HANGMAN, int(won), len(self.guessed_letters))
+
     def show_win_message(self):
         self.word_label.config(text="승리!")
         self.ask_play_again()
@@ -162,19 +249,39 @@ class HangmanGame:
             self.root.quit()
 
     def restart_game(self):
-        # 기존 위젯 모두 제거
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        if self.image_scaler:
+            self.image_scaler.close()
+            self.image_scaler = None
 
-        # 게임 상태 초기화 및 위젯 재생성
+        # 위젯은 그대로 두고 게임 상태와 표시 내용만 초기화합니다.
         self.guesses_left = 8
         self.wrong_guesses = 0
         self.guessed_letters = set()
+        if self.pokemon_image_on_canvas:
+            self.image_canvas.delete(self.pokemon_image_on_canvas)
         self.original_pokemon_image = None
         self.pokemon_image_on_canvas = None
-        self.setup_game()
+        self.pokemon_image = None
+        self.guesses_label.config(text=f"남은 기회: {self.guesses_left}")
+        self.start_round()
+
+def main():
+    parser = argparse.ArgumentParser(description="포켓몬 행맨 게임")
+    parser.add_argument("--log", default=None, metavar="PATH",
+                        help="게임 기록 파일 (기본값: GAME_LOG 환경 변수, 없으면 기록하지 않음. game_log.py 로 재생)")
+    parser.add_argument("--stats", action="store_true", default=bool(os.environ.get("GAME_STATS")),
+                        help="종료할 때 포켓몬 캐시와 HTTP 요청 통계 출력 (GAME_STATS=1 과 같음)")
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     root = tk.Tk()
-    game = HangmanGame(root)
+    game = HangmanGame(root, log=open_log(args.log))
     root.mainloop()
+    if game.log:
+        game.log.close()
+        print(f"게임 기록: {game.log.path} (이벤트 {game.log.count:,}개)")
+    if args.stats:
+        print(f"포켓몬 캐시: {default_cache().stats()}")
+        print(f"HTTP: {default_client().stats()}")
+
+if __name__ == "__main__":
+    main()
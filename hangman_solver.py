@@ -0,0 +1,142 @@
+import math
+import string
+
+LIVES = 8  # HangmanGame 의 guesses_left 와 같습니다.
+
+# PokéAPI 의 1세대 포켓몬 이름 (id 1..151 순서)
+GEN1_NAMES = """
+bulbasaur ivysaur venusaur charmander charmeleon charizard squirtle wartortle blastoise caterpie
+metapod butterfree weedle kakuna beedrill pidgey pidgeotto pidgeot rattata raticate
+spearow fearow ekans arbok pikachu raichu sandshrew sandslash nidoran-f nidorina
+nidoqueen nidoran-m nidorino nidoking clefairy clefable vulpix ninetales jigglypuff wigglytuff
+zubat golbat oddish gloom vileplume paras parasect venonat venomoth diglett
+dugtrio meowth persian psyduck golduck mankey primeape growlithe arcanine poliwag
+poliwhirl poliwrath abra kadabra alakazam machop machoke machamp bellsprout weepinbell
+victreebel tentacool tentacruel geodude graveler golem ponyta rapidash slowpoke slowbro
+magnemite magneton farfetchd doduo dodrio seel dewgong grimer muk shellder
+cloyster gastly haunter gengar onix drowzee hypno krabby kingler voltorb
+electrode exeggcute exeggutor cubone marowak hitmonlee hitmonchan lickitung koffing weezing
+rhyhorn rhydon chansey tangela kangaskhan horsea seadra goldeen seaking staryu
+starmie mr-mime scyther jynx electabuzz magmar pinsir tauros magikarp gyarados
+lapras ditto eevee vaporeon jolteon flareon porygon omanyte omastar kabuto
+kabutops aerodactyl snorlax articuno zapdos moltres dratini dragonair dragonite mewtwo
+mew
+""".split()
+
+
+def normalize(name):
+    """HangmanGame 과 같은 방식으로 이름을 정리합니다: '-' 제거, 대문자."""
+    return name.replace("-", "").upper()
+
+
+class NameIndex:
+    """(글자, 위치) -> 그 위치에 그 글자가 있는 이름들의 비트셋 색인.
+
+    이름 i 는 비트 1 << i 입니다. 후보 걸러내기와 후보 나누기가 모두 정수의 &, ~ 연산이 됩니다.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.by_length = {}
+        self.at = {}        # (글자, 위치) -> 비트셋
+        self.contains = {}  # 글자 -> 비트셋
+        for i, name in enumerate(self.names):
+            bit = 1 << i
+            self.by_length[len(name)] = self.by_length.get(len(name), 0) | bit
+            for position, letter in enumerate(name):
+                self.at[letter, position] = self.at.get((letter, position), 0) | bit
+                self.contains[letter] = self.contains.get(letter, 0) | bit
+
+    def matching(self, candidates, letter, positions, length):
+        """글자 letter 가 정확히 positions 위치에만 있는 후보만 남깁니다."""
+        if not positions:
+            return candidates & ~self.contains.get(letter, 0)
+        for position in range(length):
+            mask = self.at.get((letter, position), 0)
+            candidates &= mask if position in positions else ~mask
+        return candidates
+
+    def partition(self, candidates, letter, length):
+        """letter 를 불렀을 때 나올 수 있는 공개 패턴별로 후보를 나눈 비트셋 목록을 반환합니다."""
+        groups = [candidates]
+        for position in range(length):
+            mask = self.at.get((letter, position), 0)
+            if not candidates & mask:
+                continue
+            split = []
+            for group in groups:
+                for part in (group & mask, group & ~mask):
+                    if part:
+                        split.append(part)
+            groups = split
+        return groups
+
+    def members(self, candidates):
+        return [name for i, name in enumerate(self.names) if candidates >> i & 1]
+
+
+class HangmanSolver:
+    """남은 후보 이름에 대한 정보 엔트로피가 가장 큰 글자를 고르는 행맨 봇.
+
+    엔트로피가 같으면 틀릴 확률(그 글자가 없는 후보의 비율)이 낮은 글자를, 그래도 같으면 알파벳 순으로 고릅니다.
+    색인에 없는 단어라 후보가 모두 사라지면 전체 이름에서의 글자 빈도로 고릅니다.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.reset(0)
+
+    def reset(self, length):
+        self.length = length
+        self.candidates = self.index.by_length.get(length, 0)
+        self.guessed = set()
+
+    def choose(self):
+        total = self.candidates.bit_count()
+        if not total:
+            return self._most_common()
+        best = None
+        for letter in string.ascii_uppercase:
+            if letter in self.guessed:
+                continue
+            groups = self.index.partition(self.candidates, letter, self.length)
+            entropy = 0.0
+            for group in groups:
+                p = group.bit_count() / total
+                entropy -= p * math.log2(p)
+            miss = (self.candidates & ~self.index.contains.get(letter, 0)).bit_count() / total
+            key = (-entropy, miss, letter)
+            if best is None or key < best:
+                best = key
+        return best[2]
+
+    def _most_common(self):
+        """후보가 하나도 없을 때(색인에 없는 단어) 전체 이름에서 가장 많은 이름에 든 글자를 고릅니다."""
+        letters = [letter for letter in string.ascii_uppercase if letter not in self.guessed]
+        return min(letters, key=lambda letter: (-self.index.contains.get(letter, 0).bit_count(), letter))
+
+    def update(self, letter, positions):
+        """letter 를 부른 결과(공개된 위치 집합)를 반영합니다."""
+        self.guessed.add(letter)
+        self.candidates = self.index.matching(self.candidates, letter, positions, self.length)
+
+
+def play(solver, word, lives=LIVES):
+    """word 에 대해 게임 한 판을 진행하고 (승리 여부, 틀린 횟수, 고른 횟수) 를 반환합니다."""
+    solver.reset(len(word))
+    revealed = set()
+    wrong = decisions = 0
+    while wrong < lives and len(revealed) < len(word):
+        letter = solver.choose()
+        decisions += 1
+        positions = {i for i, c in enumerate(word) if c == letter}
+        solver.update(letter, positions)
+        if positions:
+            revealed |= positions
+        else:
+            wrong += 1
+    return len(revealed) == len(word), wrong, decisions
+
+
+def gen1_index():
+    return NameIndex(normalize(name) for name in GEN1_NAMES)
@@ -0,0 +1,184 @@
+import random
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
+
+import tracing
+
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+RETRIES = 2            # 실패 후 다시 시도하는 횟수
+BACKOFF = 0.25         # 재시도 대기 시간: BACKOFF * 2**시도 (+ 무작위 흔들림)
+PER_HOST = 4           # 호스트마다 동시에 보내는 요청 수 상한
+RETRY_STATUS = {429, 500, 502, 503, 504}
+VALIDATOR_ENTRIES = 256
+VALIDATOR_MAX_BODY = 1024 * 1024
+CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+class HttpClient:
+    """세 게임이 함께 쓰는 HTTP 계층.
+
+    - requests.Session 하나로 keep-alive 연결을 재사용합니다.
+    - 호스트마다 세마포어로 동시 요청 수를 제한합니다.
+    - ETag/Last-Modified 를 기억해 두었다가 같은 URL 은 조건부 요청으로 다시 확인하고, 304 면 기억한 본문을 씁니다.
+    - 연결 오류, 시간 초과, 5xx/429 는 지수 백오프로 다시 시도합니다.
+    - get(deadline=...) 을 주면 그 시각(time.monotonic)을 넘지 않도록 시간 제한을 줄이고, 기다릴 시간이 없으면 재시도하지 않습니다.
+    - 요청마다 호스트, 상태, 시도 횟수, 걸린 시간을 기록합니다 (stats()).
+    실패는 requests.RequestException (OSError 의 하위 클래스) 로 전달됩니다.
+    """
+
+    def __init__(self, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), retries=RETRIES, backoff=BACKOFF, per_host=PER_HOST,
+                 headers=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.per_host = per_host
+        # requests 는 가져오는 데 100ms 가까이 걸리므로 첫 클라이언트를 만들 때 가져옵니다.
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._errors = (requests.ConnectionError, requests.Timeout)
+        self._timeout_error = requests.Timeout
+        self._http_error = requests.HTTPError
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=per_host, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+        self.validators = OrderedDict()  # url -> (ETag, Last-Modified, 본문)
+        self.records = deque(maxlen=1000)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_slot(self, host):
+        with self._lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def _remember(self, url, response):
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if not (etag or modified) or len(response.content) > VALIDATOR_MAX_BODY:
+            return
+        with self._lock:
+            self.validators[url] = (etag, modified, response.content)
+            self.validators.move_to_end(url)
+            if len(self.validators) > VALIDATOR_ENTRIES:
+                self.validators.popitem(last=False)
+
+    def _attempt_timeout(self, url, deadline):
+        """이번 시도의 (연결, 읽기) 시간 제한. deadline 이 지났으면 requests.Timeout 을 냅니다."""
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._timeout_error(f"기한이 지나 요청하지 않았습니다: {url}")
+        if isinstance(self.timeout, tuple):
+            return tuple(min(part, remaining) for part in self.timeout)
+        return min(self.timeout, remaining)
+
+    def _last_attempt(self, attempt, delay, deadline):
+        """재시도 횟수를 다 썼거나, 기한 안에 delay 만큼 기다린 뒤 다시 시도할 여유가 없으면 True."""
+        return attempt >= self.retries or (deadline is not None and time.monotonic() + delay >= deadline)
+
+    def get(self, url, headers=None, deadline=None):
+        """url 의 본문 바이트를 반환합니다.
+
+        deadline (time.monotonic 기준 시각) 을 주면 재시도와 백오프를 포함한 전체 요청이 대략 그 시각 안에 끝납니다.
+        (requests 의 읽기 제한은 소켓 읽기 한 번마다 적용되므로 아주 느리게 흘러오는 응답은 조금 넘길 수 있습니다)
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            known = self.validators.get(url)
+        request_headers = dict(headers or {})
+        if known:
+            etag, modified, _ = known
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if modified:
+                request_headers["If-Modified-Since"] = modified
+
+        start = time.perf_counter()
+        slot = self._host_slot(host)
+        status = None
+        attempt = 0
+        try:
+            while True:
+                delay = self.backoff * 2 ** attempt * (0.5 + random.random())
+                try:
+                    timeout = self._attempt_timeout(url, deadline)
+                    # 재시도를 기다리는 동안에는 자리를 비켜 다른 요청이 쓰게 합니다.
+                    with slot, tracing.span("http.request", url=url, attempt=attempt + 1) as request_span:
+                        response = self.session.get(url, headers=request_headers, timeout=timeout)
+                        request_span.set(status=response.status_code, bytes=len(response.content))
+                    status = response.status_code
+                    if status not in RETRY_STATUS or self._last_attempt(attempt, delay, deadline):
+                        break
+                except self._errors:
+                    if self._last_attempt(attempt, delay, deadline):
+                        raise
+                with tracing.span("http.backoff", attempt=attempt + 1):
+                    time.sleep(delay)
+                attempt += 1
+            if status == 304:
+                if known:
+                    with self._lock:
+                        if url in self.validators:
+                            self.validators.move_to_end(url)  # 자주 다시 확인하는 URL 이 LRU 에서 밀려나지 않게 합니다.
+                    return known[2]
+                # 기억한 본문 없이 304 를 받으면 돌려줄 본문이 없습니다. 호출한 쪽이 조건부 헤더를 붙였다면 빼고 다시 받습니다.
+                plain = {k: v for k, v in request_headers.items() if k.lower() not in CONDITIONAL_HEADERS}
+                if len(plain) < len(request_headers):
+                    return self.get(url, plain, deadline)
+                raise self._http_error(f"304 Not Modified 이지만 기억한 본문이 없습니다: {url}", response=response)
+            response.raise_for_status()
+            self._remember(url, response)
+            return response.content
+        finally:
+            self._record(host, status, attempt + 1, time.perf_counter() - start)
+
+    def get_text(self, url, headers=None, deadline=None):
+        return self.get(url, headers, deadline).decode("utf-8", errors="replace")
+
+    def _record(self, host, status, attempts, elapsed):
+        with self._lock:
+            self.records.append((host, status, attempts, elapsed))
+
+    def stats(self):
+        """호스트별 요청 수, 오류 수, 재시도 수, 304 수, 지연 중앙값/p95 (ms)."""
+        with self._lock:
+            records = list(self.records)
+        summary = {}
+        for host in sorted({r[0] for r in records}):
+            rows = [r for r in records if r[0] == host]
+            times = sorted(r[3] * 1000 for r in rows)
+            summary[host] = {
+                'requests': len(rows),
+                'errors': sum(1 for r in rows if r[1] is None or r[1] >= 400),
+                'retries': sum(r[2] - 1 for r in rows),
+                'not_modified': sum(1 for r in rows if r[1] == 304),
+                'median_ms': statistics.median(times),
+                'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))],
+            }
+        return summary
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def default_client():
+    """프로세스 전역 HttpClient 를 반환합니다."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
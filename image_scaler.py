@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+
+from PIL import Image
+
+import tracing
+
+PREVIEW_FILTER = Image.Resampling.NEAREST
+FINAL_FILTER = Image.Resampling.LANCZOS
+
+
+def fit_size(image_size, box):
+    """비율을 유지하면서 image_size 를 box(너비, 높이) 안에 맞춘 크기를 반환합니다. 그릴 수 없으면 None."""
+    img_width, img_height = image_size
+    box_width, box_height = box
+    if img_width == 0 or img_height == 0 or box_width < 2 or box_height < 2:
+        return None
+    ratio = min(box_width / img_width, box_height / img_height)
+    new_width = int(img_width * ratio)
+    new_height = int(img_height * ratio)
+    if new_width < 1 or new_height < 1:
+        return None
+    return new_width, new_height
+
+
+class DebouncedScaler:
+    """<Configure> 이벤트가 몰려올 때 이미지 크기 조절을 묶어서 처리합니다.
+
+    - 창 크기를 바꾸는 동안에는 preview_interval 마다 한 번만 값싼 NEAREST 미리보기를 그립니다.
+    - 마지막 이벤트 후 settle_ms 동안 조용하면 LANCZOS 로 한 번만 고품질로 다시 그립니다.
+    - 고품질 결과는 크기별로 최대 cache_size 개까지 기억해 같은 크기로 돌아오면 바로 씁니다.
+
+    draw(frame) 는 변환된 결과를 화면에 놓는 함수, convert 는 PIL Image 를 화면용 객체
+    (예: ImageTk.PhotoImage)로 바꾸는 함수이고, schedule/cancel 은 root.after/after_cancel 과 같은 형태입니다.
+    """
+
+    def __init__(self, image, draw, schedule, cancel, convert=None, settle_ms=150, preview_interval=1 / 30,
+                 cache_size=8, clock=time.perf_counter):
+        self.image = image
+        self.draw = draw
+        self.schedule = schedule
+        self.cancel = cancel
+        self.convert = convert or (lambda frame: frame)
+        self.settle_ms = settle_ms
+        self.preview_interval = preview_interval
+        self.cache_size = cache_size
+        self.clock = clock
+        self.cache = OrderedDict()
+        self.pending = None
+        self.pending_size = None
+        self.last_preview = float("-inf")
+
+    def _cached(self, size):
+        frame = self.cache.get(size)
+        if frame is not None:
+            self.cache.move_to_end(size)
+        return frame
+
+    def _convert(self, image):
+        with tracing.span("image.convert", size=image.size):
+            return self.convert(image)
+
+    def _render(self, size):
+        with tracing.span("image.resize", size=size, filter="LANCZOS"):
+            image = self.image.resize(size, FINAL_FILTER)
+        frame = self._convert(image)
+        self.cache[size] = frame
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return frame
+
+    def _cancel_pending(self):
+        if self.pending is not None:
+            self.cancel(self.pending)
+            self.pending = None
+
+    def resize(self, box):
+        """<Configure> 마다 부릅니다."""
+        size = fit_size(self.image.size, box)
+        if size is None:
+            return
+        frame = self._cached(size)
+        if frame is not None:
+            self._cancel_pending()
+            self.draw(frame)
+            return
+        now = self.clock()
+        if now - self.last_preview >= self.preview_interval:
+            self.last_preview = now
+            with tracing.span("image.resize", size=size, filter="NEAREST"):
+                image = self.image.resize(size, PREVIEW_FILTER)
+            self.draw(self._convert(image))
+        self._cancel_pending()
+        self.pending_size = size
+        self.pending = self.schedule(self.settle_ms, self._settle)
+
+    def _frame(self, size):
+        frame = self._cached(size)
+        return frame if frame is not None else self._render(size)
+
+    def _settle(self):
+        self.pending = None
+        self.draw(self._frame(self.pending_size))
+
+    def close(self):
+        """예약된 고품질 렌더링을 취소합니다. (캔버스를 없애기 전에 부릅니다)"""
+        self._cancel_pending()
+
+    def render_now(self, box):
+        """미리보기 없이 바로 고품질로 그립니다. (처음 이미지를 보여 줄 때)"""
+        size = fit_size(self.image.size, box)
+        if size is None:
+            return
+        self._cancel_pending()
+        self.draw(self._frame(size))
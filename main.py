@@ -0,0 +1,92 @@
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+
+import tracing
+
+# 이름 -> (모듈, 표시 이름, 설명). 고른 게임의 모듈만 가져옵니다.
+GAMES = {
+    'hangman': ("hangman_game", "HangmanGame", "포켓몬 행맨"),
+    'snake': ("snake_ladder_gui", "SnakeLadderGUI", "포켓몬 뱀 사다리"),
+    'updown': ("up_down_game", "UpDownGame", "업다운 숫자 맞히기"),
+    'calc': ("calculator", "Calculator", "계산기"),
+}
+
+# 시작 시간 예산 (ms). benchmarks/bench_startup.py 가 이 값과 비교합니다.
+LAUNCHER_BUDGET_MS = 60         # python main.py --list 의 import 합계
+TIME_TO_WINDOW_BUDGET_MS = {    # main.py <게임> --measure 의 창이 처음 그려질 때까지
+    'hangman': 250,
+    'snake': 400,
+    'updown': 250,
+    'calc': 150,
+}
+
+
+def measure_time_to_window(name):
+    """첫 mainloop 가 한가해지는(창이 처음 그려진) 순간까지의 시간을 출력하고 창을 닫습니다."""
+    import tkinter as tk
+    original = tk.Tk.mainloop
+
+    def mainloop(widget, *args):
+        def report():
+            elapsed = (time.perf_counter() - STARTED) * 1000
+            print(f"time-to-window {name}: {elapsed:.1f} ms (예산 {TIME_TO_WINDOW_BUDGET_MS[name]} ms)", flush=True)
+            widget.destroy()
+        widget.after_idle(widget.after, 0, report)
+        original(widget, *args)
+
+    tk.Tk.mainloop = mainloop
+
+
+def run_game(name, game_args):
+    module_name = GAMES[name][0]
+    sys.argv = [module_name + ".py", *game_args]
+    with tracing.span("game.import", game=name):
+        module = importlib.import_module(module_name)
+    module.main()
+
+
+def choose_game():
+    """게임 목록 창을 띄우고 고른 게임 이름을 반환합니다. 창을 닫으면 None."""
+    import tkinter as tk
+    chosen = []
+    root = tk.Tk()
+    root.title("게임 선택")
+
+    def pick(name):
+        chosen.append(name)
+        root.destroy()
+
+    tk.Label(root, text="플레이할 게임을 고르세요", font=("Helvetica", 14)).pack(padx=20, pady=10)
+    for name, (_, class_name, title) in GAMES.items():
+        tk.Button(root, text=f"{title} ({class_name})", width=28, font=("Helvetica", 12),
+                  command=lambda name=name: pick(name)).pack(padx=20, pady=4)
+    root.mainloop()
+    return chosen[0] if chosen else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 런처", usage="%(prog)s [--list] [--measure] [게임 [게임 인자...]]")
+    parser.add_argument("game", nargs="?", choices=GAMES, help="바로 실행할 게임 (생략하면 선택 창)")
+    parser.add_argument("--list", action="store_true", help="게임 목록만 출력")
+    parser.add_argument("--measure", action="store_true", help="창이 처음 그려질 때까지의 시간을 출력하고 종료")
+    args, game_args = parser.parse_known_args()
+
+    if args.list:
+        for name, (module_name, class_name, title) in GAMES.items():
+            print(f"{name:8s} {class_name:15s} {title} ({module_name}.py)")
+        return
+    name = args.game or choose_game()
+    if name is None:
+        return
+    if args.measure:
+        measure_time_to_window(name)
+    run_game(name, game_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import argparse
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import tracing
+from http_client import default_client
+
+# Numbers API 가 안 될 때는 NUMBERS_API_FALLBACK_URL 의 대역 서버(python stand_in_server.py 등)를 씁니다.
+API_URLS = [url for url in (
+    os.environ.get("NUMBERS_API_URL", "http://numbersapi.com"),
+    os.environ.get("NUMBERS_API_FALLBACK_URL"),
+) if url]
+OFFLINE_RETRY = 30.0  # 모든 서버가 실패하면 이 시간(초) 동안은 네트워크 없이 저장된/계산한 사실만 씁니다.
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+NUMBER_RANGE = (1, 1000)
+
+
+def default_store_path():
+    """포켓몬 캐시와 같은 디렉터리(POKEMON_CACHE_DIR 또는 ~/.cache/pokemon_games)의 facts.sqlite3 경로."""
+    directory = os.environ.get("POKEMON_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "pokemon_games")
+    return os.path.join(directory, "facts.sqlite3")
+
+
+def offline_fact(number):
+    """네트워크 없이 계산할 수 있는 수학적 사실을 하나 만듭니다. 문장에는 항상 number 가 들어갑니다."""
+    divisors = [d for d in range(1, number + 1) if number % d == 0]
+    root = round(number ** 0.5)
+    candidates = [f"{number} is an {'even' if number % 2 == 0 else 'odd'} number."]
+    if number == 1:
+        candidates.append(f"{number} is neither prime nor composite.")
+    elif len(divisors) == 2:
+        candidates.append(f"{number} is a prime number.")
+    else:
+        candidates.append(f"{number} has {len(divisors)} divisors.")
+    if root > 1 and root * root == number:
+        candidates.append(f"{number} is the square of {root}.")
+    if sum(divisors[:-1]) == number:
+        candidates.append(f"{number} is a perfect number.")
+    if str(number) == str(number)[::-1] and number > 9:
+        candidates.append(f"{number} reads the same forwards and backwards.")
+    if number > 9:
+        candidates.append(f"The digits of {number} add up to {sum(int(c) for c in str(number))}.")
+    return random.choice(candidates)
+
+
+class FactStore:
+    """이미 받아 본 (숫자, 사실) 을 SQLite 파일에 모아 두어, 네트워크가 없을 때 다시 씁니다."""
+
+    def __init__(self, path=None):
+        self.path = path or default_store_path()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS facts (number INTEGER NOT NULL, fact TEXT NOT NULL, UNIQUE (number, fact))")
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def add(self, number, fact):
+        with self._connection() as conn:
+            conn.execute("INSERT OR IGNORE INTO facts (number, fact) VALUES (?, ?)", (number, fact))
+
+    def random_fact(self, number):
+        """number 에 대해 저장된 사실 중 하나를 반환합니다. 없으면 None."""
+        row = self._connection().execute(
+            "SELECT fact FROM facts WHERE number = ? ORDER BY random() LIMIT 1", (number,)).fetchone()
+        return row[0] if row else None
+
+    def count(self):
+        return self._connection().execute("SELECT count(*) FROM facts").fetchone()[0]
+
+
+class FactProvider:
+    """무작위 숫자와 그 숫자에 대한 사실을 미리 받아 두는 풀.
+
+    get() 은 기다리지 않고 바로 (숫자, 사실, 출처) 를 반환하며, 그 사이 백그라운드 스레드가
+    공용 HttpClient(연결 재사용, 재시도)로 pool_size 개가 될 때까지 다음 사실을 받아 둡니다.
+    출처는 'api' (서버), 'store' (예전에 받아 둔 사실), 'offline' (계산한 사실) 중 하나입니다.
+    """
+
+    def __init__(self, pool_size=8, store=None, urls=None, number_range=NUMBER_RANGE, workers=2, client=None):
+        self.pool_size = pool_size
+        self.store = store or FactStore()
+        self.urls = list(API_URLS if urls is None else urls)
+        self.number_range = number_range
+        self.client = client or default_client()
+        self.ready = deque()
+        self.in_flight = 0
+        self.offline_until = 0.0
+        self.counts = {'api': 0, 'store': 0, 'offline': 0}
+        self._lock = threading.Lock()
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._refill()
+
+    def _refill(self):
+        with self._lock:
+            missing = self.pool_size - len(self.ready) - self.in_flight
+            self.in_flight += max(0, missing)
+        for _ in range(missing):
+            self._executor.submit(self._produce)
+
+    def _produce(self):
+        try:
+            entry = self.fetch(random.randint(*self.number_range))
+            with self._lock:
+                self.ready.append(entry)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _download(self, number):
+        """서버들을 순서대로 시도해 사실 문장을 반환합니다. 모두 실패하면 None."""
+        if time.monotonic() < self.offline_until:
+            return None
+        for url in self.urls:
+            try:
+                with tracing.span("numbers.fetch", url=url, number=number):
+                    fact = self.client.get_text(f"{url}/{number}", headers=HEADERS).strip()
+                if fact:
+                    return fact
+            except OSError:  # requests.RequestException 포함
+                continue
+        self.offline_until = time.monotonic() + OFFLINE_RETRY
+        return None
+
+    def fetch(self, number):
+        """number 에 대한 (숫자, 사실, 출처) 를 만듭니다. (작업 스레드에서 부름)"""
+        fact = self._download(number)
+        if fact is not None:
+            self.store.add(number, fact)
+            return number, fact, 'api'
+        fact = self.store.random_fact(number)
+        if fact is not None:
+            return number, fact, 'store'
+        return number, offline_fact(number), 'offline'
+
+    def get(self):
+        """준비된 (숫자, 사실, 출처) 를 바로 반환합니다. 풀이 비었으면 네트워크 없이 저장된/계산한 사실을 씁니다."""
+        with self._lock:
+            entry = self.ready.popleft() if self.ready else None
+        if entry is None:
+            number = random.randint(*self.number_range)
+            fact = self.store.random_fact(number)
+            entry = (number, fact, 'store') if fact is not None else (number, offline_fact(number), 'offline')
+        self.counts[entry[2]] += 1
+        self._refill()
+        return entry
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Up-Down 게임용 숫자 사실 제공자")
+    parser.add_argument("--sample", type=int, default=5, help="풀에서 꺼내 볼 사실 수 (기본값: 5)")
+    args = parser.parse_args()
+
+    provider = FactProvider()
+    time.sleep(1.0)  # 백그라운드로 풀이 차는 것을 잠시 기다립니다.
+    for _ in range(args.sample):
+        number, fact, source = provider.get()
+        print(f"[{source}] {fact}")
+    print(f"저장된 사실 {provider.store.count()}개 ({provider.store.path})")
+    provider.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+
+# 파일 구성: 헤더 | 고정 폭 색인 (id 오름차순) | PNG 블롭들
+#   헤더 = 매직 4바이트, 버전, 항목 수
+#   색인 항목 = id, 이름(NAME_BYTES 바이트, 남는 곳은 0), 블롭 오프셋, 블롭 길이 (길이 0 은 스프라이트 없음)
+MAGIC = b"PKDX"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+NAME_BYTES = 24
+ENTRY = struct.Struct(f"<H{NAME_BYTES}sII")
+GAME_IDS = "1-898"  # 두 게임이 고르는 포켓몬 id 범위 (행맨 1..151, 뱀 사다리 1..898)
+CHECKPOINT = 50     # update_archive 가 새 항목 이만큼마다 묶음 파일을 다시 씁니다.
+
+
+def default_archive_path():
+    """POKEDEX_ARCHIVE 환경 변수 또는 저장소에 함께 두는 pokedex.pkdx 경로."""
+    return os.environ.get("POKEDEX_ARCHIVE") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokedex.pkdx")
+
+
+class PokedexArchive:
+    """build_archive 로 만든 묶음 파일을 mmap 으로 열어 id/이름으로 메타데이터와 스프라이트를 찾습니다.
+
+    파일을 통째로 읽거나 항목별로 파싱하지 않고, 색인에서 이진 탐색한 뒤 필요한 블롭만 잘라 냅니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path}: 포켓몬 묶음 파일이 아닙니다.")
+        self._names = None
+
+    def _entry(self, slot):
+        pokemon_id, name, offset, length = ENTRY.unpack_from(self._map, HEADER.size + slot * ENTRY.size)
+        return pokemon_id, name, offset, length
+
+    def _slot(self, pokemon_id):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_id = struct.unpack_from("<H", self._map, HEADER.size + mid * ENTRY.size)[0]
+            if mid_id < pokemon_id:
+                lo = mid + 1
+            elif mid_id > pokemon_id:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _find(self, key):
+        if isinstance(key, int) or str(key).isdigit():
+            return self._slot(int(key))
+        if self._names is None:
+            # 이름으로 찾는 일은 드물어서 처음 필요할 때 한 번만 사전을 만듭니다.
+            self._names = {self._entry(slot)[1].rstrip(b"\0").decode(): slot for slot in range(self.count)}
+        return self._names.get(str(key).lower())
+
+    def get_meta(self, key):
+        """pokemon_cache 와 같은 모양의 메타데이터 딕셔너리를 반환합니다. 없으면 None.
+
+        묶음 파일에는 스프라이트 URL 을 저장하지 않으므로 front_default 는 항상 None 입니다.
+        스프라이트는 get_sprite 로 (있을 때만) 묶음 파일에서 꺼냅니다.
+        """
+        slot = self._find(key)
+        if slot is None:
+            return None
+        pokemon_id, name, _, _ = self._entry(slot)
+        return {'id': pokemon_id, 'name': name.rstrip(b"\0").decode(), 'sprites': {'front_default': None}}
+
+    def get_sprite(self, key):
+        """스프라이트 PNG 바이트를 반환합니다. 없으면 None."""
+        slot = self._find(key)
+        if slot is None:
+            return None
+        _, _, offset, length = self._entry(slot)
+        return self._map[offset:offset + length] if length else None
+
+    def ids(self):
+        """저장된 포켓몬 id 를 오름차순으로 반환합니다."""
+        return [self._entry(slot)[0] for slot in range(self.count)]
+
+    def entries(self):
+        """저장된 모든 (메타데이터, PNG 바이트 또는 None) 을 id 순으로 반환합니다. (묶음 파일을 다시 만들 때 씁니다)"""
+        return [(self.get_meta(pokemon_id), self.get_sprite(pokemon_id)) for pokemon_id in self.ids()]
+
+    def close(self):
+        self._map.close()
+
+
+def build_archive(path, entries):
+    """(메타데이터, PNG 바이트 또는 None) 목록으로 묶음 파일을 만듭니다. 임시 파일에 쓴 뒤 바꿔치기합니다."""
+    entries = sorted(entries, key=lambda entry: entry[0]['id'])
+    blob_start = HEADER.size + ENTRY.size * len(entries)
+    index, blobs = [], []
+    offset = blob_start
+    for meta, sprite in entries:
+        name = meta['name'].encode()
+        if len(name) > NAME_BYTES:
+            raise ValueError(f"이름이 너무 깁니다: {meta['name']}")
+        sprite = sprite or b""
+        index.append(ENTRY.pack(meta['id'], name, offset if sprite else 0, len(sprite)))
+        blobs.append(sprite)
+        offset += len(sprite)
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        f.writelines(index)
+        f.writelines(blobs)
+    os.replace(temp, path)
+
+
+def update_archive(path, pokemon_ids, cache, checkpoint=CHECKPOINT):
+    """묶음 파일에 없는 pokemon_ids 를 cache(PokemonCache)로 받아 채워 넣고 (항목 수, 실패 목록) 을 반환합니다.
+
+    새 항목이 checkpoint 개 모일 때마다 파일을 다시 써 두므로, 중간에 끊겨도 그때까지 받은 것은 남고
+    다시 실행하면 없는 id 만 받습니다. 실패 목록은 (id, 예외) 입니다.
+    """
+    entries = []
+    if os.path.exists(path):
+        existing = PokedexArchive(path)
+        entries = existing.entries()
+        existing.close()
+    stored = {meta['id'] for meta, _ in entries}
+    failures = []
+    added = 0
+    for pokemon_id in pokemon_ids:
+        if pokemon_id in stored:
+            continue
+        try:
+            meta = cache.fetch_pokemon(pokemon_id)
+            entries.append((meta, cache.fetch_sprite(meta)))
+        except (OSError, ValueError) as e:
+            failures.append((pokemon_id, e))
+            continue
+        added += 1
+        if added % checkpoint == 0:
+            build_archive(path, entries)
+    if added % checkpoint or not os.path.exists(path):
+        build_archive(path, entries)
+    return len(entries), failures
+
+
+_default_archive = None
+
+
+def default_archive():
+    """기본 묶음 파일을 엽니다. 파일이 없거나 손상되었으면 None (그때는 캐시/API 를 씁니다)."""
+    global _default_archive
+    if _default_archive is None:
+        try:
+            _default_archive = PokedexArchive(default_archive_path())
+        except (OSError, ValueError):
+            _default_archive = False
+    return _default_archive or None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포켓몬 이름/스프라이트 묶음 파일 (pokedex.pkdx)")
+    parser.add_argument("--build", metavar="FIRST-LAST", nargs="?", const=GAME_IDS,
+                        help=f"id 범위를 PokéAPI 에서 받아 묶음 파일을 만듦 (기본값: {GAME_IDS}). "
+                             f"받는 동안 {CHECKPOINT}마리마다 파일을 저장하고, 이미 있는 id 는 다시 받지 않으므로 "
+                             "중간에 끊겨도 다시 실행하면 이어서 만듭니다.")
+    parser.add_argument("--path", default=default_archive_path(), help="묶음 파일 경로")
+    args = parser.parse_args()
+
+    if args.build:
+        from pokemon_cache import PokemonCache
+        cache = PokemonCache(use_archive=False)
+        first, last = (int(x) for x in args.build.split("-"))
+        count, failures = update_archive(args.path, range(first, last + 1), cache)
+        for pokemon_id, error in failures:
+            print(f"{pokemon_id}: {error}")
+        print(f"{args.path}: {count}마리, 네트워크 요청 {cache.network_calls}번")
+
+    archive = PokedexArchive(args.path)
+    size = os.path.getsize(args.path)
+    ids = archive.ids()
+    start = time.perf_counter()
+    rounds = 20
+    for _ in range(rounds):
+        for pokemon_id in ids:
+            archive.get_sprite(pokemon_id)
+    per_lookup = (time.perf_counter() - start) / max(1, rounds * len(ids)) * 1e6
+    print(f"{args.path}: {archive.count}마리, {size / 1024:.0f} KB, 스프라이트 조회 {per_lookup:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import tracing
+from http_client import default_client
+from pokedex_archive import default_archive
+
+# 로컬 대역 서버로 시험할 때는 POKEAPI_URL 로 바꿀 수 있습니다.
+API_URL = os.environ.get("POKEAPI_URL", "https://pokeapi.co/api/v2") + "/pokemon/{}"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def default_cache_path():
+    """POKEMON_CACHE_DIR 환경 변수 또는 ~/.cache/pokemon_games 아래의 캐시 파일 경로를 반환합니다."""
+    directory = os.environ.get("POKEMON_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "pokemon_games")
+    return os.path.join(directory, "pokemon.sqlite3")
+
+
+def _trim(data):
+    """PokéAPI 응답에서 게임이 쓰는 필드만 남깁니다. (전체 응답은 기술 목록 때문에 수백 KB 입니다)"""
+    return {
+        'id': data['id'],
+        'name': data['name'],
+        'sprites': {'front_default': data['sprites']['front_default']},
+    }
+
+
+class PokemonCache:
+    """포켓몬 메타데이터(JSON)와 스프라이트(PNG 바이트)를 디스크에 저장하는 LRU 캐시입니다.
+
+    SQLite 파일 하나를 쓰므로 각 쓰기는 트랜잭션으로 원자적이고, WAL 모드와 busy_timeout 덕분에
+    두 게임 프로세스가 동시에 써도 안전합니다. 항목은 id 와 이름 모두로 찾을 수 있으며,
+    전체 크기가 max_bytes 를 넘으면 가장 오래 쓰이지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, use_archive=True):
+        self.path = path or default_cache_path()
+        self.max_bytes = max_bytes
+        # 묶음 파일(pokedex.pkdx)이 있으면 가장 먼저 보고, 캐시와 API 는 그 다음입니다.
+        self.archive = default_archive() if use_archive else None
+        self.archive_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.network_calls = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pokemon ("
+                " id INTEGER PRIMARY KEY,"
+                " name TEXT NOT NULL UNIQUE,"
+                " meta TEXT NOT NULL,"
+                " sprite BLOB,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS pokemon_last_used ON pokemon (last_used)")
+
+    def _connection(self):
+        # sqlite3 연결은 스레드끼리 공유할 수 없으므로 스레드마다 하나씩 엽니다.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _lookup(self, key, column):
+        conn = self._connection()
+        where = "id = ?" if isinstance(key, int) or str(key).isdigit() else "name = ?"
+        key = int(key) if where == "id = ?" else str(key).lower()
+        row = conn.execute(f"SELECT id, {column} FROM pokemon WHERE {where}", (key,)).fetchone()
+        if row is None or row[1] is None:
+            self._count(False)
+            return None
+        with conn:
+            conn.execute("UPDATE pokemon SET last_used = ? WHERE id = ?", (time.time(), row[0]))
+        self._count(True)
+        return row[1]
+
+    def get_meta(self, key):
+        """id 또는 이름으로 메타데이터 딕셔너리를 찾습니다. 없으면 None."""
+        meta = self._lookup(key, "meta")
+        return json.loads(meta) if meta is not None else None
+
+    def get_sprite(self, key):
+        """id 또는 이름으로 스프라이트 PNG 바이트를 찾습니다. 없으면 None."""
+        sprite = self._lookup(key, "sprite")
+        return bytes(sprite) if sprite is not None else None
+
+    def put_meta(self, data):
+        meta = json.dumps(_trim(data))
+        conn = self._connection()
+        with conn:
+            # 스프라이트가 이미 있으면 유지합니다.
+            conn.execute(
+                "INSERT INTO pokemon (id, name, meta, sprite, size, last_used) VALUES (?, ?, ?, NULL, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET name = excluded.name, meta = excluded.meta,"
+                " size = length(excluded.meta) + coalesce(length(pokemon.sprite), 0), last_used = excluded.last_used",
+                (data['id'], data['name'], meta, len(meta), time.time()),
+            )
+        self._evict()
+
+    def put_sprite(self, pokemon_id, sprite):
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE pokemon SET sprite = ?, size = length(meta) + ?, last_used = ? WHERE id = ?",
+                (sprite, len(sprite), time.time(), pokemon_id),
+            )
+        self._evict()
+
+    def _evict(self):
+        conn = self._connection()
+        with conn:
+            total = conn.execute("SELECT coalesce(sum(size), 0) FROM pokemon").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            for pokemon_id, size in conn.execute("SELECT id, size FROM pokemon ORDER BY last_used").fetchall():
+                conn.execute("DELETE FROM pokemon WHERE id = ?", (pokemon_id,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def stats(self):
+        return {'archive_hits': self.archive_hits, 'hits': self.hits, 'misses': self.misses,
+                'network_calls': self.network_calls}
+
+    def usage(self):
+        """(항목 수, 전체 바이트 수) 를 반환합니다."""
+        return self._connection().execute("SELECT count(*), coalesce(sum(size), 0) FROM pokemon").fetchone()
+
+    def _download(self, url, deadline=None):
+        with self._lock:
+            self.network_calls += 1
+        return default_client().get(url, deadline=deadline)
+
+    def _from_archive(self, method, key):
+        if self.archive is None:
+            return None
+        value = getattr(self.archive, method)(key)
+        if value is not None:
+            with self._lock:
+                self.archive_hits += 1
+        return value
+
+    def fetch_pokemon(self, key, deadline=None):
+        """묶음 파일이나 캐시에 있으면 거기서, 없으면 PokéAPI 에서 메타데이터를 가져와 저장한 뒤 반환합니다.
+
+        네트워크 오류는 OSError(requests.RequestException 포함) 로, 잘못된 응답은 ValueError 로 전달됩니다.
+        deadline (time.monotonic 기준 시각) 은 HttpClient.get 에 그대로 넘깁니다.
+        """
+        meta = self._from_archive('get_meta', key)
+        if meta is not None:
+            return meta
+        meta = self.get_meta(key)
+        if meta is None:
+            with tracing.span("pokeapi.fetch", key=key):
+                body = self._download(API_URL.format(str(key).lower()), deadline)
+            with tracing.span("pokeapi.decode", bytes=len(body)):
+                meta = _trim(json.loads(body))
+            self.put_meta(meta)
+        return meta
+
+    def fetch_sprite(self, meta, deadline=None):
+        """fetch_pokemon 이 반환한 메타데이터의 기본 스프라이트 PNG 바이트를 반환합니다. 스프라이트가 없으면 None."""
+        sprite = self._from_archive('get_sprite', meta['id'])
+        if sprite is not None:
+            return sprite
+        sprite = self.get_sprite(meta['id'])
+        if sprite is None:
+            url = meta['sprites']['front_default']
+            if not url:
+                return None
+            with tracing.span("sprite.download", id=meta['id']):
+                sprite = self._download(url, deadline)
+            self.put_sprite(meta['id'], sprite)
+        return sprite
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """두 게임이 함께 쓰는 프로세스 전역 캐시를 반환합니다."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = PokemonCache()
+        return _default_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포켓몬 메타데이터/스프라이트 캐시 관리")
+    parser.add_argument("--warm", metavar="FIRST-LAST", help="id 범위를 미리 받아 둠 (예: 1-151)")
+    args = parser.parse_args()
+
+    cache = default_cache()
+    if args.warm:
+        first, last = (int(x) for x in args.warm.split("-"))
+        for pokemon_id in range(first, last + 1):
+            try:
+                cache.fetch_sprite(cache.fetch_pokemon(pokemon_id))
+            except (OSError, ValueError) as e:
+                print(f"{pokemon_id}: {e}")
+    count, total = cache.usage()
+    print(f"{cache.path}: 항목 {count}개, {total / 1024:.0f} KB / {cache.max_bytes / 1024:.0f} KB")
+    print(f"archive {cache.archive_hits}, hits {cache.hits}, misses {cache.misses}, network {cache.network_calls}")
+
+
+if __name__ == "__main__":
+    main()
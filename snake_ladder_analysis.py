@@ -0,0 +1,280 @@
+import argparse
+import random
+import time
+
+import numpy as np
+
+from snake_ladder_logic import MAX_JUMP, SnakeLadderGameLogic, build_jump_table, generate_board
+
+DIE_FACES = 6
+SOLVE_BYTES = 40 * 1024 * 1024  # 한 번에 푸는 행렬들의 크기 상한 (100칸 보드면 500여 개씩, 큰 보드는 더 적게)
+FIND_MAX_CELLS = 2500           # find_board 가 다룰 수 있는 보드 크기 (칸 수의 제곱에 비례하는 밀집 행렬을 풉니다)
+
+
+def jump_tables(boards):
+    """보드 목록을 (보드 수, board_size + 1) 크기의 점프 테이블 배열로 변환합니다.
+
+    각 보드는 SnakeLadderGameLogic 이거나 jump_table() 과 같은 형식의 시퀀스입니다.
+    한 배치의 보드는 모두 같은 크기여야 합니다.
+    """
+    tables = [board.jump_table() if isinstance(board, SnakeLadderGameLogic) else board for board in boards]
+    tables = np.asarray(tables, dtype=np.int64)
+    if tables.ndim != 2:
+        raise ValueError("모든 보드의 크기가 같아야 합니다.")
+    return tables
+
+
+def transition_targets(tables):
+    """각 칸(1..board_size-1)에서 주사위 눈 1..6 이 나왔을 때 도착하는 칸을 (B, 칸 수, 6) 배열로 반환합니다.
+
+    play_turn 과 같은 규칙입니다: 목표 칸을 넘어가면 제자리, 정확히 도착하면 승리,
+    그 외에는 뱀/사다리를 한 번 적용합니다.
+    """
+    num_boards, width = tables.shape
+    board_size = width - 1
+    cells = np.arange(1, board_size)
+    # 넘어가는 칸은 -1 로 채워 두었다가 제자리로 바꿉니다.
+    padded = np.concatenate([tables, np.full((num_boards, DIE_FACES), -1, dtype=tables.dtype)], axis=1)
+    landing = cells[:, None] + np.arange(1, DIE_FACES + 1)[None, :]
+    targets = padded[:, landing]
+    return np.where(targets < 0, cells[None, :, None], targets)
+
+
+def _expected_turns(targets, board_size):
+    """흡수 마르코프 체인 (I - Q) t = 1 을 배치로 풀어 1번 칸에서의 기대 턴 수를 구합니다."""
+    num_boards, num_states, _ = targets.shape
+    expected = np.empty(num_boards)
+    solve_chunk = max(1, SOLVE_BYTES // (8 * num_states * num_states))
+    for lo in range(0, num_boards, solve_chunk):
+        chunk = targets[lo:lo + solve_chunk]
+        n = chunk.shape[0]
+        # 승리 칸(board_size)으로 가는 전이는 Q 에서 빠집니다.
+        rows = np.broadcast_to(np.arange(num_states)[None, :, None], chunk.shape)
+        flat = (np.arange(n)[:, None, None] * num_states + rows) * num_states + (chunk - 1)
+        keep = chunk != board_size
+        q = np.bincount(flat[keep], minlength=n * num_states * num_states) / DIE_FACES
+        system = np.eye(num_states) - q.reshape(n, num_states, num_states)
+        try:
+            solution = np.linalg.solve(system, np.ones((n, num_states, 1)))[:, 0, 0]
+        except np.linalg.LinAlgError:
+            solution = np.array([_solve_single(a) for a in system])
+        # 승리 칸에 도달할 수 없는 보드는 특이 행렬이 되어 터무니없는 값이 나옵니다.
+        solution[~np.isfinite(solution) | (solution < 1) | (solution > 1e12)] = np.inf
+        expected[lo:lo + n] = solution
+    return expected
+
+
+def _solve_single(system):
+    try:
+        return np.linalg.solve(system, np.ones(system.shape[0]))[0]
+    except np.linalg.LinAlgError:
+        return np.inf
+
+
+def _turn_distribution(tables, max_turns, tol):
+    """k 번째 턴에 처음 승리 칸에 도착할 확률 (B, max_turns) 을 배치 전체에 한 번에 전파해 구합니다.
+
+    확률 질량은 (칸, 보드) 배열로 두어 주사위 6면 이동을 연속된 행 덧셈으로 처리하고,
+    뱀/사다리는 평탄화한 인덱스로 한꺼번에 옮깁니다. 수렴한 보드는 배열에서 빼고 남은 보드만 계속 전파합니다.
+    """
+    num_boards, width = tables.shape
+    board_size = width - 1
+    cells = np.arange(width)
+    # 목표 칸을 넘어가는 눈은 제자리에 머뭅니다. (board_size - 6 보다 뒤의 칸에서만 생깁니다)
+    stay = (np.clip(cells + DIE_FACES - board_size, 0, DIE_FACES) / DIE_FACES)[:, None]
+    stay[board_size] = 0.0
+    jump_cells, jump_boards = np.nonzero((tables != cells).T)
+    jump_targets = tables[jump_boards, jump_cells]
+
+    pmf = np.zeros((num_boards, max_turns))
+    mass = np.zeros(width * num_boards)
+    mass[num_boards:2 * num_boards] = 1.0  # 모든 보드가 1번 칸에서 시작합니다.
+    moved = np.empty_like(mass)
+    share = np.empty_like(mass)
+    active = np.arange(num_boards)
+    rebuild = True
+    last_turn = 0
+    for turn in range(max_turns):
+        n = len(active)
+        if rebuild:
+            jump_from = jump_cells * n + jump_boards
+            jump_to = jump_targets * n + jump_boards
+            rebuild = False
+        current = mass[:width * n].reshape(width, n)
+        following = moved[:width * n].reshape(width, n)
+        part = share[:width * n].reshape(width, n)
+        np.multiply(current, stay, out=following)
+        np.divide(current, DIE_FACES, out=part)
+        for face in range(1, DIE_FACES + 1):
+            following[face:] += part[:width - face]
+        flat = following.reshape(-1)
+        jumped = flat[jump_from]
+        flat[jump_from] = 0.0
+        flat[jump_to] += jumped  # 한 보드 안에서 뱀/사다리의 도착 칸은 겹치지 않습니다.
+        pmf[active, turn] = following[board_size]
+        following[board_size] = 0.0
+        last_turn = turn
+        unfinished = following.sum(axis=0) >= tol
+        mass, moved = moved, mass
+        if not unfinished.all():
+            if not unfinished.any():
+                break
+            # 이미 수렴한 보드는 빼고 남은 보드의 질량과 점프 인덱스만 당겨 씁니다.
+            active = active[unfinished]
+            mass[:width * len(active)] = following[:, unfinished].ravel()
+            keep = unfinished[jump_boards]
+            jump_cells, jump_targets = jump_cells[keep], jump_targets[keep]
+            jump_boards = (np.cumsum(unfinished) - 1)[jump_boards[keep]]
+            rebuild = True
+    return pmf[:, :last_turn + 1]
+
+
+def _win_probabilities(pmf, num_players):
+    """서로 독립인 N 명이 번갈아 움직일 때 각 순번의 승리 확률을 구합니다.
+
+    i 번째 플레이어가 k 턴째에 이기려면 앞 순번은 k 턴까지, 뒷 순번은 k-1 턴까지 모두 도착하지 못해야 합니다.
+    """
+    survival = 1.0 - np.cumsum(pmf, axis=1)
+    survival = np.clip(survival, 0.0, 1.0)
+    previous = np.concatenate([np.ones((pmf.shape[0], 1)), survival[:, :-1]], axis=1)
+    return np.stack([
+        (pmf * survival ** i * previous ** (num_players - 1 - i)).sum(axis=1)
+        for i in range(num_players)
+    ], axis=1)
+
+
+def analyze_boards(boards, num_players=2, max_turns=1000, tol=1e-12, distribution=True):
+    """여러 보드를 한 번에 분석합니다.
+
+    반환값은 보드 축(B)을 가진 NumPy 배열의 딕셔너리입니다.
+      - expected_turns: 한 플레이어가 100번 칸에 도착하기까지의 기대 턴 수 (B,)
+      - turn_distribution: k+1 번째 턴에 도착할 확률 (B, K)
+      - expected_rounds: N 명이 함께할 때 게임이 끝나기까지의 기대 라운드 수 (B,)
+      - win_probabilities: 순번별 승리 확률 (B, N)
+      - unresolved: max_turns 안에 끝나지 않은 확률 (B,)
+    distribution=False 이면 expected_turns 만 계산합니다.
+    """
+    tables = jump_tables(boards)
+    board_size = tables.shape[1] - 1
+    targets = transition_targets(tables)
+    result = {'expected_turns': _expected_turns(targets, board_size)}
+    if not distribution:
+        return result
+
+    pmf = _turn_distribution(tables, max_turns, tol)
+    survival = np.clip(1.0 - np.cumsum(pmf, axis=1), 0.0, 1.0)
+    result['turn_distribution'] = pmf
+    result['expected_rounds'] = 1.0 + (survival ** num_players).sum(axis=1)
+    result['win_probabilities'] = _win_probabilities(pmf, num_players)
+    result['unresolved'] = survival[:, -1]
+    return result
+
+
+def analyze_board(game_logic, num_players=None, max_turns=1000, tol=1e-12):
+    """단일 보드를 분석해 파이썬 값으로 된 딕셔너리를 반환합니다."""
+    if num_players is None:
+        num_players = game_logic.num_players
+    result = analyze_boards([game_logic], num_players, max_turns, tol)
+    return {
+        'expected_turns': float(result['expected_turns'][0]),
+        'expected_rounds': float(result['expected_rounds'][0]),
+        'turn_distribution': result['turn_distribution'][0].tolist(),
+        'win_probabilities': result['win_probabilities'][0].tolist(),
+        'unresolved': float(result['unresolved'][0]),
+    }
+
+
+def find_board(min_turns, max_turns, num_snakes, num_ladders, board_size=100, seed=None,
+               batch_size=256, max_boards=200_000, max_jump=MAX_JUMP):
+    """기대 턴 수(1인 기준)가 [min_turns, max_turns] 안에 드는 보드를 찾습니다.
+
+    generate_board 로 batch_size 개씩 만들고 analyze_boards 로 한꺼번에 기대 턴 수만 풀어 봅니다.
+    반환값은 snakes, ladders, expected_turns 와 생성 통계(boards, elapsed, boards_per_second)를 담은 딕셔너리입니다.
+    max_boards 개를 만들어도 찾지 못하면 ValueError 를 냅니다.
+    """
+    if min_turns > max_turns:
+        raise ValueError(f"난이도 범위가 잘못되었습니다: {min_turns} > {max_turns}")
+    if board_size > FIND_MAX_CELLS:
+        raise ValueError(f"난이도로 보드를 찾는 것은 {FIND_MAX_CELLS}칸 이하 보드만 가능합니다. (요청: {board_size}칸)")
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    generated = 0
+    while generated < max_boards:
+        count = min(batch_size, max_boards - generated)
+        boards = [generate_board(num_snakes, num_ladders, board_size, rng, max_jump) for _ in range(count)]
+        tables = [build_jump_table(snakes, ladders, board_size) for snakes, ladders in boards]
+        expected = analyze_boards(tables, distribution=False)['expected_turns']
+        generated += count
+        hits = np.flatnonzero((expected >= min_turns) & (expected <= max_turns))
+        if hits.size:
+            elapsed = time.perf_counter() - start
+            snakes, ladders = boards[hits[0]]
+            return {
+                'snakes': snakes,
+                'ladders': ladders,
+                'expected_turns': float(expected[hits[0]]),
+                # 마지막 배치의 나머지 보드도 생성/분석했으므로 모두 셉니다.
+                'boards': generated,
+                'elapsed': elapsed,
+                'boards_per_second': generated / elapsed,
+            }
+    raise ValueError(
+        f"보드 {generated:,}개를 만들었지만 기대 턴 수가 {min_turns}~{max_turns} 인 보드를 찾지 못했습니다."
+    )
+
+
+def benchmark(num_boards, num_players, num_snakes, num_ladders, distribution):
+    boards = [SnakeLadderGameLogic(num_players, num_snakes, num_ladders) for _ in range(num_boards)]
+    start = time.perf_counter()
+    analyze_boards(boards, num_players, distribution=distribution)
+    elapsed = time.perf_counter() - start
+    return num_boards / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뱀 사다리 보드 분석 (흡수 마르코프 체인)")
+    parser.add_argument("--players", type=int, default=2, help="플레이어 수 (기본값: 2)")
+    parser.add_argument("--snakes", type=int, default=8, help="뱀의 수 (기본값: 8)")
+    parser.add_argument("--ladders", type=int, default=8, help="사다리의 수 (기본값: 8)")
+    parser.add_argument("--seed", type=int, default=None, help="랜덤 시드")
+    parser.add_argument("--bench", type=int, default=0, metavar="N", help="보드 N개를 생성해 초당 분석 수를 측정")
+    parser.add_argument("--difficulty", type=float, nargs=2, metavar=("MIN", "MAX"),
+                        help="기대 턴 수가 MIN~MAX 인 보드를 찾음")
+    args = parser.parse_args()
+
+    if args.difficulty:
+        try:
+            found = find_board(*args.difficulty, args.snakes, args.ladders, seed=args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"뱀: {found['snakes']}")
+        print(f"사다리: {found['ladders']}")
+        print(f"기대 턴 수 (1인): {found['expected_turns']:.3f}")
+        print(f"보드 {found['boards']:,}개 생성, {found['elapsed']:.3f}초 ({found['boards_per_second']:,.0f} boards/s)")
+        return
+
+    if args.bench:
+        for distribution in (False, True):
+            rate = benchmark(args.bench, args.players, args.snakes, args.ladders, distribution)
+            label = "기대 턴 + 분포 + 승률" if distribution else "기대 턴"
+            print(f"{label}: {rate:,.0f} boards/s")
+        return
+
+    try:
+        game_logic = SnakeLadderGameLogic(args.players, args.snakes, args.ladders, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    analysis = analyze_board(game_logic)
+    print(f"뱀: {game_logic.snakes}")
+    print(f"사다리: {game_logic.ladders}")
+    print(f"기대 턴 수 (1인): {analysis['expected_turns']:.3f}")
+    print(f"기대 라운드 수 ({args.players}인): {analysis['expected_rounds']:.3f}")
+    for i, p in enumerate(analysis['win_probabilities'], start=1):
+        print(f"플레이어 {i} 승리 확률: {p:.4f}")
+    pmf = analysis['turn_distribution']
+    mode = max(range(len(pmf)), key=pmf.__getitem__) + 1
+    print(f"가장 흔한 턴 수: {mode} (확률 {max(pmf):.4f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,162 +2,322 @@ import tkinter as tk
 from tkinter import messagebox
 import random
 import argparse
-import json
-import urllib.request
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from io import BytesIO
-from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+from game_log import END, JUMP, MAX_FIELD, SNAKE, START, TURN, open_log
+from http_client import default_client
+from pokemon_cache import default_cache
+from snake_ladder_logic import SnakeLadderGameLogic, max_jump_for
 
 # Pillow 라이브러리 필요 (pip install Pillow)
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
 except ImportError:
     messagebox.showerror("라이브러리 오류", "Pillow 라이브러리가 필요합니다. 'pip install Pillow'를 실행해주세요.")
     exit()
 
-# 게임의 핵심 로직을 담당하는 클래스
-class SnakeLadderGameLogic:
-    def __init__(self, num_players=2, num_snakes=8, num_ladders=8, seed=None):
-        self.board_size = 100
-        self.num_players = num_players
-        self.player_positions = {i: 1 for i in range(1, self.num_players + 1)}
-        self.snakes = {}
-        self.ladders = {}
-        if seed is not None:
-            random.seed(seed)
-        self._place_snakes_and_ladders(num_snakes, num_ladders)
-
-    def _place_snakes_and_ladders(self, num_snakes, num_ladders):
-        occupied_positions = {1, self.board_size}
-        for _ in range(num_snakes):
-            while True:
-                head = random.randint(11, self.board_size - 1)
-                tail = random.randint(2, head - 1)
-                if (head - tail < 30) and head not in occupied_positions and tail not in occupied_positions:
-                    self.snakes[head] = tail
-                    occupied_positions.add(head)
-                    occupied_positions.add(tail)
-                    break
-        for _ in range(num_ladders):
-            while True:
-                start = random.randint(2, self.board_size - 10)
-                end = random.randint(start + 1, self.board_size - 1)
-                if (end - start < 30) and start not in occupied_positions and end not in occupied_positions:
-                    self.ladders[start] = end
-                    occupied_positions.add(start)
-                    occupied_positions.add(end)
-                    break
-
-    def roll_die(self):
-        return random.randint(1, 6)
+CELL_SIZE = 60         # 확대 1배일 때 칸 한 변의 픽셀 수
+VIEWPORT = 600         # 보드 캔버스(보이는 영역)의 최대 크기
+ZOOM_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+LABEL_MIN_PX = 24      # 칸이 이보다 작게 보이면 칸 번호를 생략하고 사다리를 실선으로 간단히 그립니다.
+ANIM_FRAME_MS = 16    # 애니메이션 프레임 간격 (약 60fps)
+ANIM_STEP_MS = 80     # 한 칸 걸어가는 시간
+ANIM_SLIDE_MS = 400   # 뱀을 타고 내려가거나 사다리를 오르는 시간
+TOKEN_RADIUS = 14     # 포켓몬 이미지가 없을 때 쓰는 원형 말의 반지름
+POLL_MS = 50          # 포켓몬 로딩 결과를 확인하는 간격
+POKEMON_DEADLINE = 5.0  # 포켓몬 하나를 가져오는 요청의 기한 (초). 넘으면 요청을 그만두고 원형 말로 계속합니다.
 
 # GUI를 담당하는 메인 애플리케이션 클래스
 class SnakeLadderGUI(tk.Tk):
-    def __init__(self, num_players, num_snakes, num_ladders, seed):
+    def __init__(self, num_players, num_snakes, num_ladders, seed, board=None, rows=10, cols=10, log=None):
+        started = time.perf_counter()
+        # 보드를 만들 수 없는 설정이면 창을 띄우기 전에 ValueError 가 납니다.
+        game_logic = SnakeLadderGameLogic(num_players, num_snakes, num_ladders, seed, board, rows, cols)
+        # log (game_log.EventLog) 에는 시드와 보드, 매 턴의 주사위와 이동을 남깁니다.
+        self.log = log
+        if log:
+            log.record(START, SNAKE, num_players, game_logic.seed, rows, cols)
+            for source, target in {**game_logic.snakes, **game_logic.ladders}.items():
+                log.record(JUMP, SNAKE, 0, source, target)
         super().__init__()
         self.title("포켓몬 뱀 사다리 게임")
         self.geometry("750x800")
 
         # --- 게임 로직 및 상태 초기화 ---
-        self.game_logic = SnakeLadderGameLogic(num_players, num_snakes, num_ladders, seed)
+        self.game_logic = game_logic
         self.turn_count = 1
         self.current_player = 1
         self.player_colors = ["red", "blue", "green", "purple"]
-        self.player_pokemon = {}
+        # 포켓몬이 도착하기 전까지는 'Player n' 과 원형 말로 진행합니다.
+        self.player_pokemon = {p: {'id': 0, 'name': f'Player {p}', 'image': None} for p in range(1, num_players + 1)}
         self.pokemon_image_references = [] # ★ 이미지 참조를 저장할 리스트
+        self.player_tokens = {}   # 플레이어 번호 -> 캔버스 아이템 (말 하나에 아이템 하나)
+        self.token_xy = {}        # 플레이어 번호 -> 현재 화면 좌표
+        self.animations = {}      # 플레이어 번호 -> 진행 중인 이동 애니메이션
 
         # --- UI 요소 생성 ---
-        self.canvas = tk.Canvas(self, width=600, height=600, bg="white")
-        self.canvas.pack(pady=20)
+        # 보드는 보이는 영역만 이미지 한 장으로 그리고, 스크롤하거나 확대할 때 다시 그립니다.
+        self.zoom = 1.0
+        self.cell_px = CELL_SIZE
+        self.jump_rows, self.jump_span = index_jumps(game_logic)
+        self.board_font = ImageFont.load_default()
+        self._redraw_pending = None
+        board_frame = tk.Frame(self)
+        board_frame.pack(pady=20)
+        self.canvas = tk.Canvas(board_frame, width=min(VIEWPORT, cols * CELL_SIZE),
+                                height=min(VIEWPORT, rows * CELL_SIZE), bg="white")
+        x_scroll = tk.Scrollbar(board_frame, orient="horizontal", command=self.canvas.xview)
+        y_scroll = tk.Scrollbar(board_frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.config(xscrollcommand=lambda *view: self._on_view_changed(x_scroll, *view),
+                           yscrollcommand=lambda *view: self._on_view_changed(y_scroll, *view))
+        self.canvas.grid(row=0, column=0)
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        # 휠: 세로 스크롤 (Shift: 가로, Ctrl: 확대/축소), 드래그: 이동, +/-: 확대/축소
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self._on_wheel)
+        self.canvas.bind("<ButtonPress-1>", lambda e: self.canvas.scan_mark(e.x, e.y))
+        self.canvas.bind("<B1-Motion>", lambda e: self.canvas.scan_dragto(e.x, e.y, gain=1))
+        self.bind("<plus>", lambda e: self.zoom_step(1))
+        self.bind("<equal>", lambda e: self.zoom_step(1))
+        self.bind("<minus>", lambda e: self.zoom_step(-1))
 
         self.info_frame = tk.Frame(self)
         self.info_frame.pack()
         self.turn_label = tk.Label(self.info_frame, text=f"턴: {self.turn_count}", font=("Helvetica", 14))
         self.turn_label.grid(row=0, column=0, padx=10)
-        self.player_label = tk.Label(self.info_frame, text="포켓몬 로딩 중...", font=("Helvetica", 14))
+        self.player_label = tk.Label(self.info_frame, text="", font=("Helvetica", 14))
         self.player_label.grid(row=0, column=1, padx=10)
 
-        self.roll_button = tk.Button(self, text="주사위 굴리기", font=("Helvetica", 14), command=self.play_turn, state="disabled")
+        self.roll_button = tk.Button(self, text="주사위 굴리기", font=("Helvetica", 14), command=self.play_turn)
         self.roll_button.pack(pady=10)
 
-        self.message_label = tk.Label(self, text="플레이어의 포켓몬을 불러오고 있습니다...", font=("Helvetica", 12))
+        self.message_label = tk.Label(self, text="게임을 시작하려면 '주사위 굴리기' 버튼을 누르세요.", font=("Helvetica", 12))
         self.message_label.pack()
-        self.update()
 
-        # --- 초기화 작업 ---
+        # --- 초기화 작업: 보드와 임시 말을 바로 그리고, 포켓몬은 도착하는 대로 바꿔 끼웁니다. ---
+        self._draw_board()
+        self._create_player_tokens()
+        self._update_player_label()
         self._fetch_player_pokemon()
-        self.cell_coords = self._draw_board()
-        self._draw_snakes_and_ladders()
-        self._draw_players()
-        
-        self.message_label.config(text="게임을 시작하려면 '주사위 굴리기' 버튼을 누르세요.")
-        self.player_label.config(text=f"{self.player_pokemon[self.current_player]['name']}의 차례", fg=self.player_colors[self.current_player-1])
-        self.roll_button.config(state="normal")
+        # 주사위 버튼을 누를 수 있게 되기까지 걸린 시간
+        self.startup_ms = (time.perf_counter() - started) * 1000
+
+    def _update_player_label(self):
+        name = self.player_pokemon[self.current_player]['name']
+        self.player_label.config(text=f"{name}의 차례", fg=self.player_colors[self.current_player-1])
 
-    def _fetch_pokemon_data(self, pokemon_id):
-        """단일 포켓몬 데이터를 API에서 가져와 PIL Image 객체로 반환합니다."""
+    def _fetch_pokemon_data(self, pokemon_id, deadline):
+        """단일 포켓몬 데이터를 캐시(없으면 API)에서 가져와 PIL Image 객체로 반환합니다.
+
+        deadline (time.monotonic 기준 시각) 은 메타데이터와 스프라이트 요청에 그대로 넘겨, 기한이 지나면 재시도 없이 끝냅니다.
+        """
         try:
-            with urllib.request.urlopen(f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}") as response:
-                data = json.loads(response.read())
+            cache = default_cache()
+            data = cache.fetch_pokemon(pokemon_id, deadline)
             name = data['name'].capitalize()
-            sprite_url = data['sprites']['front_default']
-            with urllib.request.urlopen(sprite_url) as response:
-                image_data = response.read()
+            image_data = cache.fetch_sprite(data, deadline)
             # PIL Image 객체로 변환하여 반환
-            image_obj = Image.open(BytesIO(image_data)).resize((40, 40), Image.Resampling.LANCZOS)
+            with tracing.span("sprite.decode", bytes=len(image_data)):
+                image_obj = Image.open(BytesIO(image_data))
+                image_obj.load()
+            with tracing.span("image.resize", size=(40, 40), filter="LANCZOS"):
+                image_obj = image_obj.resize((40, 40), Image.Resampling.LANCZOS)
             return {'id': pokemon_id, 'name': name, 'image_obj': image_obj}
         except Exception as e:
             print(f"Error fetching Pokemon ID {pokemon_id}: {e}")
             return None
 
     def _fetch_player_pokemon(self):
-        """플레이어 수만큼 포켓몬 데이터를 가져와 Tkinter 이미지로 변환하고 참조를 저장합니다."""
+        """플레이어 수만큼 포켓몬을 작업 스레드에서 가져오기 시작합니다. 기다리지 않고 바로 돌아옵니다.
+
+        요청마다 자기 기한을 HTTP 요청까지 넘기고, 스레드는 데몬이라 창을 닫으면 끝나지 않은 요청을 기다리지 않습니다.
+        """
         num_players = self.game_logic.num_players
         pokemon_ids = random.sample(range(1, 899), num_players)
+        for player_num, pokemon_id in enumerate(pokemon_ids, start=1):
+            future = Future()
+            deadline = time.monotonic() + POKEMON_DEADLINE
+            threading.Thread(target=self._fetch_into, args=(future, pokemon_id, deadline), daemon=True,
+                             name=f"pokemon-{player_num}").start()
+            self._poll_pokemon(player_num, future, deadline)
 
-        with ThreadPoolExecutor(max_workers=num_players) as executor:
-            results = list(executor.map(self._fetch_pokemon_data, pokemon_ids))
+    def _fetch_into(self, future, pokemon_id, deadline):
+        """(작업 스레드) _fetch_pokemon_data 의 결과를 future 에 넣습니다."""
+        future.set_result(self._fetch_pokemon_data(pokemon_id, deadline))
 
-        for i, pokemon_data in enumerate(results):
-            player_num = i + 1
-            if pokemon_data and pokemon_data['image_obj']:
-                # ★ PIL Image를 ImageTk.PhotoImage로 변환
+    def _poll_pokemon(self, player_num, future, deadline):
+        if future.done():
+            if future.result():
+                self._set_player_pokemon(player_num, future.result())
+        elif time.monotonic() > deadline:
+            print(f"플레이어 {player_num}의 포켓몬을 {POKEMON_DEADLINE}초 안에 불러오지 못했습니다.")
+        else:
+            self.after(POLL_MS, self._poll_pokemon, player_num, future, deadline)
+
+    def _set_player_pokemon(self, player_num, pokemon_data):
+        """도착한 포켓몬으로 플레이어 이름과 말을 바꿉니다. (메인 스레드)"""
+        photo_image = None
+        if pokemon_data['image_obj']:
+            # ★ PIL Image를 ImageTk.PhotoImage로 변환
+            with tracing.span("image.convert", size=pokemon_data['image_obj'].size):
                 photo_image = ImageTk.PhotoImage(pokemon_data['image_obj'])
-                self.player_pokemon[player_num] = {
-                    'id': pokemon_data['id'],
-                    'name': pokemon_data['name'],
-                    'image': photo_image # PhotoImage 객체를 저장
-                }
-                # ★ 리스트에 PhotoImage 참조를 추가하여 가비지 컬렉션 방지
-                self.pokemon_image_references.append(photo_image)
-            else:
-                self.player_pokemon[player_num] = {'id': 0, 'name': f'Player {player_num}', 'image': None}
+            # ★ 리스트에 PhotoImage 참조를 추가하여 가비지 컬렉션 방지
+            self.pokemon_image_references.append(photo_image)
+        self.player_pokemon[player_num] = {'id': pokemon_data['id'], 'name': pokemon_data['name'], 'image': photo_image}
+        if photo_image:
+            # 움직이는 중이어도 말의 현재 좌표에 새 아이템을 놓으므로 애니메이션은 그대로 이어집니다.
+            x, y = self.token_xy[player_num]
+            with tracing.span("canvas.draw", item="token"):
+                self.canvas.delete(self.player_tokens[player_num])
+                self.player_tokens[player_num] = self.canvas.create_image(x, y, image=photo_image, tags="player")
+        if player_num == self.current_player:
+            self._update_player_label()
+
+    def _cell_center(self, cell):
+        """칸 중심의 보드 좌표 (현재 확대 배율 기준)."""
+        return ((self.game_logic.cell_cols[cell] + 0.5) * self.cell_px,
+                (self.game_logic.cell_rows[cell] + 0.5) * self.cell_px)
 
     def _draw_board(self):
-        cell_size = 60
-        coords = {}
-        for i in range(100):
-            row, col = 9 - (i // 10), (i % 10) if (9 - (i // 10)) % 2 != 0 else 9 - (i % 10)
-            x1, y1 = col * cell_size, row * cell_size
-            self.canvas.create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size, outline="black")
-            cell_num = i + 1
-            self.canvas.create_text(x1 + 15, y1 + 15, text=str(cell_num))
-            coords[cell_num] = (x1 + cell_size / 2, y1 + cell_size / 2)
-        return coords
-
-    def _draw_snakes_and_ladders(self):
-        for head, tail in self.game_logic.snakes.items():
-            self.canvas.create_line(self.cell_coords[head], self.cell_coords[tail], fill="red", width=4, arrow=tk.LAST)
-        for start, end in self.game_logic.ladders.items():
-            self.canvas.create_line(self.cell_coords[start], self.cell_coords[end], fill="green", width=4, dash=(4, 4))
-
-    def _draw_players(self):
-        self.canvas.delete("player")
+        self.canvas.config(scrollregion=(0, 0, self.game_logic.cols * self.cell_px, self.game_logic.rows * self.cell_px),
+                           xscrollincrement=self.cell_px, yscrollincrement=self.cell_px)
+        self.board_item = self.canvas.create_image(0, 0, anchor="nw", tags="board")
+        self._redraw_viewport()
+
+    def _on_view_changed(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        if self._redraw_pending is None:
+            self._redraw_pending = self.after_idle(self._redraw_viewport)
+
+    def _redraw_viewport(self):
+        """지금 보이는 영역만 PIL 이미지 한 장으로 그려 보드 아이템을 바꿉니다."""
+        self._redraw_pending = None
+        x0, y0 = int(self.canvas.canvasx(0)), int(self.canvas.canvasy(0))
+        width = self.canvas.winfo_width() if self.canvas.winfo_ismapped() else int(self.canvas.cget("width"))
+        height = self.canvas.winfo_height() if self.canvas.winfo_ismapped() else int(self.canvas.cget("height"))
+        with tracing.span("board.render", size=(width, height), cell_px=self.cell_px):
+            image = render_viewport(self.game_logic, self.jump_rows, self.jump_span, x0, y0, width, height,
+                                    self.cell_px, self.board_font)
+        with tracing.span("image.convert", size=image.size):
+            self.board_image = ImageTk.PhotoImage(image)
+        with tracing.span("canvas.draw", item="board"):
+            self.canvas.itemconfig(self.board_item, image=self.board_image)
+            self.canvas.coords(self.board_item, x0, y0)
+            self.canvas.tag_lower(self.board_item)
+
+    def _on_wheel(self, event):
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        if event.state & 0x4:
+            self.zoom_step(-step)
+        elif event.state & 0x1:
+            self.canvas.xview_scroll(step, "units")
+        else:
+            self.canvas.yview_scroll(step, "units")
+
+    def zoom_step(self, direction):
+        """ZOOM_LEVELS 에서 한 단계 확대(1) 또는 축소(-1) 합니다. 보고 있던 곳의 중심은 그대로 둡니다."""
+        index = ZOOM_LEVELS.index(self.zoom) + direction
+        if not 0 <= index < len(ZOOM_LEVELS):
+            return
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        center_x = self.canvas.canvasx(width / 2) / self.cell_px
+        center_y = self.canvas.canvasy(height / 2) / self.cell_px
+        for p_num in list(self.animations):
+            self._finish_animation(p_num)
+        self.zoom = ZOOM_LEVELS[index]
+        self.cell_px = int(CELL_SIZE * self.zoom)
+        board_w, board_h = self.game_logic.cols * self.cell_px, self.game_logic.rows * self.cell_px
+        self.canvas.config(scrollregion=(0, 0, board_w, board_h),
+                           xscrollincrement=self.cell_px, yscrollincrement=self.cell_px)
         for p_num, pos in self.game_logic.player_positions.items():
-            if p_num in self.player_pokemon and self.player_pokemon[p_num]['image']:
-                pokemon_image = self.player_pokemon[p_num]['image']
-                x, y = self.cell_coords[pos]
-                offset = (p_num - 1) * 10 - (self.game_logic.num_players - 1) * 5
-                self.canvas.create_image(x + offset, y, image=pokemon_image, tags="player")
+            self._place_token(p_num, *self._token_xy(p_num, pos))
+        self.canvas.xview_moveto((center_x * self.cell_px - width / 2) / board_w)
+        self.canvas.yview_moveto((center_y * self.cell_px - height / 2) / board_h)
+
+    def _scroll_into_view(self, cell):
+        """cell 이 보이는 영역 밖에 있으면 그 칸이 가운데 오도록 스크롤합니다."""
+        x, y = self._cell_center(cell)
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        margin = self.cell_px
+        if left + margin <= x <= left + width - margin and top + margin <= y <= top + height - margin:
+            return
+        self.canvas.xview_moveto((x - width / 2) / (self.game_logic.cols * self.cell_px))
+        self.canvas.yview_moveto((y - height / 2) / (self.game_logic.rows * self.cell_px))
+
+    def _token_xy(self, p_num, cell):
+        x, y = self._cell_center(cell)
+        offset = ((p_num - 1) * 10 - (self.game_logic.num_players - 1) * 5) * self.zoom
+        return x + offset, y
+
+    def _create_player_tokens(self):
+        for p_num, pos in self.game_logic.player_positions.items():
+            x, y = self._token_xy(p_num, pos)
+            pokemon_image = self.player_pokemon.get(p_num, {}).get('image')
+            if pokemon_image:
+                item = self.canvas.create_image(x, y, image=pokemon_image, tags="player")
+            else:
+                item = self.canvas.create_oval(x - TOKEN_RADIUS, y - TOKEN_RADIUS, x + TOKEN_RADIUS, y + TOKEN_RADIUS,
+                                               fill=self.player_colors[p_num - 1], outline="black", tags="player")
+            self.player_tokens[p_num] = item
+            self.token_xy[p_num] = (x, y)
+
+    def _place_token(self, p_num, x, y):
+        old_x, old_y = self.token_xy[p_num]
+        self.canvas.move(self.player_tokens[p_num], x - old_x, y - old_y)
+        self.token_xy[p_num] = (x, y)
+
+    def _animate_move(self, p_num, path, on_done=None):
+        """말이 path 의 칸들을 차례로 지나가도록 움직입니다.
+
+        path 는 (칸 번호, 걸리는 시간 ms) 목록입니다. 프레임은 after 로 나눠 그리므로
+        애니메이션 중에도 입력이 막히지 않고, 같은 말이 다시 움직이면 남은 애니메이션은 바로 끝냅니다.
+        """
+        self._finish_animation(p_num)
+        if path:
+            self._scroll_into_view(path[-1][0])
+        frames = deque()
+        x, y = self.token_xy[p_num]
+        for cell, duration in path:
+            target_x, target_y = self._token_xy(p_num, cell)
+            steps = max(1, duration // ANIM_FRAME_MS)
+            for k in range(1, steps + 1):
+                frames.append((x + (target_x - x) * k / steps, y + (target_y - y) * k / steps))
+            x, y = target_x, target_y
+        if not frames:
+            if on_done:
+                on_done()
+            return
+        self.animations[p_num] = {'frames': frames, 'after': None, 'on_done': on_done}
+        self._animation_frame(p_num)
+
+    def _animation_frame(self, p_num):
+        animation = self.animations[p_num]
+        self._place_token(p_num, *animation['frames'].popleft())
+        if animation['frames']:
+            animation['after'] = self.after(ANIM_FRAME_MS, self._animation_frame, p_num)
+        else:
+            del self.animations[p_num]
+            if animation['on_done']:
+                animation['on_done']()
+
+    def _finish_animation(self, p_num):
+        animation = self.animations.pop(p_num, None)
+        if animation is None:
+            return
+        if animation['after']:
+            self.after_cancel(animation['after'])
+        self._place_token(p_num, *animation['frames'][-1])
+        if animation['on_done']:
+            animation['on_done']()
 
     def play_turn(self):
         roll = self.game_logic.roll_die()
@@ -166,17 +326,24 @@ class SnakeLadderGUI(tk.Tk):
         
         current_pos = self.game_logic.player_positions[self.current_player]
         next_pos = current_pos + roll
+        # 한 칸씩 걸어간 뒤, 뱀/사다리가 있으면 미끄러지거나 올라갑니다.
+        path = [(cell, ANIM_STEP_MS) for cell in range(current_pos + 1, min(next_pos, self.game_logic.board_size) + 1)]
 
         if next_pos >= self.game_logic.board_size:
             if next_pos == self.game_logic.board_size:
                 self.game_logic.player_positions[self.current_player] = self.game_logic.board_size
-                self._draw_players()
+                if self.log:
+                    self.log.record(TURN, SNAKE, self.current_player, roll, current_pos, next_pos)
+                    self.log.record(END, SNAKE, self.current_player, self.turn_count)
                 self.message_label.config(text=message)
-                messagebox.showinfo("게임 종료!", f"축하합니다! {p_name}이(가) 승리했습니다!")
                 self.roll_button.config(state="disabled")
+                # 말이 도착한 뒤에 축하 메시지를 띄웁니다.
+                self._animate_move(self.current_player, path, on_done=lambda: messagebox.showinfo(
+                    "게임 종료!", f"축하합니다! {p_name}이(가) 승리했습니다!"))
                 return
             else:
                  message += f"{self.game_logic.board_size}을(를) 초과하여 이동할 수 없습니다."
+                 path = []
         else:
             self.game_logic.player_positions[self.current_player] = next_pos
             message += f"{current_pos}에서 {next_pos}로 이동. "
@@ -184,19 +351,128 @@ class SnakeLadderGUI(tk.Tk):
                 dest = self.game_logic.snakes[next_pos]
                 self.game_logic.player_positions[self.current_player] = dest
                 message += f"뱀을 만나 {dest}으로 미끄러집니다!"
+                path.append((dest, ANIM_SLIDE_MS))
             elif next_pos in self.game_logic.ladders:
                 dest = self.game_logic.ladders[next_pos]
                 self.game_logic.player_positions[self.current_player] = dest
                 message += f"사다리를 타고 {dest}으로 올라갑니다!"
+                path.append((dest, ANIM_SLIDE_MS))
+        if self.log:
+            self.log.record(TURN, SNAKE, self.current_player, roll, current_pos,
+                            self.game_logic.player_positions[self.current_player])
+        self._animate_move(self.current_player, path)
 
         self.current_player = (self.current_player % self.game_logic.num_players) + 1
         self.turn_count += 1
-        next_p_name = self.player_pokemon[self.current_player]['name']
 
         self.turn_label.config(text=f"턴: {self.turn_count // self.game_logic.num_players}")
-        self.player_label.config(text=f"{next_p_name}의 차례", fg=self.player_colors[self.current_player-1])
+        self._update_player_label()
         self.message_label.config(text=message)
-        self._draw_players()
+
+def index_jumps(game_logic):
+    """뱀/사다리를 위쪽 끝의 화면 행별로 묶어 (행 -> [(시작 칸, 도착 칸)], 한 줄기가 걸치는 최대 행 수) 를 반환합니다.
+
+    보이는 행 r0..r1 과 겹치는 줄기는 r0 - 걸치는 행 수 .. r1 행의 묶음에만 있으므로,
+    다시 그릴 때 보드 전체의 뱀/사다리를 훑지 않아도 됩니다.
+    """
+    rows, span = [[] for _ in range(game_logic.rows)], 0
+    cell_rows = game_logic.cell_rows
+    for start, end in list(game_logic.snakes.items()) + list(game_logic.ladders.items()):
+        top, bottom = sorted((cell_rows[start], cell_rows[end]))
+        rows[top].append((start, end))
+        span = max(span, bottom - top)
+    return rows, span
+
+def render_viewport(game_logic, jump_rows, jump_span, x0, y0, width, height, cell_px, font):
+    """보드 좌표 (x0, y0) 부터 width x height 만큼 보이는 부분만 PIL 이미지로 그립니다.
+
+    격자, 칸 번호, 그 영역에 걸친 뱀과 사다리만 그리므로 걸리는 시간은 보드 크기가 아니라 창 크기에 비례합니다.
+    """
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    rows, cols = game_logic.rows, game_logic.cols
+    col_lo, col_hi = max(0, x0 // cell_px), min(cols - 1, (x0 + width) // cell_px)
+    row_lo, row_hi = max(0, y0 // cell_px), min(rows - 1, (y0 + height) // cell_px)
+    right, bottom = cols * cell_px - x0, rows * cell_px - y0
+    for col in range(col_lo, col_hi + 2):
+        x = col * cell_px - x0
+        draw.line((x, max(0, -y0), x, min(height, bottom)), fill="black")
+    for row in range(row_lo, row_hi + 2):
+        y = row * cell_px - y0
+        draw.line((max(0, -x0), y, min(width, right), y), fill="black")
+    detailed = cell_px >= LABEL_MIN_PX
+    if detailed:
+        label = cell_px / 4
+        for row in range(row_lo, row_hi + 1):
+            for col in range(col_lo, col_hi + 1):
+                draw.text((col * cell_px - x0 + label, row * cell_px - y0 + label),
+                          str(game_logic.cell_at(row, col)), fill="black", font=font, anchor="mm")
+
+    def center(cell):
+        return ((game_logic.cell_cols[cell] + 0.5) * cell_px - x0, (game_logic.cell_rows[cell] + 0.5) * cell_px - y0)
+
+    for row in range(max(0, row_lo - jump_span), row_hi + 1):
+        for start, end in jump_rows[row]:
+            a, b = center(start), center(end)
+            # 긴 줄기도 보이는 부분만 그립니다. (넓은 보드의 사다리는 창보다 훨씬 길 수 있음)
+            visible = _clip_segment(a, b, -cell_px, -cell_px, width + cell_px, height + cell_px)
+            if visible is None:
+                continue
+            if end < start:
+                draw.line((_lerp(a, b, visible[0]), _lerp(a, b, visible[1])), fill="red", width=4)
+                if visible[1] == 1.0:
+                    _draw_arrowhead(draw, a, b, "red")
+            elif detailed:
+                _draw_dashed_line(draw, a, b, "green", width=4, dash=4, visible=visible)
+            else:
+                draw.line((_lerp(a, b, visible[0]), _lerp(a, b, visible[1])), fill="green", width=2)
+    return image
+
+def _lerp(a, b, t):
+    return a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t
+
+def _clip_segment(a, b, left, top, right, bottom):
+    """a -> b 선분 중 사각형 안에 드는 구간을 (t0, t1) 로 반환합니다. 겹치지 않으면 None. (Liang-Barsky)"""
+    t0, t1 = 0.0, 1.0
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    for p, q in ((-dx, a[0] - left), (dx, right - a[0]), (-dy, a[1] - top), (dy, bottom - a[1])):
+        if p == 0:
+            if q < 0:
+                return None
+        elif p < 0:
+            t0 = max(t0, q / p)
+        else:
+            t1 = min(t1, q / p)
+        if t0 > t1:
+            return None
+    return t0, t1
+
+def _draw_arrowhead(draw, start, end, color, length=14, half_width=7):
+    """start -> end 선의 끝(end)에 화살촉을 그립니다. (tk 의 arrow=tk.LAST 대신)"""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    distance = math.hypot(dx, dy)
+    if distance == 0:
+        return
+    ux, uy = dx / distance, dy / distance
+    base_x, base_y = end[0] - ux * length, end[1] - uy * length
+    draw.polygon([end, (base_x - uy * half_width, base_y + ux * half_width),
+                  (base_x + uy * half_width, base_y - ux * half_width)], fill=color)
+
+def _draw_dashed_line(draw, start, end, color, width, dash, visible=(0.0, 1.0)):
+    """tk 의 dash=(dash, dash) 와 같은 점선을 그립니다. visible=(t0, t1) 이면 그 구간의 점만 그립니다."""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    distance = math.hypot(dx, dy)
+    if distance == 0:
+        return
+    ux, uy = dx / distance, dy / distance
+    # 잘라 낸 구간에서도 무늬가 어긋나지 않도록 점선 주기에 맞춰 시작합니다.
+    position = (visible[0] * distance) // (2 * dash) * (2 * dash)
+    distance *= visible[1]
+    while position < distance:
+        stop = min(position + dash, distance)
+        draw.line(((start[0] + ux * position, start[1] + uy * position),
+                   (start[0] + ux * stop, start[1] + uy * stop)), fill=color, width=width)
+        position += 2 * dash
 
 def main():
     parser = argparse.ArgumentParser(description="GUI 뱀 사다리 게임")
@@ -204,10 +480,40 @@ def main():
     parser.add_argument("--snakes", type=int, default=8, help="뱀의 수 (기본값: 8)")
     parser.add_argument("--ladders", type=int, default=8, help="사다리의 수 (기본값: 8)")
     parser.add_argument("--seed", type=int, default=None, help="랜덤 시드")
+    parser.add_argument("--rows", type=int, default=10, help="보드 행 수 (기본값: 10)")
+    parser.add_argument("--cols", type=int, default=10, help="보드 열 수 (기본값: 10)")
+    parser.add_argument("--difficulty", type=float, nargs=2, metavar=("MIN", "MAX"),
+                        help="기대 턴 수가 MIN~MAX 인 보드를 찾아서 사용 (numpy 필요)")
+    parser.add_argument("--log", default=None, metavar="PATH",
+                        help="게임 기록 파일 (기본값: GAME_LOG 환경 변수, 없으면 기록하지 않음. game_log.py 로 재생)")
+    parser.add_argument("--stats", action="store_true", default=bool(os.environ.get("GAME_STATS")),
+                        help="종료할 때 포켓몬 캐시와 HTTP 요청 통계 출력 (GAME_STATS=1 과 같음)")
     args = parser.parse_args()
+    if args.seed is not None and not 0 <= args.seed <= MAX_FIELD and (args.log or os.environ.get("GAME_LOG")):
+        parser.error(f"게임을 기록할 때 시드는 0..{MAX_FIELD} 이어야 합니다.")
 
-    app = SnakeLadderGUI(num_players=args.players, num_snakes=args.snakes, num_ladders=args.ladders, seed=args.seed)
+    board = None
+    try:
+        if args.difficulty:
+            from snake_ladder_analysis import find_board
+            found = find_board(*args.difficulty, args.snakes, args.ladders, args.rows * args.cols, seed=args.seed,
+                               max_jump=max_jump_for(args.cols))
+            print(f"기대 턴 수 {found['expected_turns']:.2f}인 보드를 찾았습니다. "
+                  f"(보드 {found['boards']:,}개, {found['boards_per_second']:,.0f} boards/s)")
+            board = (found['snakes'], found['ladders'])
+        app = SnakeLadderGUI(num_players=args.players, num_snakes=args.snakes, num_ladders=args.ladders,
+                             seed=args.seed, board=board, rows=args.rows, cols=args.cols, log=open_log(args.log))
+    except ValueError as e:
+        parser.error(str(e))
+    if tracing.enabled():
+        print(f"첫 입력까지 {app.startup_ms:.0f} ms")
     app.mainloop()
+    if app.log:
+        app.log.close()
+        print(f"게임 기록: {app.log.path} (이벤트 {app.log.count:,}개)")
+    if args.stats:
+        print(f"포켓몬 캐시: {default_cache().stats()}")
+        print(f"HTTP: {default_client().stats()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+import random
+from array import array
+
+MAX_JUMP = 30       # 10열 보드에서 뱀/사다리 길이는 이 값보다 짧아야 합니다. (열 수에 비례해 늘어남)
+SNAKE_MIN_HEAD = 11  # 뱀 머리는 11번 칸부터
+LADDER_TOP_GAP = 10  # 사다리 시작은 board_size - 10 번 칸까지
+
+
+def _pick_pair(pool, occupied, partner_range, rng):
+    """pool 에서 무작위로 한 칸을 고르고, 그 칸과 짝이 될 빈 칸을 partner_range(cell) 범위에서 고릅니다.
+
+    짝을 찾지 못한 칸은 pool 에서 영구히 뺍니다. 칸은 점유되기만 할 뿐 다시 비지 않으므로
+    한 번 실패한 칸은 다시 성공할 수 없고, 따라서 루프는 항상 끝납니다.
+    더 고를 칸이 없으면 None 을 반환합니다.
+    """
+    while pool:
+        i = rng.randrange(len(pool))
+        cell = pool[i]
+        # 순서가 중요하지 않으므로 마지막 원소와 바꿔서 O(1) 로 뺍니다.
+        pool[i] = pool[-1]
+        pool.pop()
+        if occupied[cell]:
+            continue
+        lo, hi = partner_range(cell)
+        if hi - lo >= 2 * MAX_JUMP:
+            # 넓은 보드의 긴 범위는 목록을 만들기 전에 몇 번 찍어 봅니다. (10열 보드의 결과는 그대로)
+            for _ in range(8):
+                partner = rng.randint(lo, hi)
+                if not occupied[partner]:
+                    return cell, partner
+        partners = [c for c in range(lo, hi + 1) if not occupied[c]]
+        if partners:
+            return cell, rng.choice(partners)
+    return None
+
+
+def generate_board(num_snakes, num_ladders, board_size=100, rng=random, max_jump=MAX_JUMP):
+    """빈 칸 집합에서 직접 뱀과 사다리를 골라 (snakes, ladders) 딕셔너리를 만듭니다.
+
+    - 뱀: 머리 11..board_size-1, 꼬리 2..머리-1, 길이 < max_jump
+    - 사다리: 시작 2..board_size-10, 끝 시작+1..board_size-1, 길이 < max_jump
+    - 1번 칸, 마지막 칸, 그리고 이미 쓰인 칸은 다시 쓰지 않습니다.
+    요청을 만족할 수 없으면 무한히 재시도하지 않고 ValueError 를 냅니다.
+    """
+    if num_snakes < 0 or num_ladders < 0:
+        raise ValueError("뱀과 사다리의 수는 0 이상이어야 합니다.")
+    free_cells = board_size - 2
+    needed = 2 * (num_snakes + num_ladders)
+    if needed > free_cells:
+        raise ValueError(
+            f"뱀 {num_snakes}개와 사다리 {num_ladders}개에는 빈 칸 {needed}개가 필요하지만 "
+            f"{board_size}칸 보드에는 {free_cells}칸뿐입니다."
+        )
+    head_cells = max(0, board_size - SNAKE_MIN_HEAD)
+    if num_snakes > head_cells:
+        raise ValueError(f"뱀 머리를 둘 수 있는 칸은 {head_cells}개뿐입니다. (요청: {num_snakes}개)")
+    start_cells = max(0, board_size - LADDER_TOP_GAP - 1)
+    if num_ladders > start_cells:
+        raise ValueError(f"사다리 시작점을 둘 수 있는 칸은 {start_cells}개뿐입니다. (요청: {num_ladders}개)")
+
+    occupied = bytearray(board_size + 1)
+    occupied[1] = occupied[board_size] = 1
+    snakes, ladders = {}, {}
+
+    snake_pool = list(range(SNAKE_MIN_HEAD, board_size))
+    snake_range = lambda head: (max(2, head - max_jump + 1), head - 1)
+    for _ in range(num_snakes):
+        pair = _pick_pair(snake_pool, occupied, snake_range, rng)
+        if pair is None:
+            raise ValueError(f"뱀을 {len(snakes)}개까지만 배치할 수 있습니다. (요청: {num_snakes}개)")
+        head, tail = pair
+        snakes[head] = tail
+        occupied[head] = occupied[tail] = 1
+
+    ladder_pool = list(range(2, board_size - LADDER_TOP_GAP + 1))
+    ladder_range = lambda start: (start + 1, min(board_size - 1, start + max_jump - 1))
+    for _ in range(num_ladders):
+        pair = _pick_pair(ladder_pool, occupied, ladder_range, rng)
+        if pair is None:
+            raise ValueError(
+                f"뱀 {num_snakes}개를 놓은 뒤 사다리는 {len(ladders)}개까지만 배치할 수 있습니다. (요청: {num_ladders}개)"
+            )
+        start, end = pair
+        ladders[start] = end
+        occupied[start] = occupied[end] = 1
+    return snakes, ladders
+
+
+def build_jump_table(snakes, ladders, board_size=100):
+    table = list(range(board_size + 1))
+    for head, tail in snakes.items():
+        table[head] = tail
+    for start, end in ladders.items():
+        table[start] = end
+    return table
+
+
+def max_jump_for(cols):
+    """열 수에 비례하는 뱀/사다리 길이 상한. 넓은 보드에서도 한 번에 약 세 줄을 오르내립니다."""
+    return max(MAX_JUMP, MAX_JUMP * cols // 10)
+
+
+def cell_layout(rows, cols):
+    """칸 번호 -> (화면 행, 열) 을 array 두 개로 반환합니다. (지그재그 배치, 1번 칸이 왼쪽 아래, 인덱스 0은 사용하지 않음)"""
+    cell_rows, cell_cols = array('H', [0]), array('H', [0])
+    for line in range(rows):
+        row = rows - 1 - line
+        order = range(cols) if line % 2 == 0 else range(cols - 1, -1, -1)
+        cell_rows.extend([row] * cols)
+        cell_cols.extend(order)
+    return cell_rows, cell_cols
+
+
+def cell_at(row, col, rows, cols):
+    """cell_layout 의 역: 화면 (행, 열) 에 있는 칸 번호."""
+    line = rows - 1 - row
+    return line * cols + (col if line % 2 == 0 else cols - 1 - col) + 1
+
+
+def advance(table, position, roll):
+    """play_turn 과 같은 규칙으로 한 번 움직인 칸을 반환합니다. 마지막 칸을 넘어가면 제자리에 머뭅니다."""
+    landing = position + roll
+    if landing >= len(table):
+        return position
+    return table[landing]
+
+
+# 게임의 핵심 로직을 담당하는 클래스
+class SnakeLadderGameLogic:
+    def __init__(self, num_players=2, num_snakes=8, num_ladders=8, seed=None, board=None, rows=10, cols=10):
+        if rows < 2 or cols < 2:
+            raise ValueError(f"보드는 2x2 이상이어야 합니다. (요청: {rows}x{cols})")
+        self.rows = rows
+        self.cols = cols
+        self.board_size = rows * cols
+        self.max_jump = max_jump_for(cols)
+        self.num_players = num_players
+        self.player_positions = {i: 1 for i in range(1, self.num_players + 1)}
+        self.snakes = {}
+        self.ladders = {}
+        # 보드와 주사위는 각자의 난수 생성기를 씁니다. 시드 하나로 게임 전체를 다시 만들 수 있습니다. (game_log.py)
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.dice = random.Random(seed + 1)
+        if board is not None:
+            # 난이도 탐색 등으로 미리 만든 (snakes, ladders) 를 그대로 씁니다.
+            self.snakes, self.ladders = dict(board[0]), dict(board[1])
+        else:
+            self._place_snakes_and_ladders(num_snakes, num_ladders)
+        # 칸마다 몇 바이트씩만 쓰도록 좌표와 점프 테이블은 array 로 한 번만 만들어 둡니다.
+        self.cell_rows, self.cell_cols = cell_layout(rows, cols)
+        self.table = array('I', build_jump_table(self.snakes, self.ladders, self.board_size))
+
+    def _place_snakes_and_ladders(self, num_snakes, num_ladders):
+        self.snakes, self.ladders = generate_board(num_snakes, num_ladders, self.board_size, self.rng,
+                                                  max_jump=self.max_jump)
+
+    def jump_table(self):
+        """칸 번호 -> 뱀/사다리를 적용한 최종 칸 번호 배열을 반환합니다. (인덱스 0은 사용하지 않음)"""
+        return self.table
+
+    def cell_at(self, row, col):
+        return cell_at(row, col, self.rows, self.cols)
+
+    def roll_die(self):
+        return self.dice.randint(1, 6)
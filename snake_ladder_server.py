@@ -0,0 +1,314 @@
+import argparse
+import asyncio
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+from snake_ladder_logic import advance, build_jump_table, generate_board
+
+MAX_PLAYERS = 4
+BOARD_SIZE = 100
+BOARD_CACHE = 1024     # 시드를 지정한 보드는 이만큼 기억해 두고 여러 게임이 같은 점프 테이블을 함께 씁니다.
+ANALYSIS_CACHE = 1024
+MAX_GAMES_PER_CONNECTION = 10_000
+GAME_COMMANDS = {"ROLL", "STATE", "BOARD", "ANALYZE", "END"}  # 게임 번호를 받는 명령
+
+# --- 줄 단위 프로토콜 --------------------------------------------------------
+# 요청과 응답은 모두 공백으로 구분한 한 줄(UTF-8, \n)입니다. 실패하면 "ERR <메시지>" 를 돌려줍니다.
+#   NEW [플레이어 수] [뱀 수] [사다리 수] [시드]  -> GAME <게임 번호> <플레이어 수> <보드 크기>
+#   ROLL <게임 번호>                           -> MOVED <게임 번호> <플레이어> <주사위> <출발> <도착> <사건>
+#        사건: - (그냥 이동), SNAKE, LADDER, BOUNCE (마지막 칸을 넘어 제자리), WIN (게임이 끝나고 번호는 반납)
+#   STATE <게임 번호>                          -> STATE <게임 번호> <차례> <턴 수> <위치1> <위치2> ...
+#   BOARD <게임 번호>                          -> BOARD <게임 번호> <칸>:<도착> ...   (뱀과 사다리)
+#   ANALYZE <게임 번호>                        -> ANALYSIS <게임 번호> <기대 턴 수> <기대 라운드 수> <승률1> <승률2> ...
+#   END <게임 번호>                            -> ENDED <게임 번호>
+#   STATS                                    -> STATS active=.. games=.. turns=.. connections=.. memory=..
+#   QUIT                                     -> BYE (연결 종료)
+# 게임 번호를 받는 명령은 그 게임을 만든 연결에서만 쓸 수 있습니다. (다른 연결의 번호는 "ERR 이 연결에 없는 게임: N")
+# 연결이 끊기면 그 연결이 만든 게임 중 아직 끝나지 않은 것만 정리됩니다.
+
+
+class GameTable:
+    """여러 게임의 상태를 배열 몇 개로 관리합니다.
+
+    게임 하나는 말 위치 MAX_PLAYERS 칸(2바이트씩), 플레이어 수와 차례(1바이트씩), 턴 수(4바이트),
+    그리고 점프 테이블 참조뿐입니다. 끝난 게임의 번호는 재사용하고, 같은 보드는 점프 테이블을 함께 씁니다.
+    """
+
+    FREE = 0  # players 칸의 0은 빈 슬롯을 뜻합니다.
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.positions = array('H')
+        self.players = array('B')
+        self.current = array('B')
+        self.turns = array('I')
+        self.tables = []
+        self.free_ids = []
+        self.active = 0
+        self.created = 0
+        self.total_turns = 0
+
+    def new_game(self, table, num_players):
+        """table(점프 테이블) 위에서 새 게임을 만들고 게임 번호를 반환합니다."""
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"플레이어 수는 1~{MAX_PLAYERS} 명이어야 합니다.")
+        self.active += 1
+        self.created += 1
+        if self.free_ids:
+            game_id = self.free_ids.pop()
+            self.positions[game_id * MAX_PLAYERS:(game_id + 1) * MAX_PLAYERS] = array('H', [1] * MAX_PLAYERS)
+            self.players[game_id] = num_players
+            self.current[game_id] = 0
+            self.turns[game_id] = 0
+            self.tables[game_id] = table
+            return game_id
+        self.positions.extend([1] * MAX_PLAYERS)
+        self.players.append(num_players)
+        self.current.append(0)
+        self.turns.append(0)
+        self.tables.append(table)
+        return len(self.players) - 1
+
+    def _check(self, game_id):
+        if not 0 <= game_id < len(self.players) or self.players[game_id] == self.FREE:
+            raise KeyError(f"없는 게임: {game_id}")
+
+    def roll(self, game_id, roll=None):
+        """차례인 플레이어를 움직이고 (플레이어, 주사위, 출발, 도착, 사건) 을 반환합니다."""
+        self._check(game_id)
+        if roll is None:
+            roll = self.rng.randint(1, 6)
+        table = self.tables[game_id]
+        player = self.current[game_id]
+        slot = game_id * MAX_PLAYERS + player
+        start = self.positions[slot]
+        end = advance(table, start, roll)
+        self.positions[slot] = end
+        self.turns[game_id] += 1
+        self.total_turns += 1
+        landing = start + roll
+        if end == len(table) - 1:
+            event = "WIN"
+            self.end(game_id)
+        else:
+            if landing >= len(table):
+                event = "BOUNCE"
+            elif end < landing:
+                event = "SNAKE"
+            elif end > landing:
+                event = "LADDER"
+            else:
+                event = "-"
+            self.current[game_id] = (player + 1) % self.players[game_id]
+        return player + 1, roll, start, end, event
+
+    def state(self, game_id):
+        """(차례인 플레이어, 턴 수, [위치...]) 를 반환합니다."""
+        self._check(game_id)
+        base = game_id * MAX_PLAYERS
+        return (self.current[game_id] + 1, self.turns[game_id],
+                self.positions[base:base + self.players[game_id]].tolist())
+
+    def table(self, game_id):
+        self._check(game_id)
+        return self.tables[game_id]
+
+    def end(self, game_id):
+        if 0 <= game_id < len(self.players) and self.players[game_id] != self.FREE:
+            self.players[game_id] = self.FREE
+            self.tables[game_id] = None
+            self.free_ids.append(game_id)
+            self.active -= 1
+
+    def memory_bytes(self):
+        """상태 배열과 (서로 다른) 점프 테이블이 차지하는 바이트 수."""
+        arrays = (self.positions, self.players, self.current, self.turns)
+        size = sum(a.itemsize * len(a) for a in arrays) + 8 * len(self.tables)
+        unique = {id(t): t for t in self.tables if t is not None}
+        return size + sum(t.itemsize * len(t) for t in unique.values())
+
+
+def make_table(num_snakes, num_ladders, seed=None, board_size=BOARD_SIZE):
+    """보드를 만들어 점프 테이블(array 'H')로 반환합니다. 실행기(워커 프로세스)에서 호출됩니다."""
+    snakes, ladders = generate_board(num_snakes, num_ladders, board_size, random.Random(seed))
+    return array('H', build_jump_table(snakes, ladders, board_size))
+
+
+def analyze_table(table, num_players):
+    """(기대 턴 수, 기대 라운드 수, [순번별 승률]) 을 반환합니다. 실행기(워커 프로세스)에서 호출됩니다."""
+    # NumPy 는 워커에서만 가져옵니다.
+    from snake_ladder_analysis import analyze_boards
+    result = analyze_boards([table.tolist()], num_players)
+    return (float(result['expected_turns'][0]), float(result['expected_rounds'][0]),
+            result['win_probabilities'][0].tolist())
+
+
+class SnakeLadderServer:
+    """GameTable 하나를 여러 연결이 함께 쓰는 asyncio 서버.
+
+    턴 처리는 배열 몇 칸을 고치는 일이라 이벤트 루프에서 바로 하고,
+    보드 생성과 분석은 executor 로 보내 루프가 멈추지 않게 합니다.
+    """
+
+    def __init__(self, executor=None, rng=None):
+        self.games = GameTable(rng)
+        self.executor = executor
+        self.boards = OrderedDict()    # (뱀, 사다리, 시드) -> 점프 테이블 Future
+        self.analyses = OrderedDict()  # (점프 테이블 바이트, 플레이어 수) -> 분석 Future
+        self.connections = 0
+
+    async def _shared(self, cache, key, limit, func, *args):
+        """같은 키의 작업은 한 번만 executor 로 보내고, 결과 Future 를 cache 에 limit 개까지 기억합니다."""
+        future = cache.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            cache[key] = future
+            if len(cache) > limit:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        try:
+            return await asyncio.shield(future)
+        except BaseException:
+            # 실패하거나 실행기에서 취소된 결과는 기억하지 않습니다. (이 요청만 취소되었으면 작업은 계속됩니다)
+            if future.done() and (future.cancelled() or future.exception() is not None):
+                cache.pop(key, None)
+            raise
+
+    async def new_game(self, num_players=2, num_snakes=8, num_ladders=8, seed=None):
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"플레이어 수는 1~{MAX_PLAYERS} 명이어야 합니다.")
+        if seed is None:
+            table = await asyncio.get_running_loop().run_in_executor(
+                self.executor, make_table, num_snakes, num_ladders)
+        else:
+            table = await self._shared(self.boards, (num_snakes, num_ladders, seed), BOARD_CACHE,
+                                       make_table, num_snakes, num_ladders, seed)
+        return self.games.new_game(table, num_players)
+
+    async def analyze(self, game_id):
+        table = self.games.table(game_id)
+        num_players = self.games.players[game_id]
+        return await self._shared(self.analyses, (table.tobytes(), num_players), ANALYSIS_CACHE,
+                                  analyze_table, table, num_players)
+
+    async def handle_line(self, line, owned):
+        """요청 한 줄을 처리하고 응답 한 줄(개행 제외)을 반환합니다.
+
+        owned 는 이 연결이 만들었고 아직 끝나지 않은 게임 번호 집합입니다. 끝난 번호는 다른 연결이 다시 받을 수 있으므로
+        게임을 끝내는 일(END, WIN, 연결 종료)은 모두 owned 에서 빼는 일과 함께 합니다.
+        """
+        parts = line.split()
+        if not parts:
+            raise ValueError("빈 요청")
+        command, args = parts[0].upper(), [int(a) for a in parts[1:]]
+        if command in GAME_COMMANDS:
+            if not args:
+                raise ValueError(f"{command} <게임 번호>")
+            if args[0] not in owned:
+                raise KeyError(f"이 연결에 없는 게임: {args[0]}")
+        if command == "ROLL":
+            player, roll, start, end, event = self.games.roll(args[0])
+            if event == "WIN":
+                owned.discard(args[0])
+            return f"MOVED {args[0]} {player} {roll} {start} {end} {event}"
+        if command == "NEW":
+            if len(owned) >= MAX_GAMES_PER_CONNECTION:
+                raise ValueError(f"한 연결에서 만들 수 있는 게임은 {MAX_GAMES_PER_CONNECTION}개까지입니다.")
+            if len(args) > 4:
+                raise ValueError("NEW [플레이어 수] [뱀 수] [사다리 수] [시드]")
+            num_players = args[0] if args else 2
+            game_id = await self.new_game(*args)
+            owned.add(game_id)
+            return f"GAME {game_id} {num_players} {BOARD_SIZE}"
+        if command == "STATE":
+            current, turns, positions = self.games.state(args[0])
+            return f"STATE {args[0]} {current} {turns} " + " ".join(map(str, positions))
+        if command == "BOARD":
+            table = self.games.table(args[0])
+            jumps = " ".join(f"{cell}:{dest}" for cell, dest in enumerate(table) if cell != dest)
+            return f"BOARD {args[0]} {jumps}".rstrip()
+        if command == "ANALYZE":
+            expected_turns, expected_rounds, win = await self.analyze(args[0])
+            return f"ANALYSIS {args[0]} {expected_turns:.4f} {expected_rounds:.4f} " + " ".join(f"{p:.4f}" for p in win)
+        if command == "END":
+            self.games.end(args[0])
+            owned.discard(args[0])
+            return f"ENDED {args[0]}"
+        if command == "STATS":
+            games = self.games
+            return (f"STATS active={games.active} games={games.created} turns={games.total_turns} "
+                    f"connections={self.connections} memory={games.memory_bytes()}")
+        raise ValueError(f"알 수 없는 명령: {command}")
+
+    async def handle_connection(self, reader, writer):
+        self.connections += 1
+        owned = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not line:
+                    break
+                line = line.decode("utf-8", errors="replace").strip()
+                if line.upper() == "QUIT":
+                    writer.write(b"BYE\n")
+                    break
+                try:
+                    response = await self.handle_line(line, owned)
+                except asyncio.CancelledError:
+                    # 서버가 이 연결을 끝내는 중이면 그대로 올리고, 실행기 작업이 취소된 것이면 오류로 답합니다.
+                    if asyncio.current_task().cancelling():
+                        raise
+                    response = "ERR 작업이 취소되었습니다."
+                except Exception as e:
+                    # 워커 프로세스가 죽거나(BrokenProcessPool) 메모리가 모자라도 이 줄만 실패하고 연결은 계속됩니다.
+                    message = e.args[0] if isinstance(e, KeyError) and e.args else str(e) or type(e).__name__
+                    response = f"ERR {message}"
+                writer.write(response.encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in owned:
+                self.games.end(game_id)
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self, host, port, ready=None):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
+        address = server.sockets[0].getsockname()
+        print(f"뱀 사다리 서버 실행 중: {address[0]}:{address[1]}", flush=True)
+        if ready is not None:
+            ready(address)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 뱀 사다리 게임을 한 프로세스에서 돌리는 asyncio 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766, help="포트 (0 이면 빈 포트, 기본값: 8766)")
+    parser.add_argument("--workers", type=int, default=1, help="보드 생성/분석 워커 프로세스 수 (기본값: 1)")
+    parser.add_argument("--seed", type=int, default=None, help="주사위 랜덤 시드")
+    args = parser.parse_args()
+
+    from concurrent.futures import ProcessPoolExecutor
+    start = time.perf_counter()
+    server = None
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        server = SnakeLadderServer(executor, random.Random(args.seed))
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    games = server.games
+    print(f"종료: 게임 {games.created:,}개, 턴 {games.total_turns:,}개, {time.perf_counter() - start:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
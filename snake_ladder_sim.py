@@ -0,0 +1,134 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from snake_ladder_logic import SnakeLadderGameLogic
+
+DIE_FACES = 6
+CHUNK_GAMES = 1 << 16  # 시드는 워커 수가 아니라 이 크기의 청크 단위로 나눕니다.
+
+
+def padded_jump_table(table):
+    """jump_table() 뒤에 넘침 칸(-1)을 덧붙여, pos + roll 을 그대로 인덱스로 쓸 수 있게 합니다."""
+    table = np.asarray(table, dtype=np.int32)
+    return np.concatenate([table, np.full(DIE_FACES, -1, dtype=np.int32)])
+
+
+def _simulate_chunk(table, num_games, num_players, seed_seq, max_turns):
+    """한 청크의 게임을 말(token) 단위로 한꺼번에 진행해 각 말이 도착한 턴 수를 (게임, 플레이어) 배열로 반환합니다.
+
+    플레이어끼리는 서로 영향을 주지 않으므로 모든 말을 독립적으로 굴린 뒤,
+    차례 순서를 따져 승자를 정합니다. 도착하지 못한 말은 max_turns + 1 로 남습니다.
+    """
+    rng = np.random.default_rng(seed_seq)
+    padded = padded_jump_table(table)
+    board_size = len(table) - 1
+    num_tokens = num_games * num_players
+
+    turns = np.full(num_tokens, max_turns + 1, dtype=np.int32)
+    index = np.arange(num_tokens)
+    positions = np.ones(num_tokens, dtype=np.int32)
+    for turn in range(1, max_turns + 1):
+        landing = positions + rng.integers(1, DIE_FACES + 1, size=positions.size, dtype=np.int32)
+        finished = landing == board_size
+        if finished.any():
+            turns[index[finished]] = turn
+            keep = ~finished
+            index, positions, landing = index[keep], positions[keep], landing[keep]
+            if not index.size:
+                break
+        # 100을 넘기면 이동하지 않고, 그 외에는 뱀/사다리를 적용합니다.
+        moved = padded[landing]
+        positions = np.where(moved < 0, positions, moved)
+    return turns.reshape(num_games, num_players)
+
+
+def _summarize_chunk(table, num_games, num_players, seed_seq, max_turns):
+    """청크 결과를 정수 카운트로 줄입니다. 정수 합은 더하는 순서와 무관하므로 워커 수와 상관없이 결과가 같습니다."""
+    turns = _simulate_chunk(table, num_games, num_players, seed_seq, max_turns)
+    # 전체 차례 순서상 몇 번째 차례에 도착했는지로 승자를 정합니다.
+    finish_order = (turns.astype(np.int64) - 1) * num_players + np.arange(num_players)
+    winners = finish_order.argmin(axis=1)
+    rounds = turns[np.arange(num_games), winners]
+    resolved = rounds <= max_turns
+    return {
+        'turn_counts': np.bincount(turns.ravel(), minlength=max_turns + 2),
+        'round_counts': np.bincount(rounds, minlength=max_turns + 2),
+        'wins': np.bincount(winners[resolved], minlength=num_players),
+    }
+
+
+def simulate(game_logic, num_games, num_players=None, seed=None, workers=1, max_turns=1000):
+    """num_games 판을 헤드리스로 진행하고 집계 결과를 반환합니다.
+
+    게임은 CHUNK_GAMES 단위로 나뉘고, 각 청크는 SeedSequence(seed).spawn 으로 얻은 자기만의 시드를 씁니다.
+    그래서 같은 seed 라면 workers 값과 관계없이 결과가 똑같습니다.
+    """
+    if num_players is None:
+        num_players = game_logic.num_players
+    table = game_logic.jump_table()
+    sizes = [CHUNK_GAMES] * (num_games // CHUNK_GAMES)
+    if num_games % CHUNK_GAMES:
+        sizes.append(num_games % CHUNK_GAMES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([table] * len(sizes), sizes, [num_players] * len(sizes), seeds, [max_turns] * len(sizes))
+
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_summarize_chunk, *args))
+    else:
+        parts = list(map(_summarize_chunk, *args))
+
+    turn_counts = sum(part['turn_counts'] for part in parts)
+    round_counts = sum(part['round_counts'] for part in parts)
+    wins = sum(part['wins'] for part in parts)
+    tokens = num_games * num_players
+    steps = np.arange(max_turns + 2)
+    return {
+        'games': num_games,
+        # 마지막 칸(max_turns + 1)은 끝나지 않은 말/게임입니다.
+        'turn_counts': turn_counts[:max_turns + 1],
+        'round_counts': round_counts[:max_turns + 1],
+        'unresolved_tokens': int(turn_counts[-1]),
+        'unresolved_games': int(round_counts[-1]),
+        'mean_turns': float((turn_counts[:-1] * steps[:-1]).sum() / max(tokens - turn_counts[-1], 1)),
+        'mean_rounds': float((round_counts[:-1] * steps[:-1]).sum() / max(num_games - round_counts[-1], 1)),
+        'win_probabilities': (wins / num_games).tolist(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 뱀 사다리 몬테카를로 시뮬레이터")
+    parser.add_argument("--players", type=int, default=2, help="플레이어 수 (기본값: 2)")
+    parser.add_argument("--snakes", type=int, default=8, help="뱀의 수 (기본값: 8)")
+    parser.add_argument("--ladders", type=int, default=8, help="사다리의 수 (기본값: 8)")
+    parser.add_argument("--board-seed", type=int, default=None, help="보드 생성용 랜덤 시드")
+    parser.add_argument("--seed", type=int, default=None, help="시뮬레이션 랜덤 시드")
+    parser.add_argument("--games", type=int, default=1_000_000, help="시뮬레이션할 게임 수 (기본값: 1000000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--compare", action="store_true", help="snake_ladder_analysis 의 정확한 값과 비교")
+    args = parser.parse_args()
+
+    game_logic = SnakeLadderGameLogic(args.players, args.snakes, args.ladders, args.board_seed)
+    start = time.perf_counter()
+    result = simulate(game_logic, args.games, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games:,}판 / {elapsed:.2f}초 ({args.games / elapsed:,.0f} games/s, 워커 {args.workers}개)")
+    print(f"평균 턴 수 (1인): {result['mean_turns']:.3f}")
+    print(f"평균 라운드 수 ({args.players}인): {result['mean_rounds']:.3f}")
+    for i, p in enumerate(result['win_probabilities'], start=1):
+        print(f"플레이어 {i} 승리 확률: {p:.4f}")
+
+    if args.compare:
+        from snake_ladder_analysis import analyze_board
+        exact = analyze_board(game_logic)
+        print(f"[정확한 값] 기대 턴 수: {exact['expected_turns']:.3f}, 기대 라운드 수: {exact['expected_rounds']:.3f}")
+        print("[정확한 값] 승리 확률: " + ", ".join(f"{p:.4f}" for p in exact['win_probabilities']))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import email.utils
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from number_facts import offline_fact
+
+
+def _tiny_png(seed):
+    """id 마다 색이 다른 8x8 PNG 를 만듭니다. (Pillow 없이)"""
+    color = bytes(((seed * 67) % 256, (seed * 131) % 256, (seed * 29) % 256))
+    raw = b"".join(b"\0" + color * 8 for _ in range(8))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """PokéAPI(/pokemon/<id>, /sprite/<id>.png)와 Numbers API(/<숫자>)를 흉내 내는 대역 서버.
+
+    server.latency 초만큼 늦게 답하고, server.error_rate 확률로 503 을 돌려줍니다.
+    모든 응답에 ETag/Last-Modified 를 붙이고 조건부 요청에는 304 로 답합니다.
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # 헤더와 본문을 따로 쓰므로, 켜 두면 keep-alive 연결에서 지연 ACK 를 기다립니다.
+    started = email.utils.formatdate(usegmt=True)
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        if random.random() < server.error_rate:
+            self._send(503, b"injected error", "text/plain")
+            return
+        parts = self.path.strip("/").split("/")
+        try:
+            if parts[0] == "pokemon":
+                pokemon_id = int(parts[1])
+                host = self.headers.get("Host")
+                body = json.dumps({'id': pokemon_id, 'name': f"poke{pokemon_id}",
+                                   'sprites': {'front_default': f"http://{host}/sprite/{pokemon_id}.png"}}).encode()
+                kind = "application/json"
+            elif parts[0] == "sprite":
+                body, kind = _tiny_png(int(parts[1].split(".")[0])), "image/png"
+            else:
+                body, kind = offline_fact(int(parts[0])).encode(), "text/plain"
+        except (IndexError, ValueError):
+            self._send(404, b"not found", "text/plain")
+            return
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", kind, etag)
+        else:
+            self._send(200, body, kind, etag)
+
+    def _send(self, status, body, kind, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.started)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def stand_in_server(port=0, latency=0.0, error_rate=0.0):
+    """대역 서버를 만들어 반환합니다. (serve_forever 는 호출하는 쪽에서)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandInHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.error_rate = error_rate
+    server.connections = 0
+    server.lock = threading.Lock()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PokéAPI / Numbers API 대역 서버")
+    parser.add_argument("--serve", type=int, default=8000, metavar="PORT", help="대역 서버 포트 (기본값: 8000)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 을 돌려줄 확률 (0~1)")
+    args = parser.parse_args()
+
+    server = stand_in_server(args.serve, args.latency, args.error_rate)
+    print(f"http://127.0.0.1:{args.serve} 에서 대역 서버 실행 중: "
+          f"POKEAPI_URL=http://127.0.0.1:{args.serve} NUMBERS_API_URL=http://127.0.0.1:{args.serve}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 게임 모듈은 저장소 최상위의 평평한 파일들이므로 그 위치를 import 경로에 넣습니다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
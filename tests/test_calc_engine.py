@@ -0,0 +1,101 @@
+import random
+import time
+
+import pytest
+
+from calc_engine import ERROR_TEXT, CalcEngine, CalcError, calculate, compile_expression, evaluate_stream, tokenize
+
+
+def python_result(text):
+    """예전 계산기처럼 eval 로 계산한 결과 문자열."""
+    try:
+        return str(eval(text, {"__builtins__": {}}))
+    except Exception:
+        return ERROR_TEXT
+
+
+def random_expression(rng, depth=0):
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice([str(rng.randint(0, 20)), f"{rng.uniform(0, 10):.2f}", ".5", "1e3", "2.5e-2"])
+    kind = rng.random()
+    if kind < 0.15:
+        return rng.choice("+-") + random_expression(rng, depth + 1)
+    if kind < 0.3:
+        return f"({random_expression(rng, depth + 1)})"
+    op = rng.choice(["+", "-", "*", "/", "//", "%", "**"])
+    if op == "**":
+        # eval 쪽이 아주 큰 수를 만들지 않도록 지수는 작은 정수로 둡니다.
+        return f"{random_expression(rng, depth + 1)}**{rng.choice(['2', '3', '-1', '0', '(-2)'])}"
+    return f"{random_expression(rng, depth + 1)}{op}{random_expression(rng, depth + 1)}"
+
+
+@pytest.mark.parametrize("text", [
+    "1+2*3", "(1+2)*3", "-2**2", "2**-1", "2**3**2", "-7//2", "-7%3", "7/2", "1/3", "0.1+0.2",
+    "1e3+1", ".5*2", "--3", "+-+3", "10//0", "1/0", "0**-1", "1e308*10", "2**0.5", "(-8)**(1/3)",
+    "3**200", "12.", "1.5e+2%7",
+    # 4300자리 경계: 9*10**4299 는 4300자리, 10**4300 은 4301자리입니다. (비트 수는 둘 다 14285)
+    "9*10**4299", "10**4299*9", "-9*10**4299", "10**4300", "9*10**4299+10**4299", "-(10**4300)",
+])
+def test_matches_eval(text):
+    assert calculate(text) == python_result(text)
+
+
+def test_matches_eval_on_random_expressions():
+    rng = random.Random(9)
+    for _ in range(3000):
+        text = random_expression(rng)
+        assert calculate(text) == python_result(text), text
+
+
+def test_caret_is_power():
+    assert calculate("2^10") == "1024"
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os')", "x+1", "1+", "()", "2 3", "1,2", "012", "(1+2", "1+2)", "lambda: 1", "[1]", "", "3!",
+])
+def test_rejects_non_arithmetic(text):
+    with pytest.raises(CalcError):
+        compile_expression(text)
+    assert calculate(text) == ERROR_TEXT
+
+
+def test_leading_zero_rules_follow_python():
+    assert calculate("0") == "0"
+    assert calculate("000") == "0"
+    assert calculate("0.5") == "0.5"
+    with pytest.raises(CalcError):
+        tokenize("007")
+
+
+@pytest.mark.parametrize("text", ["9**9**9", "10**5000", "2**100000000", "(10**2000)*(10**2500)", "(2**14000+1)**2",
+                                  "10**4300", "10**4299*10"])
+def test_huge_results_fail_fast(text):
+    engine = CalcEngine()
+    start = time.perf_counter()
+    with pytest.raises(CalcError):
+        engine.evaluate(text)
+    assert time.perf_counter() - start < 2.5
+    engine.close()
+
+
+def test_result_at_digit_limit_is_allowed():
+    assert len(calculate("10**4299")) == 4300
+
+
+def test_heavy_programs_run_in_worker():
+    engine = CalcEngine(heavy_cost=0)
+    try:
+        assert compile_expression("2**100*3").cost > 0
+        assert engine.evaluate("2**100*3") == 2 ** 100 * 3
+        assert engine.submit("2**100+1").result(timeout=10) == 2 ** 100 + 1
+        assert isinstance(engine.submit("1+").exception(), CalcError)
+    finally:
+        engine.close()
+
+
+def test_stream_keeps_input_order():
+    lines = [f"{i}*{i}\n" for i in range(50)] + ["1/0\n", "oops\n"]
+    expected = [str(i * i) for i in range(50)] + [ERROR_TEXT, ERROR_TEXT]
+    assert list(evaluate_stream(iter(lines), workers=1, chunk_lines=7)) == expected
+    assert list(evaluate_stream(iter(lines), workers=2, chunk_lines=7, window=2)) == expected
@@ -0,0 +1,151 @@
+import random
+
+import pytest
+
+from game_log import (END, HANGMAN, HEADER, JUMP, MAGIC, RECORD, SNAKE, START, TURN, UPDOWN, UPDOWN_CODES, EventLog,
+                      dice_for_games, letter_mask, read_log, replay)
+from snake_ladder_logic import SnakeLadderGameLogic, advance
+
+
+def play_snake(log, seed, players=2):
+    game = SnakeLadderGameLogic(players, 6, 6, seed=seed)
+    log.record(START, SNAKE, players, game.seed, game.rows, game.cols)
+    for source, target in {**game.snakes, **game.ladders}.items():
+        log.record(JUMP, SNAKE, 0, source, target)
+    table, positions = game.jump_table(), game.player_positions
+    player, turns = 1, 0
+    while True:
+        roll = game.roll_die()
+        start = positions[player]
+        positions[player] = advance(table, start, roll)
+        turns += 1
+        log.record(TURN, SNAKE, player, roll, start, positions[player])
+        if positions[player] == game.board_size:
+            log.record(END, SNAKE, player, turns)
+            return
+        player = player % players + 1
+
+
+def play_hangman(log, rng, word="PIKACHU", lives=8):
+    log.record(START, HANGMAN, 0, 25, lives, letter_mask(word))
+    missing, guessed = set(word), 0
+    for letter in rng.sample("ABCDEFGHIJKLMNOPQRSTUVWXYZ", 26):
+        hit = letter in missing
+        missing.discard(letter)
+        lives -= not hit
+        guessed += 1
+        log.record(TURN, HANGMAN, ord(letter), hit, lives)
+        if not missing or lives == 0:
+            log.record(END, HANGMAN, int(not missing), guessed)
+            return
+
+
+def play_updown(log, secret, low=1, high=1000):
+    log.record(START, UPDOWN, 0, secret, low, high)
+    count = 0
+    while True:
+        guess = (low + high) // 2
+        count += 1
+        result = "UP" if guess < secret else "DOWN" if guess > secret else "CORRECT"
+        log.record(TURN, UPDOWN, 0, guess, UPDOWN_CODES[result], count)
+        if result == "CORRECT":
+            log.record(END, UPDOWN, 0, count)
+            return
+        low, high = (guess + 1, high) if guess < secret else (low, guess - 1)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = str(tmp_path / "games.glog")
+    rng = random.Random(3)
+    # 버퍼를 작게 잡아 게임 중간에도 여러 번 써지게 합니다.
+    with EventLog(path, buffer_records=5) as log:
+        for i in range(30):
+            play_snake(log, seed=i, players=i % 4 + 1)
+            play_hangman(log, rng)
+            play_updown(log, secret=rng.randint(1, 1000))
+    return path
+
+
+def test_round_trip(log_path):
+    records, truncated = read_log(log_path)
+    assert truncated == 0
+    assert records[0]['kind'] == START and records[0]['game'] == SNAKE
+    result = replay(records)
+    assert result['mismatches'] == 0 and result['first_mismatch'] is None
+    assert result['games'] == 90
+    assert {name: s['games'] for name, s in result['by_game'].items()} == {'snake': 30, 'hangman': 30, 'updown': 30}
+    assert sum(s['events'] for s in result['by_game'].values()) == len(records)
+
+
+def test_appends_to_existing_log(log_path):
+    before = len(read_log(log_path)[0])
+    with EventLog(log_path) as log:
+        play_updown(log, secret=1)
+        count = log.count
+    records, _ = read_log(log_path)
+    assert len(records) == before + count
+    assert replay(records)['mismatches'] == 0
+
+
+def test_partial_last_record_is_dropped(log_path):
+    with open(log_path, "ab") as f:
+        f.write(RECORD.pack(TURN, SNAKE, 1, 2, 3, 4)[:7])
+    records, truncated = read_log(log_path)
+    assert truncated == 7
+    assert replay(records)['mismatches'] == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.glog"
+    path.write_bytes(HEADER.pack(MAGIC, 99, RECORD.size))
+    with pytest.raises(ValueError):
+        read_log(str(path))
+    with pytest.raises(ValueError):
+        EventLog(str(path))
+
+
+def rewrite(path, index, **fields):
+    """index 번째 기록의 필드를 바꿔 씁니다."""
+    with open(path, "r+b") as f:
+        f.seek(HEADER.size + index * RECORD.size)
+        values = dict(zip(('kind', 'game', 'a', 'b', 'c', 'd'), RECORD.unpack(f.read(RECORD.size))))
+        values.update(fields)
+        f.seek(HEADER.size + index * RECORD.size)
+        f.write(RECORD.pack(*values.values()))
+
+
+def nth(records, kind, game, n=3):
+    return int(((records['kind'] == kind) & (records['game'] == game)).nonzero()[0][n])
+
+
+@pytest.mark.parametrize("kind, game, change", [
+    (TURN, SNAKE, lambda r: {'b': r['b'] % 6 + 1}),             # 다른 주사위 눈
+    (TURN, SNAKE, lambda r: {'d': r['d'] + 1}),                 # 규칙과 다른 도착 칸
+    (JUMP, SNAKE, lambda r: {'c': r['c'] + 1}),                 # 바뀐 뱀/사다리
+    (END, SNAKE, lambda r: {'b': r['b'] + 1}),                  # 턴 수
+    (TURN, HANGMAN, lambda r: {'b': 1 - r['b']}),               # 맞힘 여부
+    (TURN, HANGMAN, lambda r: {'c': r['c'] + 1}),               # 남은 기회
+    (END, HANGMAN, lambda r: {'a': 1 - r['a']}),                # 승패
+    (TURN, UPDOWN, lambda r: {'c': 3 - r['c'] % 3}),            # 판정
+    (TURN, UPDOWN, lambda r: {'game': HANGMAN}),                # 다른 게임의 기록이 끼어듦
+])
+def test_detects_corrupted_record(log_path, kind, game, change):
+    records, _ = read_log(log_path)
+    index = nth(records, kind, game)
+    rewrite(log_path, index, **change(records[index]))
+    result = replay(read_log(log_path)[0])
+    assert result['mismatches'] >= 1
+    # 바뀐 뱀/사다리처럼 그 칸을 밟는 턴에서야 드러나는 것도 있으므로, 같은 게임 안에서 찾으면 됩니다.
+    starts = (records['kind'] == START).nonzero()[0]
+    game_start, game_end = starts[starts <= index][-1], starts[starts > index][0]
+    assert game_start <= result['first_mismatch'] < game_end
+
+
+def test_dice_match_roll_die():
+    seeds, counts = [0, 7, 12345], [1, 40, 300]
+    expected = []
+    for seed, count in zip(seeds, counts):
+        game = SnakeLadderGameLogic(2, 6, 6, seed=seed)
+        expected += [game.roll_die() for _ in range(count)]
+    assert dice_for_games(seeds, counts).tolist() == expected
@@ -0,0 +1,29 @@
+from hangman_solver import LIVES, HangmanSolver, gen1_index, normalize, play
+
+
+def test_known_names_are_solved():
+    solver = HangmanSolver(gen1_index())
+    for word in ("PIKACHU", "MEW", normalize("mr-mime")):
+        won, wrong, _ = play(solver, word)
+        assert won
+        assert wrong < LIVES
+
+
+def test_word_outside_index_falls_back_to_letter_frequency():
+    solver = HangmanSolver(gen1_index())
+    # 게임이 포켓몬을 못 받아왔을 때 쓰는 대체 단어입니다. 색인에 없어 후보가 곧 0개가 됩니다.
+    won, wrong, decisions = play(solver, "PYTHON")
+    assert solver.candidates == 0
+    assert decisions == len(solver.guessed)
+    assert wrong <= LIVES
+    assert won or wrong == LIVES
+
+
+def test_empty_candidates_choose_unguessed_common_letter():
+    index = gen1_index()
+    solver = HangmanSolver(index)
+    solver.reset(30)  # 이 길이의 이름은 없습니다.
+    first = solver.choose()
+    assert first == max(index.contains, key=lambda letter: (index.contains[letter].bit_count(), -ord(letter)))
+    solver.update(first, set())
+    assert solver.choose() != first
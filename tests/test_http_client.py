@@ -0,0 +1,97 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import http_client
+from http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    """/slow 는 응답 전에 멈추고, /busy 는 항상 503, /stale 은 항상 304 를 돌려줍니다.
+
+    /etag/<이름> 은 ETag 를 붙여 응답하고, If-None-Match 가 맞으면 본문 없이 304 를 돌려줍니다.
+    """
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(1)
+        etag = f'"{self.path}"'
+        if self.path == "/stale" or (self.path.startswith("/etag/") and self.headers.get("If-None-Match") == etag):
+            self.send_response(304)
+            self.end_headers()
+            return
+        status = 503 if self.path == "/busy" else 200
+        body = self.path.encode() if self.path.startswith("/etag/") else b"ok"
+        self.send_response(status)
+        if self.path.startswith("/etag/"):
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_deadline_cuts_slow_request(server):
+    client = HttpClient(timeout=(3.05, 10), retries=2, backoff=0.25)
+    start = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        client.get(server + "/slow", deadline=start + 0.3)
+    assert time.monotonic() - start < 1.0
+
+
+def test_deadline_stops_retrying(server):
+    client = HttpClient(retries=5, backoff=0.2)
+    start = time.monotonic()
+    with pytest.raises(requests.HTTPError):
+        client.get(server + "/busy", deadline=start + 0.5)
+    assert time.monotonic() - start < 0.8
+    assert client.stats()[server.split("//")[1]]['retries'] <= 2
+
+
+def test_passed_deadline_sends_nothing(server):
+    client = HttpClient()
+    with pytest.raises(requests.Timeout):
+        client.get(server + "/", deadline=time.monotonic() - 1)
+    assert client.get(server + "/") == b"ok"
+
+
+def test_not_modified_returns_remembered_body(server):
+    client = HttpClient()
+    url = server + "/etag/pikachu"
+    assert client.get(url) == b"/etag/pikachu"
+    assert client.get(url) == b"/etag/pikachu"
+    assert client.stats()[server.split("//")[1]]['not_modified'] == 1
+
+
+def test_not_modified_without_remembered_body(server):
+    client = HttpClient()
+    # 호출한 쪽이 붙인 조건부 헤더 때문에 받은 304 는 헤더를 빼고 다시 받습니다.
+    assert client.get(server + "/etag/mew", headers={"If-None-Match": '"/etag/mew"'}) == b"/etag/mew"
+    # 조건부 헤더 없이도 304 면 빈 본문 대신 오류를 냅니다.
+    with pytest.raises(requests.HTTPError):
+        client.get(server + "/stale")
+
+
+def test_not_modified_keeps_validator_in_lru(server, monkeypatch):
+    monkeypatch.setattr(http_client, "VALIDATOR_ENTRIES", 2)
+    client = HttpClient()
+    client.get(server + "/etag/a")
+    client.get(server + "/etag/b")
+    client.get(server + "/etag/a")  # 304: a 가 가장 최근에 쓴 항목이 됩니다.
+    client.get(server + "/etag/c")
+    assert list(client.validators) == [server + "/etag/a", server + "/etag/c"]
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from number_facts import FactProvider, FactStore, offline_fact
+
+
+class FakeClient:
+    """url 접두사별로 정해 둔 응답(문자열 또는 예외)을 돌려주는 가짜 HttpClient."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.urls = []
+
+    def get_text(self, url, headers=None):
+        self.urls.append(url)
+        reply = self.replies[url.rsplit("/", 1)[0]]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FactStore(str(tmp_path / "facts.sqlite3"))
+
+
+def make_provider(store, client, urls=("http://a.test",), **kwargs):
+    # pool_size=0 이면 백그라운드로 받지 않으므로 fetch 를 직접 불러 시험할 수 있습니다.
+    kwargs.setdefault('pool_size', 0)
+    return FactProvider(store=store, urls=list(urls), client=client, number_range=(7, 7), **kwargs)
+
+
+def test_offline_falls_back_to_computed_fact_and_backs_off(store):
+    client = FakeClient({"http://a.test": ConnectionError("down")})
+    provider = make_provider(store, client)
+    number, fact, source = provider.fetch(7)
+    assert (number, source) == (7, 'offline')
+    assert "7" in fact
+    assert provider.offline_until > time.monotonic()
+    # OFFLINE_RETRY 동안은 서버를 다시 부르지 않습니다.
+    assert provider.fetch(7)[2] == 'offline'
+    assert len(client.urls) == 1
+    provider.close()
+
+
+def test_offline_prefers_stored_facts(store):
+    store.add(7, "7 is the number of stored facts.")
+    provider = make_provider(store, FakeClient({"http://a.test": TimeoutError("slow")}))
+    assert provider.fetch(7) == (7, "7 is the number of stored facts.", 'store')
+    assert provider.get() == (7, "7 is the number of stored facts.", 'store')
+    assert provider.counts == {'api': 0, 'store': 1, 'offline': 0}
+    provider.close()
+
+
+def test_fallback_url_is_used_and_stored(store):
+    client = FakeClient({"http://a.test": ConnectionError("down"), "http://b.test": "7 is lucky.\n"})
+    provider = make_provider(store, client, urls=("http://a.test", "http://b.test"))
+    assert provider.fetch(7) == (7, "7 is lucky.", 'api')
+    assert client.urls == ["http://a.test/7", "http://b.test/7"]
+    assert store.random_fact(7) == "7 is lucky."
+    provider.close()
+
+
+def test_get_does_not_wait_for_a_slow_server(store):
+    release = threading.Event()
+
+    class BlockingClient:
+        def get_text(self, url, headers=None):
+            release.wait(5)
+            return "7 arrived late."
+
+    provider = make_provider(store, BlockingClient(), pool_size=2)
+    start = time.perf_counter()
+    number, fact, source = provider.get()
+    assert time.perf_counter() - start < 0.5
+    assert source == 'offline' and "7" in fact
+    release.set()
+    provider.close()
+
+
+@pytest.mark.parametrize("number", [1, 2, 6, 28, 121, 997, 1000])
+def test_offline_fact_mentions_the_number(number):
+    for _ in range(20):
+        assert str(number) in offline_fact(number)
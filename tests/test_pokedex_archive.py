@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+import pokedex_archive
+from pokedex_archive import HEADER, PokedexArchive, build_archive, default_archive, update_archive
+from pokemon_cache import PokemonCache
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(64))
+
+
+def meta(pokemon_id, name, url="https://example.invalid/sprite.png"):
+    return {'id': pokemon_id, 'name': name, 'sprites': {'front_default': url}}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = str(tmp_path / "pokedex.pkdx")
+    build_archive(path, [(meta(25, "pikachu"), PNG), (meta(1, "bulbasaur"), PNG[:20]), (meta(132, "ditto", None), None)])
+    archive = PokedexArchive(path)
+    yield archive
+    archive.close()
+
+
+def test_lookup_by_id_and_name(archive):
+    assert archive.count == 3
+    assert archive.get_meta(25)['name'] == "pikachu"
+    assert archive.get_meta("25")['id'] == 25
+    assert archive.get_meta("Bulbasaur")['id'] == 1
+    assert archive.get_sprite(25) == PNG
+    assert archive.get_sprite("bulbasaur") == PNG[:20]
+    assert archive.get_meta(2) is None
+    assert archive.get_sprite("mew") is None
+
+
+def test_meta_holds_only_stored_fields(archive):
+    # 묶음 파일에 없는 스프라이트 URL 을 지어내지 않습니다.
+    assert archive.get_meta(25)['sprites'] == {'front_default': None}
+    assert archive.get_sprite(132) is None
+
+
+def test_ids_are_sorted(archive):
+    assert archive.ids() == [1, 25, 132]
+
+
+def test_entries_round_trip(archive, tmp_path):
+    copy = str(tmp_path / "copy.pkdx")
+    build_archive(copy, archive.entries())
+    rebuilt = PokedexArchive(copy)
+    assert [m['id'] for m, _ in rebuilt.entries()] == [1, 25, 132]
+    assert rebuilt.get_sprite(25) == PNG
+    rebuilt.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(HEADER.pack(b"GLOG", 1, 0))
+    with pytest.raises(ValueError):
+        PokedexArchive(str(path))
+
+
+def test_cache_serves_archive_without_network(archive, tmp_path, monkeypatch):
+    cache = PokemonCache(str(tmp_path / "cache.sqlite3"), use_archive=False)
+    cache.archive = archive
+
+    def offline(url, deadline=None):
+        raise OSError(f"네트워크 없음: {url}")
+
+    monkeypatch.setattr(cache, "_download", offline)
+    data = cache.fetch_pokemon(25)
+    assert cache.fetch_sprite(data) == PNG
+    assert cache.fetch_sprite(cache.fetch_pokemon("ditto")) is None
+    assert cache.archive_hits == 3
+    assert cache.network_calls == 0
+    with pytest.raises(OSError):
+        cache.fetch_pokemon(7)
+
+
+class FlakyCache:
+    """fetch_pokemon 이 fail_at 번째 id 에서 중단(KeyboardInterrupt)되거나 failing id 에서 OSError 를 내는 가짜 PokemonCache."""
+
+    def __init__(self, fail_at=None, failing=()):
+        self.fail_at = fail_at
+        self.failing = set(failing)
+        self.fetched = []
+
+    def fetch_pokemon(self, pokemon_id):
+        if pokemon_id == self.fail_at:
+            raise KeyboardInterrupt
+        if pokemon_id in self.failing:
+            raise OSError(f"{pokemon_id} 실패")
+        self.fetched.append(pokemon_id)
+        return meta(pokemon_id, f"poke{pokemon_id}")
+
+    def fetch_sprite(self, data):
+        return PNG[:data['id'] % 40 + 8]
+
+
+def test_update_archive_checkpoints_and_resumes(tmp_path):
+    path = str(tmp_path / "pokedex.pkdx")
+    with pytest.raises(KeyboardInterrupt):
+        update_archive(path, range(1, 21), FlakyCache(fail_at=13), checkpoint=5)
+    partial = PokedexArchive(path)
+    assert partial.ids() == list(range(1, 11))
+    partial.close()
+
+    cache = FlakyCache(failing={17})
+    count, failures = update_archive(path, range(1, 21), cache, checkpoint=5)
+    assert cache.fetched == [11, 12, 13, 14, 15, 16, 18, 19, 20]
+    assert count == 19
+    assert [pokemon_id for pokemon_id, _ in failures] == [17]
+    rebuilt = PokedexArchive(path)
+    assert rebuilt.ids() == [i for i in range(1, 21) if i != 17]
+    assert rebuilt.get_sprite(20) == PNG[:28]
+    rebuilt.close()
+
+
+def test_missing_default_archive_is_silent(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("POKEDEX_ARCHIVE", str(tmp_path / "missing.pkdx"))
+    monkeypatch.setattr(pokedex_archive, "_default_archive", None)
+    assert default_archive() is None
+    assert not os.path.exists(tmp_path / "missing.pkdx")
+    assert capsys.readouterr() == ("", "")
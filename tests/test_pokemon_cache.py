@@ -0,0 +1,114 @@
+import itertools
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import pokemon_cache
+from pokemon_cache import PokemonCache
+
+SPRITE_BYTES = 1000
+
+
+class FakeClient:
+    """API_URL 과 front_default 주소에 답하는 가짜 HttpClient. 받은 주소를 모두 기록합니다."""
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, headers=None, deadline=None):
+        self.urls.append(url)
+        key = url.rstrip("/").rsplit("/", 1)[-1]
+        if key.endswith(".png"):
+            return bytes([int(key[:-4]) % 256]) * SPRITE_BYTES
+        pokemon_id = int(key) if key.isdigit() else int(key[4:])
+        return json.dumps({'id': pokemon_id, 'name': f"poke{pokemon_id}", 'moves': ["x"] * 50,
+                           'sprites': {'front_default': f"http://sprites.test/{pokemon_id}.png"}}).encode()
+
+
+class OfflineClient:
+    def get(self, url, headers=None, deadline=None):
+        raise ConnectionError(f"offline: {url}")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(pokemon_cache, 'default_client', lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # last_used 가 같은 값이 되지 않도록 호출마다 1초씩 흐르는 시계를 씁니다.
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(pokemon_cache, 'time', SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+def make_cache(tmp_path, **kwargs):
+    return PokemonCache(path=str(tmp_path / "pokemon.sqlite3"), use_archive=False, **kwargs)
+
+
+def ids_in(cache):
+    return sorted(row[0] for row in cache._connection().execute("SELECT id FROM pokemon"))
+
+
+def fetch(cache, key):
+    meta = cache.fetch_pokemon(key)
+    return meta, cache.fetch_sprite(meta)
+
+
+def test_counters_and_lookup_by_id_or_name(tmp_path, client):
+    cache = make_cache(tmp_path)
+    meta, sprite = fetch(cache, 25)
+    assert meta == {'id': 25, 'name': "poke25", 'sprites': {'front_default': "http://sprites.test/25.png"}}
+    assert sprite == bytes([25]) * SPRITE_BYTES
+    assert cache.stats() == {'archive_hits': 0, 'hits': 0, 'misses': 2, 'network_calls': 2}
+
+    assert fetch(cache, 25) == (meta, sprite)
+    assert cache.fetch_pokemon("POKE25") == meta
+    assert cache.stats() == {'archive_hits': 0, 'hits': 3, 'misses': 2, 'network_calls': 2}
+    assert len(client.urls) == 2
+
+
+def test_warm_cache_starts_without_network(tmp_path, client, monkeypatch):
+    warm = make_cache(tmp_path)
+    expected = [fetch(warm, pokemon_id) for pokemon_id in range(1, 6)]
+
+    monkeypatch.setattr(pokemon_cache, 'default_client', lambda: OfflineClient())
+    cold_process = make_cache(tmp_path)
+    assert [fetch(cold_process, pokemon_id) for pokemon_id in range(1, 6)] == expected
+    assert cold_process.stats() == {'archive_hits': 0, 'hits': 10, 'misses': 0, 'network_calls': 0}
+
+
+def test_offline_miss_raises_oserror(tmp_path, monkeypatch):
+    monkeypatch.setattr(pokemon_cache, 'default_client', lambda: OfflineClient())
+    cache = make_cache(tmp_path)
+    with pytest.raises(OSError):
+        cache.fetch_pokemon(1)
+    assert cache.stats()['network_calls'] == 1
+
+
+def test_evicts_least_recently_used_first(tmp_path, client, clock):
+    cache = make_cache(tmp_path)
+    for pokemon_id in (1, 2, 3):
+        fetch(cache, pokemon_id)
+    _, total = cache.usage()
+    # 세 항목이 꼭 맞는 크기로 줄이고, 1번을 다시 써서 2번이 가장 오래된 항목이 되게 합니다.
+    cache.max_bytes = total
+    cache.get_sprite(1)
+    fetch(cache, 4)
+    assert ids_in(cache) == [1, 3, 4]
+    cache.get_meta("poke3")
+    fetch(cache, 5)
+    assert ids_in(cache) == [3, 4, 5]
+
+
+def test_stays_within_max_bytes(tmp_path, client, clock):
+    cache = make_cache(tmp_path, max_bytes=5 * SPRITE_BYTES)
+    for pokemon_id in range(1, 30):
+        fetch(cache, pokemon_id)
+        count, total = cache.usage()
+        assert total <= cache.max_bytes
+    assert count == 4
+    assert ids_in(cache) == [26, 27, 28, 29]
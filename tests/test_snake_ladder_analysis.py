@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pytest
+
+from snake_ladder_analysis import analyze_board, analyze_boards, find_board
+from snake_ladder_logic import SnakeLadderGameLogic, advance, build_jump_table, generate_board
+
+
+def dense_transitions(table):
+    """advance 를 칸마다 불러 만든 (칸 수+1)² 전이 행렬. 인덱스 0 은 쓰지 않고 마지막 칸은 흡수 상태입니다."""
+    width = len(table)
+    matrix = np.zeros((width, width))
+    for cell in range(1, width - 1):
+        for roll in range(1, 7):
+            matrix[cell, advance(table, cell, roll)] += 1 / 6
+    matrix[width - 1, width - 1] = 1.0
+    return matrix
+
+
+def naive_solution(table, turns):
+    """밀집 행렬로 기대 턴 수, 턴별 도착 확률, 두 명이 번갈아 둘 때의 승률을 직접 구합니다."""
+    matrix = dense_transitions(table)
+    goal = len(table) - 1
+    q = matrix[1:goal, 1:goal]
+    r = matrix[1:goal, goal]
+    expected = np.linalg.solve(np.eye(goal - 1) - q, np.ones(goal - 1))[0]
+
+    state = np.zeros(goal - 1)
+    state[0] = 1.0
+    pmf = []
+    for _ in range(turns):
+        pmf.append(state @ r)
+        state = state @ q
+
+    # 두 플레이어의 위치를 함께 들고 한 명씩 움직입니다. (독립이라는 가정 없이)
+    joint = np.zeros((goal - 1, goal - 1))
+    joint[0, 0] = 1.0
+    wins = np.zeros(2)
+    for _ in range(turns):
+        wins[0] += (r @ joint).sum()
+        joint = q.T @ joint
+        wins[1] += (joint @ r).sum()
+        joint = joint @ q
+    return expected, np.array(pmf), wins
+
+
+def fixed_boards():
+    boards = [
+        build_jump_table({}, {}),
+        build_jump_table({99: 2, 97: 80, 54: 34}, {3: 31, 40: 59, 71: 90}),
+        build_jump_table({95: 94, 93: 92, 91: 90, 89: 88}, {}),
+    ]
+    for seed in (1, 7, 42):
+        boards.append(build_jump_table(*generate_board(8, 8, rng=random.Random(seed))))
+    return boards
+
+
+def test_analyze_boards_matches_dense_solver():
+    boards = fixed_boards()
+    result = analyze_boards(boards, num_players=2)
+    pmf = result['turn_distribution']
+    for i, table in enumerate(boards):
+        expected, naive_pmf, wins = naive_solution(table, pmf.shape[1])
+        assert result['expected_turns'][i] == pytest.approx(expected, rel=1e-9)
+        np.testing.assert_allclose(pmf[i], naive_pmf, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(result['win_probabilities'][i], wins, rtol=0, atol=1e-9)
+        assert result['unresolved'][i] < 1e-9
+
+
+def test_board_order_does_not_change_results():
+    # 보드마다 수렴하는 턴이 달라 중간에 배열에서 빠지는 순서가 바뀌어도 결과는 같아야 합니다.
+    boards = fixed_boards()
+    forward = analyze_boards(boards)
+    backward = analyze_boards(boards[::-1])
+    width = min(forward['turn_distribution'].shape[1], backward['turn_distribution'].shape[1])
+    np.testing.assert_allclose(forward['expected_turns'], backward['expected_turns'][::-1], rtol=1e-12)
+    np.testing.assert_allclose(forward['turn_distribution'][:, :width],
+                               backward['turn_distribution'][::-1, :width], rtol=0, atol=1e-15)
+
+
+def test_small_board_matches_dense_solver():
+    game = SnakeLadderGameLogic(board=({15: 4, 18: 9}, {2: 11}), rows=4, cols=5, seed=3)
+    result = analyze_board(game, num_players=2)
+    expected, naive_pmf, wins = naive_solution(list(game.jump_table()), len(result['turn_distribution']))
+    assert result['expected_turns'] == pytest.approx(expected, rel=1e-9)
+    np.testing.assert_allclose(result['turn_distribution'], naive_pmf, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result['win_probabilities'], wins, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("min_turns, max_turns, num_snakes, num_ladders", [(40, 45, 8, 8), (60, 70, 10, 2)])
+def test_find_board_reaches_target(min_turns, max_turns, num_snakes, num_ladders):
+    found = find_board(min_turns, max_turns, num_snakes, num_ladders, seed=1)
+    assert min_turns <= found['expected_turns'] <= max_turns
+    assert len(found['snakes']) == num_snakes and len(found['ladders']) == num_ladders
+    table = build_jump_table(found['snakes'], found['ladders'])
+    assert analyze_boards([table], distribution=False)['expected_turns'][0] == pytest.approx(found['expected_turns'])
+    assert found == {**find_board(min_turns, max_turns, num_snakes, num_ladders, seed=1),
+                     'elapsed': found['elapsed'], 'boards_per_second': found['boards_per_second']}
+
+
+def test_find_board_gives_up():
+    with pytest.raises(ValueError):
+        find_board(2, 3, 8, 8, seed=1, batch_size=64, max_boards=256)
+    with pytest.raises(ValueError):
+        find_board(50, 40, 8, 8)
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import ImageFont
+
+from snake_ladder_gui import index_jumps, render_viewport
+from snake_ladder_logic import SnakeLadderGameLogic
+
+
+@pytest.fixture
+def wide_game():
+    return SnakeLadderGameLogic(num_snakes=40, num_ladders=40, seed=4, rows=30, cols=40)
+
+
+def test_index_jumps_finds_every_jump_crossing_the_visible_rows(wide_game):
+    jump_rows, span = index_jumps(wide_game)
+    jumps = list(wide_game.snakes.items()) + list(wide_game.ladders.items())
+    assert sorted(jump for bucket in jump_rows for jump in bucket) == sorted(jumps)
+    for top in range(wide_game.rows):
+        for bottom in range(top, min(wide_game.rows, top + 6)):
+            # render_viewport 가 훑는 묶음만 봐도 보이는 행에 걸친 줄기를 모두 찾아야 합니다.
+            scanned = {jump for row in range(max(0, top - span), bottom + 1) for jump in jump_rows[row]}
+            for start, end in jumps:
+                first, last = sorted((wide_game.cell_rows[start], wide_game.cell_rows[end]))
+                if first <= bottom and last >= top:
+                    assert (start, end) in scanned
+
+
+def test_viewport_pixels_map_back_to_cells(wide_game):
+    cell_px, x0, y0, width, height = 30, 275, 410, 200, 150
+    jump_rows, span = index_jumps(wide_game)
+    image = render_viewport(wide_game, jump_rows, span, x0, y0, width, height, cell_px, ImageFont.load_default())
+    assert image.size == (width, height)
+    for x in range(0, width, 17):
+        for y in range(0, height, 13):
+            row, col = (y0 + y) // cell_px, (x0 + x) // cell_px
+            cell = wide_game.cell_at(row, col)
+            assert (wide_game.cell_rows[cell], wide_game.cell_cols[cell]) == (row, col)
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from snake_ladder_logic import MAX_JUMP, SnakeLadderGameLogic, cell_at, cell_layout, generate_board, max_jump_for
+
+
+def assert_valid_board(snakes, ladders, board_size, max_jump=MAX_JUMP):
+    for head, tail in snakes.items():
+        assert 11 <= head <= board_size - 1
+        assert 2 <= tail < head
+        assert head - tail < max_jump
+    for start, end in ladders.items():
+        assert 2 <= start <= board_size - 10
+        assert start < end <= board_size - 1
+        assert end - start < max_jump
+    cells = [*snakes, *snakes.values(), *ladders, *ladders.values()]
+    assert len(cells) == len(set(cells))
+    assert 1 not in cells and board_size not in cells
+
+
+@pytest.mark.parametrize("num_snakes, num_ladders", [(8, 8), (0, 12), (12, 0), (20, 20)])
+def test_boards_keep_constraints(num_snakes, num_ladders):
+    for seed in range(200):
+        snakes, ladders = generate_board(num_snakes, num_ladders, rng=random.Random(seed))
+        assert len(snakes) == num_snakes and len(ladders) == num_ladders
+        assert_valid_board(snakes, ladders, 100)
+
+
+def test_wide_board_uses_longer_jumps():
+    max_jump = max_jump_for(20)
+    for seed in range(50):
+        snakes, ladders = generate_board(10, 10, board_size=200, rng=random.Random(seed), max_jump=max_jump)
+        assert_valid_board(snakes, ladders, 200, max_jump)
+
+
+def test_same_rng_seed_gives_same_board():
+    assert generate_board(8, 8, rng=random.Random(4)) == generate_board(8, 8, rng=random.Random(4))
+
+
+@pytest.mark.parametrize("num_snakes, num_ladders, board_size", [
+    (30, 30, 100),  # 빈 칸이 모자람
+    (10, 0, 20),    # 뱀 머리를 둘 칸(11..19)이 모자람
+    (0, 6, 16),     # 사다리 시작점을 둘 칸(2..6)이 모자람
+    (-1, 0, 100),
+])
+def test_infeasible_counts_fail_fast(num_snakes, num_ladders, board_size):
+    with pytest.raises(ValueError):
+        generate_board(num_snakes, num_ladders, board_size)
+
+
+def test_crowded_boards_raise_instead_of_retrying():
+    # 개수로는 가능해 보여도 배치하다 막히는 요청은 무한히 다시 뽑지 않고 ValueError 로 끝나야 합니다.
+    failures = 0
+    for seed in range(20):
+        try:
+            snakes, ladders = generate_board(40, 9, rng=random.Random(seed))
+        except ValueError:
+            failures += 1
+        else:
+            assert_valid_board(snakes, ladders, 100)
+    assert failures
+
+
+@pytest.mark.parametrize("rows, cols", [(2, 2), (10, 10), (7, 13), (13, 7), (40, 50)])
+def test_cell_layout_round_trips_with_cell_at(rows, cols):
+    cell_rows, cell_cols = cell_layout(rows, cols)
+    size = rows * cols
+    assert len(cell_rows) == len(cell_cols) == size + 1
+    positions = [(cell_rows[cell], cell_cols[cell]) for cell in range(1, size + 1)]
+    assert len(set(positions)) == size
+    assert positions[0] == (rows - 1, 0)
+    for cell, (row, col) in enumerate(positions, start=1):
+        assert cell_at(row, col, rows, cols) == cell
+    # 지그재그 배치라 다음 칸은 항상 바로 옆 칸입니다.
+    for (row, col), (next_row, next_col) in zip(positions, positions[1:]):
+        assert abs(row - next_row) + abs(col - next_col) == 1
+
+
+def test_game_logic_uses_rows_and_cols():
+    game = SnakeLadderGameLogic(num_snakes=12, num_ladders=12, seed=8, rows=12, cols=20)
+    assert game.board_size == 240
+    assert len(game.jump_table()) == 241
+    assert game.max_jump == max_jump_for(20)
+    assert_valid_board(game.snakes, game.ladders, 240, game.max_jump)
+    assert game.cell_at(game.cell_rows[240], game.cell_cols[240]) == 240
+    with pytest.raises(ValueError):
+        SnakeLadderGameLogic(rows=1, cols=10)
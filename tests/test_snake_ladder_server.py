@@ -0,0 +1,157 @@
+import asyncio
+import random
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from snake_ladder_server import BOARD_SIZE, SnakeLadderServer
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    async def send(self, line):
+        self.writer.write(line.encode() + b"\n")
+        await self.writer.drain()
+        return (await self.reader.readline()).decode().strip()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def run_session(body, executor=None):
+    """executor (기본값: 루프의 스레드 실행기) 를 쓰는 서버를 빈 포트에 띄우고 body(server, connect) 를 실행합니다."""
+    async def main():
+        server = SnakeLadderServer(executor, rng=random.Random(0))
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def connect():
+            return Client(*await asyncio.open_connection("127.0.0.1", port))
+
+        async with listener:
+            await body(server, connect)
+
+    asyncio.run(main())
+
+
+async def settle(server, connections):
+    """서버가 끊긴 연결의 정리를 마칠 때까지 기다립니다."""
+    for _ in range(100):
+        if server.connections == connections:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_protocol_session():
+    async def body(server, connect):
+        client = await connect()
+        assert await client.send("NEW 2 8 8 7") == f"GAME 0 2 {BOARD_SIZE}"
+        board = (await client.send("BOARD 0")).split()
+        assert board[:2] == ["BOARD", "0"] and len(board) == 2 + 16
+        assert await client.send("STATE 0") == "STATE 0 1 0 1 1"
+        analysis = (await client.send("ANALYZE 0")).split()
+        assert analysis[0] == "ANALYSIS" and abs(float(analysis[4]) + float(analysis[5]) - 1) < 1e-6
+        for turn in range(1, 10_000):
+            moved = (await client.send("ROLL 0")).split()
+            assert moved[:3] == ["MOVED", "0", str((turn - 1) % 2 + 1)]
+            if moved[-1] == "WIN":
+                assert moved[5] == str(BOARD_SIZE)
+                break
+        assert await client.send("ROLL 0") == "ERR 이 연결에 없는 게임: 0"
+        assert (await client.send("NEW 1")).startswith("GAME 0 1")
+        assert await client.send("END 0") == "ENDED 0"
+        assert await client.send("ROLL") == "ERR ROLL <게임 번호>"
+        assert (await client.send("JUMP 0")).startswith("ERR ")
+        assert (await client.send("STATS")).startswith("STATS active=0 games=2 ")
+        assert await client.send("QUIT") == "BYE"
+        await client.close()
+
+    run_session(body)
+
+
+def test_other_connections_cannot_touch_or_free_a_game():
+    async def body(server, connect):
+        a, b, c = await connect(), await connect(), await connect()
+        assert (await a.send("NEW 2 8 8 1")).startswith("GAME 0 ")
+        for command in ("END 0", "ROLL 0", "STATE 0", "BOARD 0", "ANALYZE 0"):
+            assert await b.send(command) == "ERR 이 연결에 없는 게임: 0"
+        assert (await c.send("NEW 2 8 8 1")).startswith("GAME 1 ")
+        await a.close()
+        await settle(server, 2)
+        assert (await c.send("ROLL 1")).startswith("MOVED 1 1 ")
+        assert server.games.active == 1
+        await b.close()
+        await c.close()
+
+    run_session(body)
+
+
+def test_disconnect_does_not_free_a_reused_game_id():
+    async def body(server, connect):
+        a, c = await connect(), await connect()
+        assert (await a.send("NEW 2 8 8 1")).startswith("GAME 0 ")
+        assert await a.send("END 0") == "ENDED 0"
+        # 반납된 0번을 다른 연결이 다시 받습니다. a 가 끊겨도 그 게임은 남아야 합니다.
+        assert (await c.send("NEW 2 8 8 1")).startswith("GAME 0 ")
+        await a.close()
+        await settle(server, 1)
+        assert (await c.send("ROLL 0")).startswith("MOVED 0 1 ")
+        assert server.games.active == 1
+        await c.close()
+        await settle(server, 0)
+        assert server.games.active == 0
+
+    run_session(body)
+
+
+class FailingExecutor:
+    """fail 에 따라 작업을 실패시키는 실행기. None 이면 submit 한 스레드에서 바로 실행합니다."""
+
+    def __init__(self):
+        self.fail = None
+
+    def submit(self, func, *args):
+        future = Future()
+        if self.fail == "cancel":
+            future.cancel()
+        elif self.fail is not None:
+            future.set_exception(self.fail)
+        else:
+            future.set_result(func(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_executor_failures_keep_the_connection():
+    executor = FailingExecutor()
+
+    async def body(server, connect):
+        client = await connect()
+        executor.fail = RuntimeError("워커 오류")
+        assert await client.send("NEW 2 8 8 5") == "ERR 워커 오류"
+        executor.fail = BrokenProcessPool("워커 프로세스가 죽었습니다.")
+        assert await client.send("NEW 2") == "ERR 워커 프로세스가 죽었습니다."
+        executor.fail = MemoryError()
+        assert await client.send("NEW 2 8 8 5") == "ERR MemoryError"
+        executor.fail = "cancel"
+        assert await client.send("NEW 2 8 8 5") == "ERR 작업이 취소되었습니다."
+
+        # 실패한 결과는 기억하지 않으므로 같은 시드도 다시 만들 수 있습니다.
+        executor.fail = None
+        assert await client.send("NEW 2 8 8 5") == f"GAME 0 2 {BOARD_SIZE}"
+        executor.fail = RuntimeError("분석 실패")
+        assert await client.send("ANALYZE 0") == "ERR 분석 실패"
+        executor.fail = "cancel"
+        assert await client.send("ANALYZE 0") == "ERR 작업이 취소되었습니다."
+        executor.fail = None
+        assert (await client.send("ANALYZE 0")).startswith("ANALYSIS 0 ")
+        assert await client.send("STATE 0") == "STATE 0 1 0 1 1"
+        assert server.connections == 1 and server.games.active == 1
+        assert await client.send("QUIT") == "BYE"
+        await client.close()
+
+    run_session(body, executor)
@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pytest
+
+import snake_ladder_sim
+from snake_ladder_analysis import analyze_boards
+from snake_ladder_logic import SnakeLadderGameLogic
+from snake_ladder_sim import simulate
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # 적은 판 수로도 청크가 여러 개 생겨 워커 풀을 실제로 쓰게 합니다.
+    monkeypatch.setattr(snake_ladder_sim, 'CHUNK_GAMES', 2000)
+
+
+def test_worker_count_does_not_change_results(small_chunks):
+    game = SnakeLadderGameLogic(seed=5)
+    single = simulate(game, 9000, seed=11, workers=1)
+    pooled = simulate(game, 9000, seed=11, workers=4)
+    assert single['mean_turns'] == pooled['mean_turns']
+    assert single['mean_rounds'] == pooled['mean_rounds']
+    assert single['win_probabilities'] == pooled['win_probabilities']
+    np.testing.assert_array_equal(single['turn_counts'], pooled['turn_counts'])
+    np.testing.assert_array_equal(single['round_counts'], pooled['round_counts'])
+
+
+def test_different_seeds_differ(small_chunks):
+    game = SnakeLadderGameLogic(seed=5)
+    assert simulate(game, 4000, seed=1)['turn_counts'].tolist() != simulate(game, 4000, seed=2)['turn_counts'].tolist()
+
+
+@pytest.mark.parametrize("board_seed", [5, 23])
+def test_mean_turns_agree_with_exact_solution(board_seed):
+    game = SnakeLadderGameLogic(seed=board_seed)
+    games = 10000
+    result = simulate(game, games, num_players=2, seed=3)
+    exact = analyze_boards([game], num_players=2)
+    pmf = exact['turn_distribution'][0]
+    turns = np.arange(1, len(pmf) + 1)
+    mean = exact['expected_turns'][0]
+    sd = math.sqrt((pmf * turns ** 2).sum() - mean ** 2)
+    # 말 2만 개의 표본 평균이므로 표준오차의 5배 안에 들어와야 합니다.
+    assert result['unresolved_tokens'] == 0
+    assert abs(result['mean_turns'] - mean) < 5 * sd / math.sqrt(2 * games)
+    for simulated, p in zip(result['win_probabilities'], exact['win_probabilities'][0]):
+        assert abs(simulated - p) < 5 * math.sqrt(p * (1 - p) / games)
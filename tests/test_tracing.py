@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import tracing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def traced():
+    tracing.clear()
+    tracing.enable()
+    yield
+    tracing.disable()
+    tracing.clear()
+
+
+def run_python(code, **env):
+    environ = {key: value for key, value in os.environ.items() if key != "GAME_TRACE"}
+    environ.update(env)
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=environ,
+                          capture_output=True, text=True, check=True).stdout
+
+
+def spans():
+    return [event for event in tracing.chrome_trace()['traceEvents'] if event['ph'] == 'X']
+
+
+def test_disabled_by_default():
+    out = run_python("import tracing\n"
+                     "with tracing.span('x', a=1) as s: s.set(b=2)\n"
+                     "print(tracing.enabled(), tracing.span('y') is tracing._NULL_SPAN, "
+                     "len(tracing.chrome_trace()['traceEvents']))")
+    assert out.split() == ["False", "True", "1"]
+
+
+def test_game_trace_env_exports_at_exit(tmp_path):
+    path = tmp_path / "trace.json"
+    out = run_python("import tracing\n"
+                     "with tracing.span('sprite.decode', bytes=10): pass\n", GAME_TRACE=str(path))
+    assert str(path) in out
+    events = json.loads(path.read_text(encoding="utf-8"))['traceEvents']
+    assert [event['name'] for event in events if event['ph'] == 'X'] == ["sprite.decode"]
+
+
+def test_chrome_trace_shape(traced):
+    with tracing.span("image.resize", size=(40, 40)) as span:
+        span.set(filter="LANCZOS")
+    with pytest.raises(KeyError):
+        with tracing.span("pokeapi.fetch"):
+            raise KeyError("x")
+
+    def draw():
+        with tracing.span("canvas.draw"):
+            pass
+
+    worker = threading.Thread(target=draw, name="drawer")
+    worker.start()
+    worker.join()
+
+    trace = tracing.chrome_trace()
+    assert trace['displayTimeUnit'] == 'ms'
+    assert trace['otherData'] == {'dropped_spans': 0}
+    events = trace['traceEvents']
+    assert events[0] == {'ph': 'M', 'name': 'process_name', 'pid': os.getpid(), 'tid': 0,
+                         'args': {'name': 'pokemon games'}}
+    thread_names = {event['tid']: event['args']['name'] for event in events if event['name'] == 'thread_name'}
+    by_name = {event['name']: event for event in spans()}
+    assert by_name['image.resize']['cat'] == 'image'
+    assert by_name['image.resize']['args'] == {'size': (40, 40), 'filter': "LANCZOS"}
+    assert by_name['pokeapi.fetch']['args'] == {'error': 'KeyError'}
+    assert 'args' not in by_name['canvas.draw']
+    assert thread_names[by_name['canvas.draw']['tid']] == "drawer"
+    assert thread_names[by_name['image.resize']['tid']] == threading.current_thread().name
+    for event in by_name.values():
+        assert event['pid'] == os.getpid()
+        assert event['ts'] >= 0 and event['dur'] >= 0
+    assert by_name['image.resize']['ts'] < by_name['pokeapi.fetch']['ts']
+
+
+def test_export_writes_json_and_counts_spans(traced, tmp_path):
+    for i in range(3):
+        with tracing.span("board.render", cell_px=i):
+            pass
+    path = tmp_path / "trace.json"
+    assert tracing.export(str(path)) == 3
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert [event['args']['cell_px'] for event in data['traceEvents'] if event['ph'] == 'X'] == [0, 1, 2]
+
+
+def test_spans_over_the_limit_are_counted(traced, monkeypatch):
+    monkeypatch.setattr(tracing, 'MAX_EVENTS_PER_THREAD', 5)
+    for _ in range(8):
+        with tracing.span("canvas.draw"):
+            pass
+    assert len(spans()) == 5
+    assert tracing.chrome_trace()['otherData'] == {'dropped_spans': 3}
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from up_down_engine import CORRECT, DOWN, HIGH, LOW, STRATEGIES, UP, SessionManager, binary_strategy, judge, play
+
+
+def test_judge():
+    assert judge(500, 499) is UP
+    assert judge(500, 501) is DOWN
+    assert judge(500, 500) is CORRECT
+
+
+def test_binary_strategy_needs_at_most_ten_guesses():
+    assert max(play(binary_strategy, secret) for secret in range(LOW, HIGH + 1)) == 10
+
+
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_strategies_stay_in_range_and_finish(name):
+    strategy = STRATEGIES[name]
+    rng = random.Random(2)
+    for _ in range(300):
+        low = rng.randint(LOW, HIGH)
+        high = rng.randint(low, HIGH)
+        assert low <= strategy(low, high, rng) <= high
+    for secret in (LOW, 2, 500, 999, HIGH):
+        assert play(strategy, secret, random.Random(secret)) >= 1
+
+
+def test_session_lifecycle_reuses_ids():
+    manager = SessionManager(rng=random.Random(1))
+    first = manager.new_session(secret=40)
+    second = manager.new_session(secret=700)
+    assert (first, second) == (0, 1)
+    assert manager.guess(first, 20) == (UP, 1)
+    assert manager.guess(first, 50) == (DOWN, 2)
+    assert manager.guess(first, 40) == (CORRECT, 3)
+    assert manager.active == 1
+    with pytest.raises(KeyError):
+        manager.guess(first, 40)
+
+    # 끝난 세션의 번호와 칸을 다시 쓰고, 추측 횟수는 처음부터 셉니다.
+    reused = manager.new_session(secret=3)
+    assert reused == first
+    assert manager.guess(reused, 3) == (CORRECT, 1)
+    manager.end(second)
+    manager.end(second)
+    assert manager.active == 0
+    assert sorted(manager.free_ids) == [0, 1]
+    assert manager.memory_bytes() == 2 * (manager.secrets.itemsize + manager.counts.itemsize)
+
+
+def test_many_interleaved_sessions_match_play():
+    manager = SessionManager(rng=random.Random(5))
+    sessions = {manager.new_session(): [LOW, HIGH] for _ in range(2000)}
+    secrets = {session_id: manager.secrets[session_id] for session_id in sessions}
+    counts = {}
+    while sessions:
+        for session_id, bounds in list(sessions.items()):
+            result, count = manager.guess(session_id, binary_strategy(*bounds, None))
+            if result is CORRECT:
+                counts[session_id] = count
+                del sessions[session_id]
+            elif result is UP:
+                bounds[0] = (bounds[0] + bounds[1]) // 2 + 1
+            else:
+                bounds[1] = (bounds[0] + bounds[1]) // 2 - 1
+    assert manager.active == 0
+    assert counts == {session_id: play(binary_strategy, secret) for session_id, secret in secrets.items()}
+    assert len(manager.secrets) == 2000
@@ -0,0 +1,139 @@
+import atexit
+import os
+import threading
+import time
+
+# GAME_TRACE=trace.json 으로 실행하면 span 을 기록했다가 종료할 때 Chrome trace-event JSON 으로 씁니다.
+# 결과는 https://ui.perfetto.dev (또는 chrome://tracing) 에서 스레드별 타임라인으로 열 수 있습니다.
+# 꺼져 있으면 span() 은 전역 변수 하나를 확인한 뒤 아무것도 하지 않는 공용 객체를 돌려줍니다.
+MAX_EVENTS_PER_THREAD = 200_000  # 스레드마다 이보다 많은 span 은 버리고 개수만 셉니다.
+
+_enabled = False
+_path = None
+_origin_ns = time.perf_counter_ns()
+_local = threading.local()
+_threads = []  # (스레드 id, 이름, 이벤트 리스트)
+_threads_lock = threading.Lock()
+_dropped = 0
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _thread_events():
+    events = getattr(_local, 'events', None)
+    if events is None:
+        events = _local.events = []
+        with _threads_lock:
+            _threads.append((threading.get_native_id(), threading.current_thread().name, events))
+    return events
+
+
+class Span:
+    """with 블록 하나의 시작과 길이를 현재 스레드의 이벤트 목록에 남깁니다. set() 으로 인자를 덧붙일 수 있습니다."""
+
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        events = _thread_events()
+        if len(events) < MAX_EVENTS_PER_THREAD:
+            events.append((self.name, self.start, end - self.start, self.args))
+        else:
+            global _dropped
+            _dropped += 1
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+def span(name, **args):
+    """with tracing.span("image.resize", size=...): 형태로 씁니다. 꺼져 있으면 공용 빈 객체를 돌려줍니다."""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def enabled():
+    return _enabled
+
+
+def enable(path=None):
+    """기록을 켭니다. path 를 주면 종료할 때 그 파일로 내보냅니다."""
+    global _enabled, _path
+    _enabled = True
+    if path and _path is None:
+        atexit.register(_export_at_exit)
+    _path = path or _path
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def chrome_trace():
+    """지금까지 기록한 span 을 Chrome trace-event 형식의 딕셔너리로 반환합니다. (시간 단위는 µs)"""
+    pid = os.getpid()
+    with _threads_lock:
+        threads = [(tid, name, list(events)) for tid, name, events in _threads]
+    trace = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'tid': 0, 'args': {'name': 'pokemon games'}}]
+    for tid, thread_name, events in threads:
+        trace.append({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+        for name, start, duration, args in events:
+            event = {'ph': 'X', 'name': name, 'cat': name.split('.', 1)[0], 'pid': pid, 'tid': tid,
+                     'ts': (start - _origin_ns) / 1000, 'dur': duration / 1000}
+            if args:
+                event['args'] = args
+            trace.append(event)
+    return {'traceEvents': trace, 'displayTimeUnit': 'ms', 'otherData': {'dropped_spans': _dropped}}
+
+
+def export(path):
+    """기록한 span 을 path 에 JSON 으로 씁니다. 반환값은 span 개수."""
+    import json
+    trace = chrome_trace()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(trace, default=str))  # json.dump 은 순수 파이썬 인코더라 몇 배 느립니다.
+    return sum(1 for event in trace['traceEvents'] if event['ph'] == 'X')
+
+
+def _export_at_exit():
+    count = export(_path)
+    print(f"trace: {_path} (span {count:,}개, https://ui.perfetto.dev 에서 열기)")
+
+
+def clear():
+    global _dropped
+    with _threads_lock:
+        for _, _, events in _threads:
+            events.clear()
+        _dropped = 0
+
+
+if os.environ.get("GAME_TRACE"):
+    enable(os.environ["GAME_TRACE"])
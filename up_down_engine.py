@@ -0,0 +1,113 @@
+import random
+from array import array
+
+LOW, HIGH = 1, 1000
+UP, DOWN, CORRECT = "UP", "DOWN", "CORRECT"
+
+
+def judge(secret, guess):
+    """추측에 대한 판정(UP/DOWN/CORRECT)을 반환합니다. UP 은 정답이 더 크다는 뜻입니다."""
+    if guess < secret:
+        return UP
+    if guess > secret:
+        return DOWN
+    return CORRECT
+
+
+# --- 전략 -----------------------------------------------------------------
+# 전략은 strategy(low, high, rng) -> 추측 형태의 함수입니다. low..high 는 지금까지의 판정으로 좁혀진 범위입니다.
+
+def binary_strategy(low, high, rng):
+    return (low + high) // 2
+
+
+def random_strategy(low, high, rng):
+    return rng.randint(low, high)
+
+
+def human_strategy(low, high, rng):
+    """사람처럼 가운데 근처의 '딱 떨어지는' 수(500, 250, 120 ...)를 부르고, 가끔은 가운데에서 조금 빗나갑니다."""
+    middle = (low + high) / 2
+    if rng.random() < 0.25:
+        middle += rng.uniform(-0.2, 0.2) * (high - low)
+    for step in (100, 50, 10, 5):
+        guess = int(round(middle / step) * step)
+        if low <= guess <= high and (high - low) >= 4 * step:
+            return guess
+    return min(high, max(low, int(round(middle))))
+
+
+STRATEGIES = {
+    'binary': binary_strategy,
+    'random': random_strategy,
+    'human': human_strategy,
+}
+
+
+def play(strategy, secret, rng=random, low=LOW, high=HIGH):
+    """strategy 로 secret 을 맞힐 때까지 진행하고 추측 횟수를 반환합니다."""
+    guesses = 0
+    while True:
+        guess = strategy(low, high, rng)
+        guesses += 1
+        result = judge(secret, guess)
+        if result is CORRECT:
+            return guesses
+        if result is UP:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+class SessionManager:
+    """많은 동시 게임 세션을 배열 몇 개로 관리합니다.
+
+    세션 하나는 정답(2바이트)과 추측 횟수(4바이트)뿐이므로 객체 대신 array 의 한 칸을 쓰고,
+    끝난 세션의 번호는 재사용합니다. 수만 개의 세션도 수백 KB 안에 들어갑니다.
+    """
+
+    FREE = 0  # 정답 칸의 0은 빈 세션을 뜻합니다. (정답은 LOW 이상)
+
+    def __init__(self, low=LOW, high=HIGH, rng=None):
+        self.low = low
+        self.high = high
+        self.rng = rng or random.Random()
+        self.secrets = array('H')
+        self.counts = array('I')
+        self.free_ids = []
+        self.active = 0
+
+    def new_session(self, secret=None):
+        """새 세션을 만들고 세션 번호를 반환합니다."""
+        if secret is None:
+            secret = self.rng.randint(self.low, self.high)
+        self.active += 1
+        if self.free_ids:
+            session_id = self.free_ids.pop()
+            self.secrets[session_id] = secret
+            self.counts[session_id] = 0
+            return session_id
+        self.secrets.append(secret)
+        self.counts.append(0)
+        return len(self.secrets) - 1
+
+    def guess(self, session_id, guess):
+        """(판정, 지금까지의 추측 횟수) 를 반환합니다. 맞히면 세션이 끝납니다."""
+        secret = self.secrets[session_id]
+        if secret == self.FREE:
+            raise KeyError(f"없는 세션: {session_id}")
+        self.counts[session_id] += 1
+        count = self.counts[session_id]
+        result = judge(secret, guess)
+        if result is CORRECT:
+            self.end(session_id)
+        return result, count
+
+    def end(self, session_id):
+        if self.secrets[session_id] != self.FREE:
+            self.secrets[session_id] = self.FREE
+            self.free_ids.append(session_id)
+            self.active -= 1
+
+    def memory_bytes(self):
+        return (self.secrets.itemsize + self.counts.itemsize) * len(self.secrets)
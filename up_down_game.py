@@ -1,12 +1,18 @@
 
+import argparse
+import os
 import tkinter as tk
 from tkinter import messagebox
-import requests
-import random
+
+from game_log import END, MAX_FIELD, START, TURN, UPDOWN, UPDOWN_CODES, open_log
+from http_client import default_client
+from number_facts import FactProvider
+from up_down_engine import DOWN, HIGH, LOW, UP, judge
 
 class UpDownGame:
-    def __init__(self, window):
+    def __init__(self, window, log=None):
         self.window = window
+        self.log = log  # Optional game_log.EventLog: secret, every guess and its verdict, and the final count.
         self.window.title("Up-Down Number Guessing Game")
         self.window.geometry("500x300")
 
@@ -28,33 +34,27 @@ class UpDownGame:
         self.attempts_label = tk.Label(self.window, text="Attempts: 0", font=("Arial", 10))
         self.attempts_label.pack(pady=5)
 
+        # Facts are fetched ahead of time in the background, so Restart never waits on the network.
+        self.facts = FactProvider(number_range=(LOW, HIGH))
         self.start_game()
 
     def start_game(self):
         """Initializes or restarts the game."""
-        self.secret_number = random.randint(1, 1000)
+        self.secret_number, fact, source = self.facts.get()
         self.guess_count = 0
+        if self.log:
+            self.log.record(START, UPDOWN, 0, self.secret_number, LOW, HIGH)
         self.attempts_label.config(text="Attempts: 0")
         self.entry.delete(0, tk.END)
         self.guess_button.config(state="normal")
-        
-        try:
-            # Fetch a fact about the number from the Numbers API
-            url = f"http://numbersapi.com/{self.secret_number}"
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-            response = requests.get(url, headers=headers, timeout=5)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            fact = response.text
-            
-            # Replace the number in the fact with a question mark
-            modified_fact = fact.replace(str(self.secret_number), "?")
-            self.fact_label.config(text=modified_fact)
-            self.feedback_label.config(text="I've chosen a number between 1 and 1000. Guess it!")
-
-        except requests.exceptions.RequestException as e:
-            self.fact_label.config(text="Could not fetch a fun fact. Let's just play!")
-            self.feedback_label.config(text=f"Error: {e}")
-            messagebox.showerror("API Error", "Failed to connect to the Numbers API. Please check your internet connection.")
+
+        # Replace the number in the fact with a question mark
+        modified_fact = fact.replace(str(self.secret_number), "?")
+        self.fact_label.config(text=modified_fact)
+        text = f"I've chosen a number between {LOW} and {HIGH}. Guess it!"
+        if source == 'offline':
+            text += " (offline fact)"
+        self.feedback_label.config(text=text, fg="black")
 
 
     def check_guess(self):
@@ -64,13 +64,19 @@ class UpDownGame:
             self.guess_count += 1
             self.attempts_label.config(text=f"Attempts: {self.guess_count}")
 
-            if guess < self.secret_number:
+            result = judge(self.secret_number, guess)
+            if self.log:
+                # Clamping keeps the verdict intact: the secret always lies within [LOW, HIGH].
+                self.log.record(TURN, UPDOWN, 0, min(max(guess, 0), MAX_FIELD), UPDOWN_CODES[result], self.guess_count)
+            if result == UP:
                 self.feedback_label.config(text="UP!", fg="blue")
-            elif guess > self.secret_number:
+            elif result == DOWN:
                 self.feedback_label.config(text="DOWN!", fg="red")
             else:
                 self.feedback_label.config(text="CORRECT!", fg="green")
                 self.guess_button.config(state="disabled")
+                if self.log:
+                    self.log.record(END, UPDOWN, 0, self.guess_count)
                 messagebox.showinfo("Congratulations!", f"You guessed the number {self.secret_number} in {self.guess_count} attempts!")
 
         except ValueError:
@@ -79,7 +85,24 @@ class UpDownGame:
             self.entry.delete(0, tk.END)
 
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Up-Down number guessing game")
+    parser.add_argument("--log", default=None, metavar="PATH",
+                        help="binary event log to append to (default: $GAME_LOG, unset = no logging; replay with game_log.py)")
+    parser.add_argument("--stats", action="store_true", default=bool(os.environ.get("GAME_STATS")),
+                        help="print per-host HTTP stats on exit (same as GAME_STATS=1)")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    game = UpDownGame(root)
+    game = UpDownGame(root, log=open_log(args.log))
     root.mainloop()
+    game.facts.close()
+    if game.log:
+        game.log.close()
+        print(f"Game log: {game.log.path} ({game.log.count:,} events)")
+    if args.stats:
+        print(f"HTTP: {default_client().stats()}")
+
+
+if __name__ == "__main__":
+    main()